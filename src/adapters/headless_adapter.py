@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, List, Optional
 from src.core.interfaces import IClock, IInputHandler, IRenderer
 from src.core.engine import IScene
 from src.core.events import Event
@@ -24,11 +24,30 @@ class HeadlessInput(IInputHandler):
 
 
 class HeadlessRenderer(IRenderer):
-    def __init__(self) -> None:
-        pass
+    """
+    Renderer sem tela. Com record=True, coleta a DrawList de cenas com draw()
+    e guarda a contagem de comandos e o checksum do último quadro.
+    """
+
+    def __init__(self, record: bool = False) -> None:
+        self.record = record
+        self.frames = 0
+        self.last_command_count = 0
+        self.last_checksum = 0
+        self._draw_list: Optional[Any] = None
+        if record:
+            from src.rendering.draw_list import DrawList
+
+            self._draw_list = DrawList()
 
     def render(self, scene: IScene) -> None:
-        pass
+        self.frames += 1
+        if self._draw_list is None or not hasattr(scene, "draw"):
+            return
+        self._draw_list.clear()
+        scene.draw(self._draw_list)
+        self.last_command_count = len(self._draw_list)
+        self.last_checksum = self._draw_list.checksum()
 
     def quit(self) -> None:
         pass
@@ -1,8 +1,10 @@
 import pygame
-from typing import List
+from typing import List, Optional
 from src.core.interfaces import IClock, IInputHandler, IRenderer
 from src.core.events import QuitEvent, MouseButtonDown, KeyDown, Event
 from src.core.engine import IScene
+from src.rendering.draw_list import DrawList
+from src.rendering.dirty_rects import DirtyRectTracker
 
 
 class PygameClock(IClock):
@@ -44,9 +46,26 @@ class PygameRenderer(IRenderer):
         pygame.init()
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption(title)
+        self.draw_list = DrawList()
+        self.dirty_rects = DirtyRectTracker()
+        self._last_scene: Optional[IScene] = None
 
     def render(self, scene: IScene) -> None:
-        if hasattr(scene, "render"):
+        if scene is not self._last_scene:
+            self.dirty_rects.reset()
+            self._last_scene = scene
+
+        # Cenas com draw() emitem uma lista de comandos submetida em lote;
+        # as demais desenham direto na tela
+        if hasattr(scene, "draw"):
+            self.draw_list.clear()
+            scene.draw(self.draw_list)
+            rects = self.dirty_rects.submit(self.draw_list, self.screen)
+            if rects is not None:
+                # Fundo inalterado: só as regiões que mudaram vão para a tela
+                pygame.display.update(rects)
+                return
+        elif hasattr(scene, "render"):
             scene.render(self.screen)
         pygame.display.flip()
 
@@ -0,0 +1,69 @@
+"""
+Pontuação em lote dos alvos da IA.
+
+Num ciclo de decisão o estado que a pontuação lê (donos e contagens) não
+muda entre uma colônia e outra: as transferências criadas só partem no
+update da cena. Assim dá para escolher o alvo de todas as origens de uma vez.
+
+Na prioridade "weakest" o score de um candidato não depende da origem, então
+uma única ordenação dos candidatos serve para todas as origens do ciclo, e
+cada origem fica com o primeiro candidato dentro do seu raio. As regras são
+as de EnemyController._score_target, com o mesmo desempate (maior score; em
+empate, o menor índice).
+
+"closest" e "player_focus" continuam por origem: a busca no índice espacial
+visita só as células vizinhas, mais barato que varrer a linha inteira da
+tabela de distâncias. "random" consome o gerador intercalado com a produção
+de cada colônia e seguiria outra ordem se fosse avaliado em lote.
+"""
+
+from typing import Dict, Iterable, Optional, Sequence
+
+from src.core.nest_geometry import NestGeometry
+
+# A IA ataca aliados e neutros (por enquanto não reforça os próprios ninhos)
+TARGET_OWNERS = ("ally", "empty")
+
+BATCH_PRIORITIES = ("weakest",)
+
+
+def best_targets(
+    priority: str,
+    origins: Iterable[int],
+    geometry: NestGeometry,
+    owners: Sequence[str],
+    counts: Sequence[int],
+    radius: Optional[float] = None,
+) -> Dict[int, Optional[int]]:
+    """
+    Melhor alvo de cada origem (None se não houver candidato no raio).
+
+    Args:
+        priority: Uma de BATCH_PRIORITIES.
+        origins: Ninhos que vão decidir.
+        geometry: Tabela de distâncias da fase.
+        owners: Dono de cada ninho.
+        counts: Formigas em cada ninho.
+        radius: Raio de aggro (None = sem limite).
+    """
+    if priority not in BATCH_PRIORITIES:
+        raise ValueError(f"Prioridade sem avaliação em lote: {priority!r}.")
+
+    n = geometry.size
+    distances = geometry.distances
+    candidates = [i for i, owner in enumerate(owners) if owner in TARGET_OWNERS]
+    # Sort estável: empates de score ficam em ordem de índice
+    ranked = sorted(candidates, key=lambda i: 1000 / (counts[i] + 1), reverse=True)
+
+    result: Dict[int, Optional[int]] = {}
+    for origin in origins:
+        row = origin * n
+        result[origin] = next(
+            (
+                i
+                for i in ranked
+                if i != origin and (radius is None or distances[row + i] <= radius)
+            ),
+            None,
+        )
+    return result
@@ -3,12 +3,17 @@ Módulo responsável pela Inteligência Artificial das colônias inimigas.
 Define perfis de comportamento e a lógica de tomada de decisão para ataques e produção.
 """
 
+import heapq
 import random
 import logging
-import math
+import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, TYPE_CHECKING, Literal
+from typing import Deque, Dict, List, Optional, Tuple, TYPE_CHECKING, Literal
 
+from src.ai.batch_scoring import BATCH_PRIORITIES, TARGET_OWNERS, best_targets
+from src.ai.target_index import top_k
+from src.core.ownership_index import OwnershipChange
 from src.entities.ant import AntType
 from src.entities.ant_types import ALL_ANT_TYPES
 
@@ -19,6 +24,9 @@ if TYPE_CHECKING:
 
 TargetPriority = Literal["closest", "weakest", "random", "player_focus"]
 
+# Espalha as fases iniciais dos timers por colônia (sequência de baixa discrepância)
+_GOLDEN_RATIO = 0.6180339887498949
+
 
 @dataclass
 class AIProfile:
@@ -44,15 +52,54 @@ class AIProfile:
     aggro_radius: Optional[float] = None
 
 
+@dataclass
+class AIMetrics:
+    """Custo por quadro e latência das decisões da IA, acumulados na fase."""
+
+    frames: int = 0
+    decisions: int = 0
+    last_frame_decisions: int = 0
+    last_frame_ms: float = 0.0
+    max_frame_ms: float = 0.0
+    # Atraso (s) entre o vencimento do timer de uma colônia e a sua decisão
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    # Colônias vencidas aguardando vez ao fim do último quadro
+    backlog: int = 0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.decisions if self.decisions else 0.0
+
+    def record_decision(self, latency: float) -> None:
+        self.decisions += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def record_frame(self, decisions: int, elapsed_ms: float, backlog: int) -> None:
+        self.frames += 1
+        self.last_frame_decisions = decisions
+        self.last_frame_ms = elapsed_ms
+        self.max_frame_ms = max(self.max_frame_ms, elapsed_ms)
+        self.backlog = backlog
+
+
 class EnemyController:
     """
     Controlador que gerencia as decisões de todas as colônias inimigas na cena.
+
+    Por padrão, todas as colônias decidem juntas quando o timer global vence.
+    Com Settings.AI_TIME_SLICING, cada colônia tem o próprio timer (com fases
+    escalonadas) e as colônias vencidas entram em uma fila atendida em
+    round-robin, no máximo AI_DECISIONS_PER_FRAME por quadro (e dentro de
+    AI_FRAME_BUDGET_MS, se definido).
     """
 
     def __init__(self, scene: "LevelScene", profile: AIProfile) -> None:
         self.scene = scene
         self.profile = profile
         self.logger = logging.getLogger(__name__)
+        self.metrics = AIMetrics()
 
         # Timer interno para controle de ações
         self.time_since_last_decision: float = 0.0
@@ -60,11 +107,41 @@ class EnemyController:
         # Variação aleatória para que a IA não seja perfeitamente previsível
         self._current_interval = self._get_randomized_interval()
 
+        settings = getattr(scene, "settings", None)
+        self.time_sliced: bool = bool(getattr(settings, "AI_TIME_SLICING", False))
+        self.decisions_per_frame: int = max(
+            1, int(getattr(settings, "AI_DECISIONS_PER_FRAME", 8))
+        )
+        self.frame_budget_ms: Optional[float] = getattr(settings, "AI_FRAME_BUDGET_MS", None)
+        # Modo fatiado: relógio da IA, heap de vencimentos, vencimento atual de
+        # cada colônia (entradas do heap com outro valor estão obsoletas) e a
+        # fila de colônias vencidas aguardando vez
+        self._clock: float = 0.0
+        self._due: List[Tuple[float, int]] = []
+        self._scheduled: Dict[int, float] = {}
+        self._ready: Deque[Tuple[float, int]] = deque()
+        if self.time_sliced:
+            for i in sorted(scene.ownership.nests("enemy")):
+                self._schedule(i, self._staggered_delay(i))
+
+        # Alvo escolhido por origem e a versão do estado em que foi calculado;
+        # versões avançam pelo feed de posse (capturas e contagens de candidatos)
+        self._rankings: Dict[int, Tuple[Tuple[int, int], Optional[int]]] = {}
+        self._owner_version: int = 0
+        self._candidate_units_version: int = 0
+        self.cache_hits: int = 0
+        scene.ownership.subscribe(self._on_ownership_change)
+
     def _get_randomized_interval(self) -> float:
         """Adiciona uma variação de +/- 20% ao intervalo base."""
         base = self.profile.attack_interval
         return base * random.uniform(0.8, 1.2)
 
+    def _staggered_delay(self, index: int) -> float:
+        """Primeiro vencimento da colônia, espalhado em [0.5, 1.5) intervalos."""
+        phase = (index * _GOLDEN_RATIO) % 1.0
+        return self.profile.attack_interval * (0.5 + phase)
+
     def update(self, dt: float) -> None:
         """
         Chamado a cada frame pela LevelScene.
@@ -72,28 +149,127 @@ class EnemyController:
         Args:
             dt: Delta time em segundos.
         """
+        start = time.perf_counter()
+        if self.time_sliced:
+            decisions = self._run_time_slice(dt, start)
+        else:
+            decisions = self._run_global_timer(dt)
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        self.metrics.record_frame(decisions, elapsed_ms, len(self._ready))
+
+    def _run_global_timer(self, dt: float) -> int:
         self.time_since_last_decision += dt
 
-        if self.time_since_last_decision >= self._current_interval:
-            self._execute_logic_cycle()
-            self.time_since_last_decision = 0.0
-            self._current_interval = self._get_randomized_interval()
-
-    def _execute_logic_cycle(self) -> None:
-        """Executa um ciclo de decisão para cada colônia inimiga."""
-
-        # Itera por todos os ninhos para encontrar os que pertencem ao inimigo
-        for i, owner in enumerate(self.scene.owners):
-            if owner != "enemy":
+        if self.time_since_last_decision < self._current_interval:
+            return 0
+        latency = self.time_since_last_decision - self._current_interval
+        decisions = self._execute_logic_cycle()
+        for _ in range(decisions):
+            self.metrics.record_decision(latency)
+        self.time_since_last_decision = 0.0
+        self._current_interval = self._get_randomized_interval()
+        return decisions
+
+    def _run_time_slice(self, dt: float, start: float) -> int:
+        """Atende as colônias vencidas em ordem de vencimento, dentro do orçamento."""
+        self._clock += dt
+        now = self._clock
+        due, scheduled, ready = self._due, self._scheduled, self._ready
+        while due and due[0][0] <= now:
+            entry = heapq.heappop(due)
+            if scheduled.get(entry[1]) == entry[0]:
+                ready.append(entry)
+
+        deadline = (
+            start + self.frame_budget_ms / 1000.0 if self.frame_budget_ms is not None else None
+        )
+        decisions = 0
+        while ready and decisions < self.decisions_per_frame:
+            # Ao menos uma decisão por quadro, para a fila sempre andar
+            if deadline is not None and decisions and time.perf_counter() >= deadline:
+                break
+            due_time, i = ready.popleft()
+            if scheduled.get(i) != due_time:
                 continue
-
-            colony = self.scene.colonies[i]
-
-            # 1. Decisão de Produção (Opcional: troca o tipo de formiga se houver opções)
-            self._manage_production(colony)
-
-            # 2. Decisão de Ataque
-            self._attempt_attack(origin_index=i, colony=colony)
+            self._decide(i)
+            self.metrics.record_decision(now - due_time)
+            self._schedule(i, self._get_randomized_interval())
+            decisions += 1
+        return decisions
+
+    def _schedule(self, index: int, delay: float) -> None:
+        due_time = self._clock + delay
+        self._scheduled[index] = due_time
+        heapq.heappush(self._due, (due_time, index))
+
+    def _on_ownership_change(self, change: OwnershipChange) -> None:
+        """
+        Invalida os alvos em cache e, no modo fatiado, dá timer às colônias
+        capturadas pelo inimigo e tira da fila as perdidas.
+        """
+        if change.kind != "owner":
+            # Só contagens de candidatos (não inimigos) afetam a pontuação
+            if change.new_owner != "enemy":
+                self._candidate_units_version += 1
+            return
+        self._owner_version += 1
+        if not self.time_sliced:
+            return
+        if change.new_owner == "enemy":
+            self._schedule(change.index, self._get_randomized_interval())
+        elif change.old_owner == "enemy":
+            self._scheduled.pop(change.index, None)
+
+    def _execute_logic_cycle(self) -> int:
+        """Executa um ciclo de decisão para cada colônia inimiga; retorna quantas decidiram."""
+
+        # Ninhos inimigos vêm do índice de posse (ordenados: ordem determinística)
+        enemy_nests = sorted(self.scene.ownership.nests("enemy"))
+        self._prefetch_targets(enemy_nests)
+        for i in enemy_nests:
+            self._decide(i)
+        return len(enemy_nests)
+
+    def _prefetch_targets(self, origins: List[int]) -> None:
+        """
+        Preenche o cache de alvos das origens que vão atacar neste ciclo com uma
+        única avaliação em lote; _select_best_target as encontra em cache.
+        """
+        priority = self.profile.target_priority
+        if priority not in BATCH_PRIORITIES:
+            return
+        state = self._ranking_state()
+        scene = self.scene
+        colonies = scene.colonies
+        pending = scene.pending_transfers
+        stale = [
+            i
+            for i in origins
+            if colonies[i].ant_count >= self.profile.min_ants_to_attack
+            and not pending.has_origin(i)
+            and self._rankings.get(i, (None,))[0] != state
+        ]
+        if not stale:
+            return
+        chosen = best_targets(
+            priority,
+            stale,
+            scene.geometry,
+            scene.owners,
+            [colony.ant_count for colony in colonies],
+            self.profile.aggro_radius or None,
+        )
+        for i, target in chosen.items():
+            self._rankings[i] = (state, target)
+
+    def _decide(self, origin_index: int) -> None:
+        colony = self.scene.colonies[origin_index]
+
+        # 1. Decisão de Produção (Opcional: troca o tipo de formiga se houver opções)
+        self._manage_production(colony)
+
+        # 2. Decisão de Ataque
+        self._attempt_attack(origin_index=origin_index, colony=colony)
 
     def _manage_production(self, colony: "Colony") -> None:
         """
@@ -113,14 +289,14 @@ class EnemyController:
     def _attempt_attack(self, origin_index: int, colony: "Colony") -> None:
         """Avalia e executa um ataque a partir de um ninho específico."""
 
-        ant_count = len(colony.ants)
+        ant_count = colony.ant_count
 
         # Verifica se tem recursos mínimos
         if ant_count < self.profile.min_ants_to_attack:
             return
 
         # Verifica se já não está enviando um ataque (evita spam excessivo)
-        if any(t["origin"] == origin_index for t in self.scene.pending_transfers):
+        if self.scene.pending_transfers.has_origin(origin_index):
             return
 
         target_index = self._select_best_target(origin_index)
@@ -143,59 +319,84 @@ class EnemyController:
                 )
 
     def _select_best_target(self, origin_index: int) -> Optional[int]:
-        """Seleciona o melhor alvo baseado no perfil da IA."""
-        possible_targets: List[Tuple[int, float]] = []
-        origin_pos = self.scene.nest_positions[origin_index]
-
-        for i, pos_tuple in enumerate(self.scene.nest_positions):
-            if i == origin_index:
-                continue
-
-            # Ignora atacar o próprio time (por enquanto, IA não faz reforço)
-            if self.scene.owners[i] == "enemy":
-                continue
-
-            ox, oy = float(origin_pos[0]), float(origin_pos[1])
-            tx, ty = float(pos_tuple[0]), float(pos_tuple[1])
-            dx, dy = tx - ox, ty - oy
-            dist = math.hypot(dx, dy)
-
-            # Filtra por raio de agressividade
-            if self.profile.aggro_radius and dist > self.profile.aggro_radius:
-                continue
-
-            score = 0.0
-
-            # Lógica de Pontuação baseada no Perfil
-            if self.profile.target_priority == "closest":
-                # Quanto menor a distância, maior o score (inverso)
-                score = 10000 / (dist + 1)
-
-            elif self.profile.target_priority == "weakest":
-                target_ants = len(self.scene.colonies[i].ants)
-                # Prioriza ninhos vazios ou com poucas formigas
-                score = 1000 / (target_ants + 1)
-
-            elif self.profile.target_priority == "player_focus":
-                # Prioriza atacar o jogador ('ally'), depois neutros
-                if self.scene.owners[i] == "ally":
-                    score = 2000
-                else:
-                    score = 100
-                # Desempate pela distância
-                score += 1000 / (dist + 1)
-
-            elif self.profile.target_priority == "random":
-                score = random.random() * 100
-
-            possible_targets.append((i, score))
-
+        """
+        Seleciona o melhor alvo baseado no perfil da IA. A escolha fica em cache
+        por origem enquanto o estado de que depende não muda: donos dos ninhos
+        (todas as prioridades) e, para "weakest", as contagens dos candidatos.
+        "random" é sempre refeita (consome o gerador a cada decisão).
+        """
+        priority = self.profile.target_priority
+        if priority == "random":
+            return self._rank_targets(origin_index)
+
+        state = self._ranking_state()
+        cached = self._rankings.get(origin_index)
+        if cached is not None and cached[0] == state:
+            self.cache_hits += 1
+            return cached[1]
+        target = self._rank_targets(origin_index)
+        self._rankings[origin_index] = (state, target)
+        return target
+
+    def _ranking_state(self) -> Tuple[int, int]:
+        """Versão do estado de que a escolha de alvo depende, para o perfil atual."""
+        weakest = self.profile.target_priority == "weakest"
+        return (self._owner_version, self._candidate_units_version if weakest else 0)
+
+    def _rank_targets(self, origin_index: int) -> Optional[int]:
+        """Pontua os candidatos e devolve o de maior score."""
+        index = self.scene.target_index
+        radius = self.profile.aggro_radius or None
+        priority = self.profile.target_priority
+
+        # Só os candidatos que podem vencer: o score de "closest" cai com a
+        # distância e em "player_focus" qualquer aliado supera qualquer neutro
+        if priority == "closest":
+            candidates = index.nearest(origin_index, TARGET_OWNERS, radius)
+        elif priority == "player_focus":
+            candidates = index.nearest(origin_index, ("ally",), radius) or index.nearest(
+                origin_index, ("empty",), radius
+            )
+        else:
+            candidates = index.within_radius(origin_index, radius, TARGET_OWNERS)
+
+        possible_targets: List[Tuple[int, float]] = [
+            (i, self._score_target(origin_index, i)) for i in candidates
+        ]
         if not possible_targets:
             return None
 
-        # Retorna o índice com maior score
-        possible_targets.sort(key=lambda x: x[1], reverse=True)
-        return possible_targets[0][0]
+        # Maior score; empates ficam com o menor índice (heap estável)
+        return top_k(possible_targets, 1, key=lambda x: x[1])[0][0]
+
+    def _score_target(self, origin_index: int, i: int) -> float:
+        """Pontuação do ninho i como alvo a partir da origem, conforme o perfil."""
+        dist = self.scene.geometry.distance(origin_index, i)
+        score = 0.0
+
+        # Lógica de Pontuação baseada no Perfil
+        if self.profile.target_priority == "closest":
+            # Quanto menor a distância, maior o score (inverso)
+            score = 10000 / (dist + 1)
+
+        elif self.profile.target_priority == "weakest":
+            target_ants = self.scene.colonies[i].ant_count
+            # Prioriza ninhos vazios ou com poucas formigas
+            score = 1000 / (target_ants + 1)
+
+        elif self.profile.target_priority == "player_focus":
+            # Prioriza atacar o jogador ('ally'), depois neutros
+            if self.scene.owners[i] == "ally":
+                score = 2000
+            else:
+                score = 100
+            # Desempate pela distância
+            score += 1000 / (dist + 1)
+
+        elif self.profile.target_priority == "random":
+            score = random.random() * 100
+
+        return score
 
 
 # --- Perfis Predefinidos ---
@@ -0,0 +1,151 @@
+"""
+Índice espacial de ninhos por dono, para a escolha de alvos da IA.
+
+Cada dono tem sua própria grade uniforme (SpatialHash) com os ninhos que
+possui; capturas movem o ninho entre grades via o feed do OwnershipIndex.
+Consultas por raio e por vizinho mais próximo visitam só as células
+relevantes, e as distâncias vêm da tabela de geometria da fase.
+"""
+
+import heapq
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from src.core.nest_geometry import NestGeometry
+from src.core.ownership_index import OWNERS, OwnershipChange
+from src.systems.spatial_hash import Cell, SpatialHash
+
+T = TypeVar("T")
+
+# Folga relativa ao comparar distâncias "empatadas" (scores iguais em float)
+_TIE_SLACK = 1e-9
+_MIN_CELL_SIZE = 64.0
+
+
+def top_k(items: Iterable[T], k: int, key: Callable[[T], float]) -> List[T]:
+    """
+    Os k maiores por key, via heap. Em empates mantém a ordem de entrada, como
+    sorted(items, key=key, reverse=True)[:k].
+    """
+    return heapq.nlargest(k, items, key=key)
+
+
+class NestTargetIndex:
+    """Grades de ninhos separadas por dono, atualizadas a cada captura."""
+
+    def __init__(
+        self,
+        geometry: NestGeometry,
+        owners: Sequence[str],
+        cell_size: Optional[float] = None,
+    ) -> None:
+        self.geometry = geometry
+        # Lista de donos da cena (escrita só pelo OwnershipIndex)
+        self.owners = owners
+        if cell_size is None:
+            cell_size = _cell_size_for(geometry.positions)
+        self.cell_size = float(cell_size)
+        self._grids: Dict[str, SpatialHash[int]] = {
+            o: SpatialHash(cell_size) for o in OWNERS
+        }
+        self._cells: List[Cell] = []
+        for i, (x, y) in enumerate(geometry.positions):
+            cell = self._grids[owners[i]].cell_of(x, y)
+            self._cells.append(cell)
+            self._grids[owners[i]].insert(i, cell)
+        if self._cells:
+            xs = [c[0] for c in self._cells]
+            ys = [c[1] for c in self._cells]
+            self._bounds = (min(xs), min(ys), max(xs), max(ys))
+        else:
+            self._bounds = (0, 0, -1, -1)
+
+    def on_ownership_change(self, change: OwnershipChange) -> None:
+        """Assinante do OwnershipIndex: move o ninho para a grade do novo dono."""
+        if change.kind != "owner":
+            return
+        cell = self._cells[change.index]
+        self._grids[change.old_owner].remove(change.index, cell)
+        self._grids[change.new_owner].insert(change.index, cell)
+
+    def within_radius(
+        self, origin: int, radius: Optional[float], owners: Iterable[str]
+    ) -> List[int]:
+        """Ninhos dos donos dados a até `radius` da origem (None = todos), por índice."""
+        wanted = tuple(owners)
+        if radius is None:
+            return [
+                i for i, owner in enumerate(self.owners) if owner in wanted and i != origin
+            ]
+        geometry = self.geometry
+        x, y = geometry.positions[origin]
+        found: List[int] = []
+        for owner in wanted:
+            for i in self._grids[owner].query_rect(x - radius, y - radius, x + radius, y + radius):
+                if i != origin and geometry.distance(origin, i) <= radius:
+                    found.append(i)
+        found.sort()
+        return found
+
+    def nearest(
+        self, origin: int, owners: Iterable[str], radius: Optional[float] = None
+    ) -> List[int]:
+        """
+        Ninho(s) mais próximo(s) da origem entre os donos dados, dentro do raio.
+        Retorna todos os empatados na menor distância (por índice), para que o
+        chamador aplique o mesmo desempate da pontuação; vazio se não houver.
+        """
+        grids = [self._grids[owner] for owner in owners]
+        geometry = self.geometry
+        x, y = geometry.positions[origin]
+        cs = self.cell_size
+        ocx, ocy = int(x // cs), int(y // cs)
+        min_cx, min_cy, max_cx, max_cy = self._bounds
+        max_ring = max(ocx - min_cx, max_cx - ocx, ocy - min_cy, max_cy - ocy, 0)
+        if radius is not None:
+            max_ring = min(max_ring, int(math.ceil(radius / cs)) + 1)
+
+        best: Optional[float] = None
+        found: List[Tuple[float, int]] = []
+        for ring in range(max_ring + 1):
+            for cell in _ring_cells(ocx, ocy, ring):
+                for grid in grids:
+                    for i in grid.cell_members(cell):
+                        if i == origin:
+                            continue
+                        dist = geometry.distance(origin, i)
+                        if radius is not None and dist > radius:
+                            continue
+                        found.append((dist, i))
+                        if best is None or dist < best:
+                            best = dist
+            # Células dos anéis seguintes estão a pelo menos ring * cs
+            if best is not None and ring * cs > best * (1 + _TIE_SLACK) + _TIE_SLACK:
+                break
+        if best is None:
+            return []
+        limit = best * (1 + _TIE_SLACK) + _TIE_SLACK
+        return sorted(i for dist, i in found if dist <= limit)
+
+
+def _cell_size_for(positions: Sequence[Tuple[float, float]]) -> float:
+    """Células com ~4 ninhos em média: poucos anéis vazios nas buscas."""
+    if len(positions) < 2:
+        return _MIN_CELL_SIZE
+    xs = [p[0] for p in positions]
+    ys = [p[1] for p in positions]
+    area = max(1.0, (max(xs) - min(xs)) * (max(ys) - min(ys)))
+    return max(_MIN_CELL_SIZE, 2.0 * math.sqrt(area / len(positions)))
+
+
+def _ring_cells(cx: int, cy: int, ring: int) -> Iterable[Cell]:
+    """Células a exatamente `ring` células (Chebyshev) de (cx, cy)."""
+    if ring == 0:
+        yield (cx, cy)
+        return
+    for dx in range(-ring, ring + 1):
+        yield (cx + dx, cy - ring)
+        yield (cx + dx, cy + ring)
+    for dy in range(-ring + 1, ring):
+        yield (cx - ring, cy + dy)
+        yield (cx + ring, cy + dy)
@@ -1,5 +1,5 @@
 import logging
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from pathlib import Path
 
 
@@ -13,6 +13,16 @@ class Settings:
     SPEED: int = 4
     NEST_SIZE: Tuple[int, int] = (64, 64)
     ANT_SIZE: Tuple[int, int] = (48, 48)
+    # Chegadas agendadas no despacho (heap) em vez de checadas a cada quadro
+    EVENT_DRIVEN_ARRIVALS: bool = False
+    # Colônias guardam contagens por tipo em vez de um objeto Ant por unidade
+    COUNTED_COLONIES: bool = False
+    # IA fatiada no tempo: timers por colônia e no máximo AI_DECISIONS_PER_FRAME
+    # decisões por quadro; AI_FRAME_BUDGET_MS (tempo real) torna o resultado
+    # dependente da máquina, por isso fica desligado por padrão
+    AI_TIME_SLICING: bool = False
+    AI_DECISIONS_PER_FRAME: int = 8
+    AI_FRAME_BUDGET_MS: Optional[float] = None
     WINDOW_TITLE: str = "Ant Simulator"
 
     # --- Configurações de Cores ---
@@ -25,6 +35,17 @@ class Settings:
     FONT_SIZE: int = 32
     ANIM_INTERVAL_MS: int = 165
     ANT_SPACING_PX: int = 12
+    # Rotação das formigas quantizada em N ângulos, com cache LRU limitado
+    ROTATION_BUCKETS: int = 72
+    ROTATION_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    # Deslocamento da câmera por tecla de seta (pixels de tela)
+    CAMERA_PAN_STEP: int = 40
+    # LOD: acima desta densidade (formigas visíveis por bloco de 100x100 px de
+    # tela) e com zoom até LOD_MAX_ZOOM, fluxos viram glifos de comboio
+    LOD_DENSITY_THRESHOLD: float = 6.0
+    LOD_MAX_ZOOM: float = 1.0
+    LOD_MIN_STREAM_ANTS: int = 6
+    LOD_CONVOY_SPACING: int = 48
 
     # --- Configurações de Caminhos (Pathing Robusto) ---
     # Base dir é a pasta onde está este arquivo (src/config)
@@ -45,6 +66,9 @@ class Settings:
     SPRITES_DIR: Path = ASSETS_DIR / "sprites"
     ANTS_DIR: Path = SPRITES_DIR / "ants"
     STRUCTURES_DIR: Path = SPRITES_DIR / "structures"
+    # Atlas pré-escalado gerado por src/scripts/build_atlas.py
+    ATLAS_IMAGE: Path = SPRITES_DIR / "atlas.png"
+    ATLAS_INDEX: Path = SPRITES_DIR / "atlas.json"
 
     # --- Caminhos de UI ---
     UI_DIR: Path = SPRITES_DIR / "ui"
@@ -22,6 +22,10 @@ class AppConfig:
     fps: int
     log_level: str
     headless_timeout: float
+    # Multiplicador de velocidade da simulação (limitado pelo Engine a 0.5x–8x)
+    time_scale: float = 1.0
+    # Quadros de atraso que o Engine tenta recuperar antes de descartá-los
+    max_catchup_frames: int = 5
 
     @classmethod
     def from_env(cls) -> "AppConfig":
@@ -62,6 +66,13 @@ class AppConfig:
             dest="headless_timeout",
         )
 
+        parser.add_argument(
+            "--time-scale",
+            type=float,
+            default=float(os.getenv("ANT_SIM_TIME_SCALE", 1.0)),
+            help="Velocidade da simulação (0.5 a 8)",
+        )
+
         parser.add_argument(
             "--log-level",
             type=str,
@@ -80,4 +91,5 @@ class AppConfig:
             fps=args.fps,
             log_level=args.log_level,
             headless_timeout=args.headless_timeout,
+            time_scale=args.time_scale,
         )
@@ -4,6 +4,7 @@ Responsável pelo Loop de Jogo (Game Loop) agnóstico de plataforma.
 """
 
 import logging
+import math
 from typing import Any, Optional, Protocol, runtime_checkable
 
 from src.core.interfaces import IClock, IInputHandler, IRenderer
@@ -17,6 +18,10 @@ class EngineExit(Enum):
     SCENE_FINISHED = auto()
 
 
+# Limites do controle de velocidade da simulação
+MIN_TIME_SCALE = 0.5
+MAX_TIME_SCALE = 8.0
+
 
 @runtime_checkable
 class IScene(Protocol):
@@ -53,6 +58,42 @@ class Engine:
         self.current_scene: Optional[IScene] = None
         self._running = False
 
+        # Passo fixo da simulação: a lógica sempre avança 1/fps por tick,
+        # independente da taxa de quadros real
+        self.fixed_dt: float = 1.0 / float(config.fps)
+        self._accumulator: float = 0.0
+        self.time_scale: float = 1.0
+        self.set_time_scale(config.time_scale)
+
+    def set_time_scale(self, scale: float) -> None:
+        """Define a velocidade da simulação (0.5x a 8x); renders não aumentam."""
+        self.time_scale = min(MAX_TIME_SCALE, max(MIN_TIME_SCALE, float(scale)))
+
+    def _max_steps_per_frame(self) -> int:
+        # Evita a "espiral da morte": após quadros muito lentos, descarta o atraso
+        return math.ceil(self.time_scale) * self.config.max_catchup_frames
+
+    def _step_simulation(self, scene: IScene, dt: float) -> None:
+        """Executa os ticks fixos acumulados e informa a fração restante à cena."""
+        self._accumulator += dt * self.time_scale
+        max_steps = self._max_steps_per_frame()
+        steps = 0
+        while self._accumulator >= self.fixed_dt and scene.running:
+            if steps >= max_steps:
+                self.logger.debug(
+                    "Simulação atrasada: descartando %.3fs acumulados", self._accumulator
+                )
+                self._accumulator = 0.0
+                break
+            scene.update(self.fixed_dt)
+            self._accumulator -= self.fixed_dt
+            steps += 1
+
+        # Fração do próximo tick já decorrida, usada para interpolar o render
+        set_interpolation = getattr(scene, "set_interpolation", None)
+        if set_interpolation is not None:
+            set_interpolation(self._accumulator / self.fixed_dt)
+
     def set_scene(self, scene: IScene) -> None:
         self.current_scene = scene
 
@@ -82,8 +123,8 @@ class Engine:
 
                     self.current_scene.handle_event(event)
 
-                # 3. Update (Lógica)
-                self.current_scene.update(dt)
+                # 3. Update (Lógica) em ticks de tamanho fixo
+                self._step_simulation(self.current_scene, dt)
 
                 # 4. Render
                 self.renderer.render(self.current_scene)
@@ -118,6 +159,7 @@ class Engine:
         """Processa eventos de conclusão de cena e roteia para as próximas cenas."""
         if isinstance(event, LevelFinishedEvent):
             # Roteamento de cenas baseado no resultado da fase
+            self._accumulator = 0.0
             if event.result.victory:
                 from src.core.scenes.victory_scene import VictoryScene
 
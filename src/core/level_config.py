@@ -39,6 +39,9 @@ class LevelConfig:
     tutorial: Optional[TutorialConfig] = None
 
     ai_profile: Optional[AIProfile] = None
+
+    # Tamanho do mundo (largura, altura); None = do tamanho da tela
+    world_size: Optional[Tuple[int, int]] = None
     
     # Objetivos para as estrelas
     time_target: float = 120.0  # Tempo em segundos para ganhar estrela de tempo
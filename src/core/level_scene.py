@@ -7,8 +7,6 @@ from typing import (
     Optional,
     Sequence,
     Tuple,
-    TypedDict,
-    Union,
     Literal,
     Dict,
     cast,
@@ -22,30 +20,40 @@ from src.ai.enemy_controller import (
     EnemyController,
     AI_BALANCED,
 )
+from src.ai.target_index import NestTargetIndex
 
 import pygame
 
 from src.config.settings import Settings
+from src.rendering.camera import Camera
 from src.rendering.sprite_renderer import SpriteRenderer
-from src.entities.colony import Colony
+from src.rendering.draw_list import DrawLayer, DrawList
+from src.rendering.font_manager import FONTS
+from src.rendering.lod import build_convoys, lod_active
+from src.rendering.text_cache import TEXT_CACHE
+from src.entities.colony import Colony, CountedColony
+from src.entities.ant import ANT_POOL
 from src.entities.ant_types import ANT_TYPES_BY_NAME, farao
-from src.entities.ant import Ant
+from src.systems.moving_ants import MovingAntStore
+from src.systems.spatial_hash import SpatialHash
+from src.systems.movement import (
+    ArrivalBounds,
+    build_arrival_bounds,
+    group_arrivals,
+    step_moving_ants,
+    ticks_to_nearest_approach,
+    ticks_until_arrival,
+)
+from src.systems.arrival_scheduler import ArrivalScheduler
+from src.core.ownership_index import OwnershipChange, OwnershipIndex
+from src.core.nest_geometry import NestGeometry, geometry_for
+from src.core.transfer_queue import TransferQueue
 
 
 Vec2 = Tuple[int, int]
 Owner = Literal["ally", "enemy", "empty"]
 
 
-class MovingAnt(TypedDict):
-    position: pygame.Vector2
-    destination: pygame.Vector2
-    origin_index: int
-    dest_index: int
-    angle: float
-    ant_obj: Ant
-    owner: Owner
-
-
 def default_victory_condition(
     owners: Sequence[str],
     colonies: Sequence[Colony],
@@ -74,7 +82,16 @@ class LevelScene:
         self.settings: Settings = settings
         self.running: bool = True
         self.sprites: SpriteRenderer = SpriteRenderer(settings)
-        self.font: pygame.font.Font = pygame.font.SysFont(None, self.settings.FONT_SIZE)
+        # Buffer de comandos reaproveitado por render() a cada quadro
+        self._draw_list: DrawList = DrawList()
+        # Camada estática (fundo, ninhos e anéis), refeita só quando posse ou
+        # seleção mudam; a versão identifica o conteúdo para os dirty rects
+        self._static_layer: Optional[pygame.Surface] = None
+        self._static_version: int = 0
+        self._static_dirty: bool = True
+        self.font: pygame.font.Font = FONTS.get(None, self.settings.FONT_SIZE)
+        # Contagem dos glifos de comboio (LOD)
+        self._convoy_font: pygame.font.Font = FONTS.get(None, 18)
         config.validate()
         self.config: LevelConfig = config
 
@@ -101,6 +118,23 @@ class LevelScene:
                     pygame.Rect(pos[0] - half_w, pos[1] - half_h, w, h)
                 )
 
+        # Distâncias, direções, ângulos e tempos de viagem entre todos os pares
+        self.geometry: NestGeometry = geometry_for(self.nest_positions, self.settings.SPEED)
+
+        # Câmera sobre o mundo e índice espacial dos ninhos (culling do render)
+        self.camera: Camera = Camera(
+            (self.settings.WIDTH, self.settings.HEIGHT), self.config.world_size
+        )
+        self._static_camera_version: int = self.camera.version
+        self._nest_grid: SpatialHash[int] = SpatialHash(max(self.settings.NEST_SIZE) * 4)
+        for i, rect in enumerate(self.nest_rects):
+            self._nest_grid.insert(i, self._nest_grid.cell_of(*rect.center))
+
+        # Faixas de colisão formiga x ninho, usadas pelo kernel de movimento
+        self._arrival_bounds: List[ArrivalBounds] = build_arrival_bounds(
+            [(r.x, r.y, r.w, r.h) for r in self.nest_rects], self.settings.ANT_SIZE
+        )
+
         # Owners and colonies
         self.owners: List[Owner] = [cast(Owner, o) for o in self.config.initial_owners]
         self.colonies: List[Colony] = []
@@ -108,6 +142,8 @@ class LevelScene:
             self.settings.DEFAULT_ANT_TYPE_NAME
         ] * len(self.nest_positions)
 
+        # Contagens por tipo (CountedColony) ou um Ant por unidade (Colony)
+        colony_cls = CountedColony if self.settings.COUNTED_COLONIES else Colony
         for idx, pos in enumerate(self.nest_positions):
             name = (
                 type_names[idx]
@@ -115,20 +151,40 @@ class LevelScene:
                 else self.settings.DEFAULT_ANT_TYPE_NAME
             )
             ant_type = ANT_TYPES_BY_NAME.get(name, farao)
-            colony = Colony(pos, ant_type=ant_type)
+            colony = colony_cls(pos, ant_type=ant_type)
             self.colonies.append(colony)
 
         # Spawn initial ants based on counts and owners
         for i, c in enumerate(self.config.initial_counts):
             if self.owners[i] != "empty" and c > 0:
-                self.colonies[i].spawn_ants(int(c))
+                self.colonies[i].add_units(int(c))
+
+        # Índice de posse: toda escrita em owners/contagens passa por ele
+        self.ownership: OwnershipIndex = OwnershipIndex(self.owners, self.colonies)
+        # Versão do índice na última avaliação da condição de vitória
+        self._victory_checked_version: int = -1
+        self.ownership.subscribe(self._on_ownership_change)
+        # Grades de ninhos por dono para as consultas de alvo da IA
+        self.target_index: NestTargetIndex = NestTargetIndex(self.geometry, self.owners)
+        self.ownership.subscribe(self.target_index.on_ownership_change)
 
         # Selection and movement state
         # Support multi-selection of ally nests
         self.selected_nest_indices: set[int] = set()
-        self.moving_ants: List[MovingAnt] = []
-        self.pending_transfers: List[Dict[str, int]] = []  # {origin, dest, remaining}
+        self.moving_ants: MovingAntStore = MovingAntStore(
+            cell_size=max(self.settings.ANT_SIZE)
+        )
+        # {origin, dest, remaining}, com índice por origem
+        self.pending_transfers: TransferQueue = TransferQueue()
         self.frame_index: int = 0
+        # Passos de movimento executados (base do agendamento de chegadas)
+        self._movement_tick: int = 0
+        # Modo por eventos: chegadas calculadas no despacho e postas em um heap
+        self.event_driven_arrivals: bool = self.settings.EVENT_DRIVEN_ARRIVALS
+        self._arrivals: ArrivalScheduler = ArrivalScheduler()
+        # Fração do próximo tick já decorrida (Engine com passo fixo); 1.0
+        # desenha as formigas exatamente na posição do último tick
+        self._render_alpha: float = 1.0
         # acumulador de tempo para alternância de sprite (em segundos)
         self._anim_accum: float = 0.0
 
@@ -148,7 +204,9 @@ class LevelScene:
             "tutorial" if getattr(self.config, "tutorial", None) else "playing"
         )
 
-        self.tutorial_font = pygame.font.SysFont("arial", 24)
+        self.tutorial_font = FONTS.get("arial", 24)
+        # Overlay do tutorial já composto (refeito apenas se o tamanho mudar)
+        self._tutorial_overlay: Optional[pygame.Surface] = None
         self.completed: bool = False
         
         # Rastreamento de métricas para cálculo de score e estrelas
@@ -172,22 +230,23 @@ class LevelScene:
         self.logger.info(f"Nível {config.name} iniciado. IA: {profile.name}")
 
     # -------------- Utility helpers --------------
-    def _calculate_rotation_angle(
-        self,
-        origin: Union[Sequence[float], pygame.Vector2],
-        destination: Union[Sequence[float], pygame.Vector2],
-    ) -> float:
-        dx = float(destination[0]) - float(origin[0])
-        dy = float(destination[1]) - float(origin[1])
-        if dx == 0.0 and dy == 0.0:
-            return 0.0
-        angle_rad = math.atan2(dy, dx)
-        angle_deg = math.degrees(angle_rad) + 90.0
-        return angle_deg
-
-    def _ant_rect_from_pos(self, pos: pygame.Vector2) -> pygame.Rect:
+    def _ant_rect_at(self, x: float, y: float) -> pygame.Rect:
         w, h = self.settings.ANT_SIZE
-        return pygame.Rect(int(pos.x - w // 2), int(pos.y - h // 2), w, h)
+        return pygame.Rect(int(x - w // 2), int(y - h // 2), w, h)
+
+    def _collides_with_moving_ant(self, candidate_rect: pygame.Rect) -> bool:
+        if self.event_driven_arrivals:
+            # Posições do tick atual para todas as formigas (no máximo uma vez
+            # por tick): a checagem é a mesma do modo por quadro
+            self.moving_ants.materialize(self._movement_tick)
+        # Broadphase pelo hash espacial do store: só a vizinhança do candidato
+        return self.moving_ants.overlaps_rect(
+            candidate_rect.x,
+            candidate_rect.y,
+            candidate_rect.w,
+            candidate_rect.h,
+            self.settings.ANT_SIZE,
+        )
 
     # -------------- Systems --------------
     # TransferSystem
@@ -207,19 +266,15 @@ class LevelScene:
         ant_obj = origin_colony.remove_ant()
         if ant_obj is None:
             return
+        self.ownership.units_changed(origin_index, -1)
         # If removing the ant left the colony empty, mark ownership as empty
-        if len(origin_colony.ants) == 0:
-            self.owners[origin_index] = "empty"
-
-        origin = pygame.Vector2(self.nest_positions[origin_index])
-        dest = pygame.Vector2(self.nest_positions[dest_index])
-        angle = self._calculate_rotation_angle(origin, dest)
+        if origin_colony.ant_count == 0:
+            self.ownership.set_owner(origin_index, "empty")
 
-        direction = dest - origin
-        if direction.length() != 0:
-            dir_norm = direction.normalize()
-        else:
-            dir_norm = pygame.Vector2(1, 0)
+        origin = self.nest_positions[origin_index]
+        dest = self.nest_positions[dest_index]
+        angle = self.geometry.angle(origin_index, dest_index)
+        dir_x, dir_y = self.geometry.direction(origin_index, dest_index)
 
         default_spacing = max(8, min(self.settings.ANT_SIZE) // 3)
         spacing = int(getattr(self.settings, "ANT_SPACING_PX", default_spacing))
@@ -227,33 +282,58 @@ class LevelScene:
         attempt = 0
         max_attempts = 12
         candidate_offset = offset_index
-        candidate_pos = origin - dir_norm * spacing * candidate_offset
-        candidate_rect = self._ant_rect_from_pos(candidate_pos)
+        candidate_x = origin[0] - dir_x * spacing * candidate_offset
+        candidate_y = origin[1] - dir_y * spacing * candidate_offset
+        candidate_rect = self._ant_rect_at(candidate_x, candidate_y)
 
-        existing_rects = [
-            self._ant_rect_from_pos(a["position"]) for a in self.moving_ants
-        ]
         while (
-            any(candidate_rect.colliderect(r) for r in existing_rects)
+            self._collides_with_moving_ant(candidate_rect)
             and attempt < max_attempts
         ):
             attempt += 1
             candidate_offset += 1
-            candidate_pos = origin - dir_norm * spacing * candidate_offset
-            candidate_rect = self._ant_rect_from_pos(candidate_pos)
-
-        ant: MovingAnt = {
-            "position": pygame.Vector2(candidate_pos),
-            "destination": pygame.Vector2(dest),
-            "origin_index": origin_index,
-            "dest_index": dest_index,
-            "angle": angle,
-            "ant_obj": ant_obj,
-            "owner": owner,
-        }
-        self.moving_ants.append(ant)
+            candidate_x = origin[0] - dir_x * spacing * candidate_offset
+            candidate_y = origin[1] - dir_y * spacing * candidate_offset
+            candidate_rect = self._ant_rect_at(candidate_x, candidate_y)
+
+        speed = float(self.settings.SPEED)
+        velocity = (dir_x * speed, dir_y * speed)
+        slot = self.moving_ants.append(
+            pos=(candidate_x, candidate_y),
+            dest=dest,
+            velocity=velocity,
+            angle=angle,
+            owner=owner,
+            origin_index=origin_index,
+            dest_index=dest_index,
+            ant=ant_obj,
+            tick=self._movement_tick,
+        )
+        if self.event_driven_arrivals:
+            self._schedule_arrival(slot)
         self.logger.debug("Dispatched ant from %d to %d", origin_index, dest_index)
 
+    def _schedule_arrival(self, slot: int) -> None:
+        """Agenda a chegada de uma formiga recém-despachada (modo por eventos)."""
+        store = self.moving_ants
+        start = store.position(slot)
+        velocity = (store.vx[slot], store.vy[slot])
+        dest_index = store.dest_index[slot]
+        steps = ticks_until_arrival(
+            start, velocity, self._arrival_bounds[dest_index], self.settings.ANT_SIZE
+        )
+        if steps is None:
+            # Trajetória não toca o ninho: resolve no ponto de maior aproximação
+            # para que a formiga nunca fique presa no store.
+            steps = ticks_to_nearest_approach(
+                start, velocity, (store.dest_x[slot], store.dest_y[slot])
+            )
+            self.logger.warning(
+                "Ant to nest %d never touches its rect; resolving at closest approach",
+                dest_index,
+            )
+        self._arrivals.schedule(self._movement_tick + steps, store.uid[slot])
+
     def _process_pending_transfers(self) -> None:
         if not self.pending_transfers:
             return
@@ -270,28 +350,19 @@ class LevelScene:
                 self.pending_transfers.remove(transfer)
                 continue
 
-            if origin_idx >= len(self.colonies) or not self.colonies[origin_idx].ants:
+            if origin_idx >= len(self.colonies) or self.colonies[origin_idx].ant_count == 0:
                 self.pending_transfers.remove(transfer)
                 continue
 
-            origin_pos: pygame.Vector2 = pygame.Vector2(self.nest_positions[origin_idx])
-            dest_pos: pygame.Vector2 = pygame.Vector2(self.nest_positions[dest_idx])
-            direction: pygame.Vector2 = dest_pos - origin_pos
-            dir_norm: pygame.Vector2 = (
-                direction.normalize()
-                if direction.length() != 0
-                else pygame.Vector2(1, 0)
-            )
+            origin_x, origin_y = self.nest_positions[origin_idx]
+            dir_x, dir_y = self.geometry.direction(origin_idx, dest_idx)
 
             spawn_offset: int = spacing * 2
-            candidate_pos: pygame.Vector2 = origin_pos + dir_norm * spawn_offset
-            candidate_rect: pygame.Rect = self._ant_rect_from_pos(candidate_pos)
-
-            existing_rects: List[pygame.Rect] = [
-                self._ant_rect_from_pos(a["position"]) for a in self.moving_ants
-            ]
+            candidate_rect: pygame.Rect = self._ant_rect_at(
+                origin_x + dir_x * spawn_offset, origin_y + dir_y * spawn_offset
+            )
 
-            if not any(candidate_rect.colliderect(r) for r in existing_rects):
+            if not self._collides_with_moving_ant(candidate_rect):
                 self._start_ant_movement(origin_idx, dest_idx, owner, 0)
                 transfer["remaining"] -= 1
                 if transfer["remaining"] <= 0:
@@ -308,39 +379,39 @@ class LevelScene:
             self.frame_index = 1 - self.frame_index
             self._anim_accum -= interval_s
 
-    def _resolve_arrival(self, ant: MovingAnt) -> None:
-        dest_index = int(ant["dest_index"])
+    def _resolve_arrival(self, slot: int) -> None:
+        store = self.moving_ants
+        dest_index = store.dest_index[slot]
         if dest_index < 0 or dest_index >= len(self.colonies):
             return
         dest_owner = self.owners[dest_index]
         dest_colony = self.colonies[dest_index]
-        ant_owner = ant["owner"]
+        ant_owner = store.owner_of(slot)
+        ant_obj = store.ants[slot]
 
         if dest_owner == "empty":
             # Capture empty nest
-            self.owners[dest_index] = ant_owner
-            ant_obj = ant["ant_obj"]
-            if isinstance(ant_obj, Ant):
-                dest_colony.ants.append(ant_obj)
+            self.ownership.set_owner(dest_index, ant_owner)
+            dest_colony.add_ant(ant_obj)
+            self.ownership.units_changed(dest_index, 1)
             self.logger.info("Nest %d captured by %s", dest_index, ant_owner)
             return
 
         if dest_owner == ant_owner:
-            ant_obj = ant["ant_obj"]
-            if isinstance(ant_obj, Ant):
-                dest_colony.ants.append(ant_obj)
+            dest_colony.add_ant(ant_obj)
+            self.ownership.units_changed(dest_index, 1)
             return
 
         # Enemy destination: simple one-to-one reduction rule
         if dest_owner != ant_owner:
-            if dest_colony.ants:
-                dest_colony.ants.pop()  # remove one enemy ant
+            if dest_colony.kill_ant():  # remove one enemy ant
+                self.ownership.units_changed(dest_index, -1)
                 # Incrementa contador de inimigos derrotados
                 if ant_owner == "ally":
                     self._enemies_defeated += 1
                 # if defenders depleted, mark nest as empty
-                if len(dest_colony.ants) == 0:
-                    self.owners[dest_index] = "empty"
+                if dest_colony.ant_count == 0:
+                    self.ownership.set_owner(dest_index, "empty")
                     # Se um ninho aliado foi perdido para inimigos, registra
                     if self._initial_owners[dest_index] == "ally" and ant_owner == "enemy":
                         self._allied_nests_lost += 1
@@ -348,16 +419,16 @@ class LevelScene:
                     "Combat at nest %d: removed one enemy ant", dest_index
                 )
                 # arriving ant is consumed in the fight
+                ANT_POOL.release(ant_obj)
                 return
             else:
                 # No defenders left — flip ownership and add arriving ant
                 # Se um ninho aliado foi perdido para inimigos, registra
                 if self._initial_owners[dest_index] == "ally" and ant_owner == "enemy":
                     self._allied_nests_lost += 1
-                self.owners[dest_index] = ant_owner
-                ant_obj = ant["ant_obj"]
-                if isinstance(ant_obj, Ant):
-                    dest_colony.ants.append(ant_obj)
+                self.ownership.set_owner(dest_index, ant_owner)
+                dest_colony.add_ant(ant_obj)
+                self.ownership.units_changed(dest_index, 1)
                 self.logger.info(
                     "Nest %d captured by %s after clearing defenders",
                     dest_index,
@@ -366,31 +437,42 @@ class LevelScene:
                 return
 
     def _update_ant_movement(self) -> None:
+        tick = self._movement_tick
+        self._movement_tick += 1
         if not self.moving_ants:
             return
-        for ant in list(self.moving_ants):
-            direction: pygame.Vector2 = ant["destination"] - ant["position"]
-            dest_index = int(ant.get("dest_index", -1))
-            arrived = False
-
-            if 0 <= dest_index < len(self.nest_rects):
-                ant_rect = self._ant_rect_from_pos(ant["position"])  # current rect
-                dest_rect = self.nest_rects[dest_index]
-                if ant_rect.colliderect(dest_rect):
-                    arrived = True
-
-            if arrived:
-                self._resolve_arrival(ant)
-                try:
-                    self.moving_ants.remove(ant)
-                except ValueError:
-                    pass
-                continue
 
-            if direction.length() == 0:
-                continue
-            direction.scale_to_length(self.settings.SPEED)
-            ant["position"] += direction
+        if self.event_driven_arrivals:
+            # Só as chegadas vencidas; posições são calculadas sob demanda
+            due = self._arrivals.pop_due(tick)
+            if not due:
+                return
+            arrivals = group_arrivals(
+                sorted(self.moving_ants.slot_of(uid) for uid in due),
+                self.moving_ants.dest_index,
+            )
+        else:
+            arrivals = step_moving_ants(
+                self.moving_ants, self._arrival_bounds, self.settings.ANT_SIZE, tick
+            )
+            if not arrivals:
+                return
+        # Mesma ordem nos dois modos: destinos pelo menor slot, slots crescentes
+        arrived = []
+        for slots in arrivals.values():
+            for slot in slots:
+                self._resolve_arrival(slot)
+            arrived.extend(slots)
+        self.moving_ants.remove_many(arrived)
+
+    def _sync_moving_ant_positions(self) -> None:
+        """No modo por eventos, atualiza as posições do store para o tick atual."""
+        if self.event_driven_arrivals:
+            self.moving_ants.materialize(self._movement_tick)
+
+    def set_interpolation(self, alpha: float) -> None:
+        """Recebe do Engine a fração do tick seguinte para interpolar o render."""
+        self._render_alpha = min(1.0, max(0.0, alpha))
 
     # ProductionSystem (parallelizable)
     def _update_production(self, dt: float) -> None:
@@ -400,9 +482,16 @@ class LevelScene:
 
         total_produced = 0
 
-        for i, owner in enumerate(self.owners):
-            if owner == "ally" or (owner == "enemy" and enemy_produces):
-                total_produced += self.colonies[i].update(dt)
+        # Só os ninhos produtores, via índice de posse (sem varrer owners)
+        producers = [self.ownership.nests("ally")]
+        if enemy_produces:
+            producers.append(self.ownership.nests("enemy"))
+        for nests in producers:
+            for i in nests:
+                produced = self.colonies[i].update(dt)
+                if produced:
+                    self.ownership.units_changed(i, produced)
+                    total_produced += produced
 
         if total_produced > 0:
             self.logger.debug(
@@ -418,10 +507,32 @@ class LevelScene:
             return
 
         if isinstance(event, MouseButtonDown):
+            if event.button in (4, 5):
+                # Roda do mouse: zoom ancorado no cursor
+                self.camera.zoom_by(1 if event.button == 4 else -1, event.pos)
+                return
             self._handle_mouse_click(event)
+        elif isinstance(event, KeyDown):
+            self._handle_camera_key(event)
+
+    def _handle_camera_key(self, event: KeyDown) -> None:
+        step = self.settings.CAMERA_PAN_STEP
+        offsets = {
+            pygame.K_LEFT: (-step, 0),
+            pygame.K_RIGHT: (step, 0),
+            pygame.K_UP: (0, -step),
+            pygame.K_DOWN: (0, step),
+        }
+        offset = offsets.get(event.key)
+        if offset is not None:
+            self.camera.pan(*offset)
 
     def _handle_mouse_click(self, event: MouseButtonDown) -> None:
-        mouse_pos: Tuple[int, int] = event.pos
+        # A seleção (anéis da camada estática) pode mudar com qualquer clique
+        self._static_dirty = True
+        # Os retângulos dos ninhos estão em coordenadas do mundo
+        world_x, world_y = self.camera.screen_to_world(*event.pos)
+        mouse_pos: Tuple[int, int] = (math.floor(world_x), math.floor(world_y))
         shift_pressed = bool(event.shift)
         ctrl_pressed = bool(event.ctrl)
 
@@ -433,7 +544,7 @@ class LevelScene:
             colony = self.colonies[index]
 
             # If clicking on an ally nest with ants: handle selection logic
-            if owner == "ally" and len(colony.ants) > 0:
+            if owner == "ally" and colony.ant_count > 0:
                 if ctrl_pressed:
                     # Toggle selection with Ctrl (or Cmd)
                     if index in self.selected_nest_indices:
@@ -458,7 +569,7 @@ class LevelScene:
                         # send a single ant immediately
                         self._start_ant_movement(origin_idx, index, origin_owner)
                     else:
-                        available = len(origin_colony.ants)
+                        available = origin_colony.ant_count
                         if available > 0:
                             self.pending_transfers.append(
                                 {
@@ -476,21 +587,66 @@ class LevelScene:
 
     # -------------- Render --------------
     def _render_ant_count(
-        self, surface: pygame.Surface, index: int, rect: pygame.Rect
+        self, draw_list: DrawList, index: int, rect: pygame.Rect
     ) -> None:
-        count = len(self.colonies[index].ants)
-        img = self.font.render(str(count), True, self.settings.TEXT_COLOR)
-        surface.blit(img, (rect.centerx - 5, rect.bottom + 5))
+        count = self.colonies[index].ant_count
+        # Dígitos pré-renderizados: a contagem nunca rasteriza a fonte
+        center_x, bottom = self.camera.world_to_screen(rect.centerx, rect.bottom)
+        x = int(center_x) - 5
+        y = int(bottom) + 5
+        for glyph, offset in TEXT_CACHE.number_glyphs(
+            self.font, count, self.settings.TEXT_COLOR
+        ):
+            draw_list.blit(glyph, (x + offset, y), DrawLayer.LABELS)
 
     def render(self, surface: Any) -> None:
         if surface is None:
             # Sem destino, não há onde desenhar (renderer deve fornecer)
             return
-        target = surface
-        target.fill(self.settings.BG_COLOR)
+        draw_list = self._draw_list
+        draw_list.clear()
+        self.draw(draw_list)
+        draw_list.submit(surface)
+
+    def _on_ownership_change(self, change: OwnershipChange) -> None:
+        if change.kind == "owner":
+            self._static_dirty = True
+
+    def _visible_nests(self) -> List[int]:
+        """Ninhos cujo retângulo (com anéis e rótulo) intersecta a vista da câmera."""
+        left, top, right, bottom = self.camera.visible_bounds()
+        # Folga para os anéis e para a contagem desenhada abaixo do ninho
+        margin = 8
+        label = self.settings.FONT_SIZE + 5
+        rects = self.nest_rects
+        half_w = max(r.width for r in rects) // 2 if rects else 0
+        half_h = max(r.height for r in rects) // 2 if rects else 0
+        candidates = self._nest_grid.query_rect(
+            left - half_w - margin,
+            top - half_h - margin - label,
+            right + half_w + margin,
+            bottom + half_h + margin,
+        )
+        return sorted(
+            i
+            for i in candidates
+            if rects[i].left - margin < right
+            and rects[i].right + margin > left
+            and rects[i].top - margin < bottom
+            and rects[i].bottom + margin + label > top
+        )
 
-        # Nests
-        for i, pos in enumerate(self.nest_positions):
+    def _rebuild_static_layer(self) -> pygame.Surface:
+        """Pré-compõe fundo, ninhos e anéis visíveis em uma superfície de tela cheia."""
+        layer = pygame.Surface((self.settings.WIDTH, self.settings.HEIGHT))
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        static = DrawList()
+        static.fill(self.settings.BG_COLOR)
+        camera = self.camera
+        zoom = camera.zoom
+        for i in self._visible_nests():
+            pos = camera.world_to_screen(*self.nest_positions[i])
             owner = self.owners[i]
             if owner == "ally":
                 state = "ally"
@@ -498,68 +654,151 @@ class LevelScene:
                 state = "enemy"
             else:
                 state = "empty"
-            self.sprites.draw_nest(target, pos, state=state)
+            self.sprites.draw_nest(static, pos, state=state, zoom=zoom)
 
             # selection ring (support multi-select)
             if i in self.selected_nest_indices:
-                self.sprites.draw_selection_ring(target, pos)
+                self.sprites.draw_selection_ring(static, pos, zoom=zoom)
 
             # optional enemy ring overlay (red) if no enemy sprite available
             if owner == "enemy" and not getattr(self.sprites, "nest_img_enemy", None):
-                self.sprites.draw_enemy_ring(target, pos)
+                self.sprites.draw_enemy_ring(static, pos, zoom=zoom)
+        static.submit(layer)
+        self._static_layer = layer
+        self._static_version += 1
+        self._static_dirty = False
+        self._static_camera_version = camera.version
+        return layer
+
+    def draw(self, draw_list: DrawList) -> None:
+        """Registra os comandos de desenho do quadro (o renderer submete)."""
+        camera = self.camera
+        static_layer = self._static_layer
+        if (
+            self._static_dirty
+            or static_layer is None
+            or self._static_camera_version != camera.version
+        ):
+            static_layer = self._rebuild_static_layer()
+        draw_list.set_background(static_layer, self._static_version)
 
-            rect = self.nest_rects[i]
-            self._render_ant_count(target, i, rect)
+        # Contagens mudam a todo momento: ficam fora da camada estática
+        for i in self._visible_nests():
+            self._render_ant_count(draw_list, i, self.nest_rects[i])
 
         # Moving ants
-        for ant in self.moving_ants:
-            ant_obj = ant["ant_obj"]
+        self._sync_moving_ant_positions()
+        store = self.moving_ants
+        # Interpola entre o tick anterior e o atual: recua (1 - alpha) passos,
+        # exceto formigas que ainda não deram nenhum passo
+        back = 1.0 - self._render_alpha
+        tick = self._movement_tick
+        zoom = camera.zoom
+        identity = camera.is_identity
+        slots = self._visible_ant_slots()
+        settings = self.settings
+        if lod_active(
+            len(slots),
+            (settings.WIDTH, settings.HEIGHT),
+            zoom,
+            settings.LOD_DENSITY_THRESHOLD,
+            settings.LOD_MAX_ZOOM,
+        ):
+            # Muitas formigas na tela: fluxos densos viram glifos de comboio
+            convoys, slots = build_convoys(
+                store,
+                slots,
+                settings.LOD_CONVOY_SPACING,
+                settings.LOD_MIN_STREAM_ANTS,
+                self.geometry,
+            )
+            for convoy in convoys:
+                sample = convoy.sample_slot
+                ant_obj = store.ants[sample]
+                pos = (convoy.x, convoy.y)
+                if not identity:
+                    pos = camera.world_to_screen(*pos)
+                self.sprites.draw_convoy(
+                    draw_list,
+                    pos,
+                    store.angle[sample],
+                    self.frame_index,
+                    ant_obj.type.name if ant_obj else "Farao",
+                    convoy.count,
+                    store.owner_of(sample),
+                    self._convoy_font,
+                    zoom,
+                )
+        for slot in slots:
+            ant_obj = store.ants[slot]
             t_name = ant_obj.type.name if ant_obj else "Farao"
+            x, y = store.x[slot], store.y[slot]
+            if back and store.dispatch_tick[slot] < tick:
+                x -= store.vx[slot] * back
+                y -= store.vy[slot] * back
+            if not identity:
+                x, y = camera.world_to_screen(x, y)
             self.sprites.draw_ant(
-                target,
-                ant["position"],
-                ant["angle"],
+                draw_list,
+                (x, y),
+                store.angle[slot],
                 self.frame_index,
                 ant_type_name=t_name,
+                zoom=zoom,
             )
 
         if self.state == "tutorial" and getattr(self.config, "tutorial", None):
-            self._render_tutorial_overlay(target)
+            draw_list.custom(self._render_tutorial_overlay, DrawLayer.OVERLAY)
 
         # flip é responsabilidade do Renderer (adapter)
 
+    def _visible_ant_slots(self) -> Sequence[int]:
+        """Slots das formigas cujo sprite pode aparecer na vista da câmera."""
+        store = self.moving_ants
+        left, top, right, bottom = self.camera.visible_bounds()
+        if left <= 0 and top <= 0 and right >= self.camera.world_w and bottom >= self.camera.world_h:
+            # O mundo inteiro está na tela: nada a descartar
+            return range(len(store))
+        # Folga: meio sprite rotacionado mais o recuo da interpolação
+        margin = max(self.settings.ANT_SIZE)
+        return store.slots_in_rect(left - margin, top - margin, right + margin, bottom + margin)
+
     def _render_tutorial_overlay(self, surface: pygame.Surface) -> None:
-        overlay = pygame.Surface(
-            (self.settings.WIDTH, self.settings.HEIGHT), pygame.SRCALPHA
-        )
+        size = surface.get_size()
+        if self._tutorial_overlay is None or self._tutorial_overlay.get_size() != size:
+            # Composto uma única vez; só é refeito se o destino mudar de tamanho
+            self._tutorial_overlay = self._build_tutorial_overlay(size)
+        surface.blit(self._tutorial_overlay, (0, 0))
+
+    def _build_tutorial_overlay(self, size: Tuple[int, int]) -> pygame.Surface:
+        width, height = size
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 200))
-        surface.blit(overlay, (0, 0))
 
         tutorial = self.config.tutorial
         if not tutorial:
-            return
+            return overlay
 
-        title_font = pygame.font.SysFont("arial", 40, bold=True)
-        title_surf = title_font.render(tutorial.title, True, (255, 255, 0))
-        title_rect = title_surf.get_rect(center=(self.settings.WIDTH // 2, 80))
-        surface.blit(title_surf, title_rect)
+        title_font = FONTS.get("arial", 40, bold=True)
+        title_surf = TEXT_CACHE.render(title_font, tutorial.title, (255, 255, 0))
+        title_rect = title_surf.get_rect(center=(width // 2, 80))
+        overlay.blit(title_surf, title_rect)
 
         start_x = 100
         start_y = 150
 
         for line in tutorial.lines:
             h = render_rich_text_line(
-                surface, line, (start_x, start_y), self.tutorial_font
+                overlay, line, (start_x, start_y), self.tutorial_font
             )
             start_y += h + 15
 
-        cont_surf = self.tutorial_font.render(
-            "Clique para iniciar...", True, (150, 150, 150)
+        cont_surf = TEXT_CACHE.render(
+            self.tutorial_font, "Clique para iniciar...", (150, 150, 150)
         )
-        cont_rect = cont_surf.get_rect(
-            center=(self.settings.WIDTH // 2, self.settings.HEIGHT - 50)
-        )
-        surface.blit(cont_surf, cont_rect)
+        cont_rect = cont_surf.get_rect(center=(width // 2, height - 50))
+        overlay.blit(cont_surf, cont_rect)
+        return overlay
 
     # -------------- Cálculo de Score e Estrelas --------------
     def _calculate_score(self) -> int:
@@ -661,9 +900,9 @@ class LevelScene:
         self._update_ant_movement()
 
         # 6. Verifica condição de derrota (perdeu todos os ninhos aliados ou não tem formigas)
-        # Conta quantos ninhos e formigas aliadas restam
-        ally_nests = sum(1 for o in self.owners if o == "ally")
-        ally_ants = sum(len(c.ants) for i, c in enumerate(self.colonies) if self.owners[i] == "ally")
+        # Ninhos e formigas aliadas restantes, mantidos pelo índice de posse
+        ally_nests = len(self.ownership.nests("ally"))
+        ally_ants = self.ownership.units("ally")
         
         if ally_nests == 0 or (ally_nests > 0 and ally_ants == 0 and not self.moving_ants):
             # Perdeu todos os ninhos ou não tem mais formigas para recuperar
@@ -673,13 +912,26 @@ class LevelScene:
             return
 
         # 7. Verifica condição de vitória
+        # Só reavalia quando posse ou contagens mudaram desde a última checagem
+        if self.ownership.version == self._victory_checked_version:
+            return
+        self._victory_checked_version = self.ownership.version
         vc = self.config.victory_condition or default_victory_condition
-        if vc(self.owners, self.colonies):
+        if vc is default_victory_condition:
+            won = len(self.ownership.nests("ally")) == len(self.owners)
+        else:
+            won = vc(self.owners, self.colonies)
+        if won:
             if self._pending_result is None:
                 self._pending_result = self._build_result(victory=True)
             return
 
 
+    @property
+    def outcome(self) -> Optional[LevelResult]:
+        """Resultado da partida assim que decidida (antes do delay de encerramento)."""
+        return self._result or self._pending_result
+
     @property
     def result_event(self) -> Optional[Event]:
         if not self.running and self._result:
@@ -0,0 +1,76 @@
+"""
+Geometria pré-calculada entre pares de ninhos.
+
+As posições dos ninhos não mudam durante a fase. NestGeometry calcula uma
+única vez, para cada par (origem, destino), a distância, a direção unitária,
+o ângulo de rotação do sprite e o tempo de viagem em ticks; IA, despacho e
+render leem da tabela em vez de repetir hypot/atan2 a cada decisão.
+"""
+
+import math
+from array import array
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+Position = Tuple[float, float]
+
+
+class NestGeometry:
+    """Matrizes n x n (linha = origem) guardadas em arrays contíguos."""
+
+    def __init__(self, positions: Sequence[Sequence[float]], speed: float) -> None:
+        if speed <= 0:
+            raise ValueError(f"speed deve ser positivo (recebido {speed}).")
+        self.positions: Tuple[Position, ...] = tuple(
+            (float(p[0]), float(p[1])) for p in positions
+        )
+        self.speed = float(speed)
+        n = len(self.positions)
+        self.size = n
+        self.distances: array[float] = array("d", bytes(8 * n * n))
+        self.dir_x: array[float] = array("d", bytes(8 * n * n))
+        self.dir_y: array[float] = array("d", bytes(8 * n * n))
+        self.angles: array[float] = array("d", bytes(8 * n * n))
+        self.travel_ticks: array[float] = array("d", bytes(8 * n * n))
+
+        for i, (ox, oy) in enumerate(self.positions):
+            row = i * n
+            for j, (tx, ty) in enumerate(self.positions):
+                dx, dy = tx - ox, ty - oy
+                length = math.hypot(dx, dy)
+                k = row + j
+                self.distances[k] = length
+                self.travel_ticks[k] = length / self.speed
+                if length == 0.0:
+                    # Mesmo ponto: direção padrão e sem rotação
+                    self.dir_x[k] = 1.0
+                    self.angles[k] = 0.0
+                    continue
+                self.dir_x[k] = dx / length
+                self.dir_y[k] = dy / length
+                # Sprites apontam para cima: +90° em relação ao eixo x
+                self.angles[k] = math.degrees(math.atan2(dy, dx)) + 90.0
+
+    def distance(self, origin: int, dest: int) -> float:
+        return self.distances[origin * self.size + dest]
+
+    def direction(self, origin: int, dest: int) -> Tuple[float, float]:
+        k = origin * self.size + dest
+        return (self.dir_x[k], self.dir_y[k])
+
+    def angle(self, origin: int, dest: int) -> float:
+        return self.angles[origin * self.size + dest]
+
+    def travel_time(self, origin: int, dest: int) -> float:
+        """Ticks de viagem em linha reta entre os centros dos ninhos."""
+        return self.travel_ticks[origin * self.size + dest]
+
+
+def geometry_for(positions: Sequence[Sequence[float]], speed: float) -> NestGeometry:
+    """Tabela para as posições dadas, reaproveitada entre cenas com o mesmo layout."""
+    return _cached_geometry(tuple((float(p[0]), float(p[1])) for p in positions), float(speed))
+
+
+@lru_cache(maxsize=16)
+def _cached_geometry(positions: Tuple[Position, ...], speed: float) -> NestGeometry:
+    return NestGeometry(positions, speed)
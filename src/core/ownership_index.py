@@ -0,0 +1,105 @@
+"""
+Índice incremental de posse dos ninhos.
+
+Mantém, para cada dono ("ally", "enemy", "empty"), o conjunto de ninhos e o
+total de unidades, atualizados a cada captura ou mudança de contagem em vez
+de recontados a cada quadro. Um contador de versão e um hook de inscrição
+permitem que outros sistemas (IA, render) reajam apenas a mudanças.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Literal, Sequence, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.entities.colony import Colony
+
+ChangeKind = Literal["owner", "units"]
+Owner = Literal["ally", "enemy", "empty"]
+
+OWNERS = ("ally", "enemy", "empty")
+
+
+@dataclass(frozen=True)
+class OwnershipChange:
+    """Notificação de mudança em um ninho."""
+
+    kind: ChangeKind
+    index: int
+    old_owner: str
+    new_owner: str
+    delta: int = 0
+
+
+Listener = Callable[[OwnershipChange], None]
+
+
+class OwnershipIndex:
+    """Conjuntos de ninhos e totais de unidades por dono, com versão e notificações."""
+
+    def __init__(self, owners: List[Owner], colonies: Sequence["Colony"]) -> None:
+        # A lista de owners é compartilhada com a cena e escrita apenas por set_owner
+        self.owners = owners
+        self.colonies = colonies
+        self.version: int = 0
+        self._nests: Dict[str, Set[int]] = {}
+        self._units: Dict[str, int] = {}
+        self._listeners: List[Listener] = []
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Recalcula tudo a partir de owners/colonies (O(n))."""
+        self._nests = {owner: set() for owner in OWNERS}
+        self._units = {owner: 0 for owner in OWNERS}
+        for i, owner in enumerate(self.owners):
+            self._nests.setdefault(owner, set()).add(i)
+            self._units[owner] = self._units.get(owner, 0) + self.colonies[i].ant_count
+        self.version += 1
+
+    def nests(self, owner: str) -> Set[int]:
+        """Ninhos do dono. O conjunto é interno: não modifique."""
+        return self._nests.get(owner, set())
+
+    def units(self, owner: str) -> int:
+        """Total de unidades guardadas nos ninhos do dono (sem contar as em trânsito)."""
+        return self._units.get(owner, 0)
+
+    def set_owner(self, index: int, owner: Owner) -> None:
+        """Troca o dono do ninho, levando junto a contagem atual da colônia.
+
+        Pressupõe índice em dia com a colônia: toda mudança de contagem deve
+        ser registrada com units_changed logo após acontecer.
+        """
+        old_owner = self.owners[index]
+        if old_owner == owner:
+            return
+        self.owners[index] = owner
+        self._nests[old_owner].discard(index)
+        self._nests.setdefault(owner, set()).add(index)
+        count = self.colonies[index].ant_count
+        self._units[old_owner] -= count
+        self._units[owner] = self._units.get(owner, 0) + count
+        self.version += 1
+        self._notify(OwnershipChange("owner", index, old_owner, owner))
+
+    def units_changed(self, index: int, delta: int) -> None:
+        """Registra que a contagem do ninho mudou em `delta` unidades."""
+        if delta == 0:
+            return
+        owner = self.owners[index]
+        self._units[owner] = self._units.get(owner, 0) + delta
+        self.version += 1
+        self._notify(OwnershipChange("units", index, owner, owner, delta))
+
+    def subscribe(self, listener: Listener) -> Callable[[], None]:
+        """Inscreve um listener; retorna a função que cancela a inscrição."""
+        self._listeners.append(listener)
+
+        def unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return unsubscribe
+
+    def _notify(self, change: OwnershipChange) -> None:
+        for listener in self._listeners:
+            listener(change)
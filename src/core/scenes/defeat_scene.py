@@ -8,6 +8,8 @@ from typing import Any, Optional
 from src.core.engine import IScene
 from src.core.events import Event, MouseButtonDown
 from src.config.settings import Settings
+from src.rendering.font_manager import FONTS
+from src.rendering.text_cache import TEXT_CACHE
 
 
 class DefeatScene(IScene):
@@ -18,9 +20,9 @@ class DefeatScene(IScene):
         self._next_event: Optional[Event] = None
 
         # Fonts
-        self.font_title = pygame.font.SysFont("arial", 60, bold=True)
-        self.font_text = pygame.font.SysFont("arial", 28)
-        self.font_button = pygame.font.SysFont("arial", 24)
+        self.font_title = FONTS.get("arial", 60, bold=True)
+        self.font_text = FONTS.get("arial", 28)
+        self.font_button = FONTS.get("arial", 24)
 
         # Botões
         self.btn_retry = pygame.Rect(0, 0, 200, 60)
@@ -57,7 +59,7 @@ class DefeatScene(IScene):
         pygame.draw.rect(surface, color, rect, border_radius=10)
         pygame.draw.rect(surface, (255, 255, 255), rect, 2, border_radius=10)
 
-        txt = self.font_button.render(text, True, (255, 255, 255))
+        txt = TEXT_CACHE.render(self.font_button, text, (255, 255, 255))
         surface.blit(txt, txt.get_rect(center=rect.center))
 
     def render(self, surface: Any) -> None:
@@ -65,12 +67,12 @@ class DefeatScene(IScene):
         surface.fill(Settings.BG_COLOR)
 
         # Título
-        title = self.font_title.render("DERROTA!", True, (255, 0, 0))
+        title = TEXT_CACHE.render(self.font_title, "DERROTA!", (255, 0, 0))
         surface.blit(title, title.get_rect(center=(Settings.WIDTH // 2, 100)))
 
         # Mensagem
-        msg = self.font_text.render(
-            "Você perdeu a fase. Tente novamente!", True, (200, 100, 100)
+        msg = TEXT_CACHE.render(
+            self.font_text, "Você perdeu a fase. Tente novamente!", (200, 100, 100)
         )
         surface.blit(msg, msg.get_rect(center=(Settings.WIDTH // 2, 220)))
 
@@ -3,6 +3,8 @@ from typing import Any
 from src.core.engine import IScene
 from src.core.events import Event, GameStartEvent, MouseButtonDown
 from src.config.settings import Settings
+from src.rendering.font_manager import FONTS
+from src.rendering.text_cache import TEXT_CACHE
 
 
 class TitleScene(IScene):
@@ -14,8 +16,8 @@ class TitleScene(IScene):
     def __init__(self, screen_surface: pygame.Surface) -> None:
         self.screen = screen_surface
         self.running = True
-        self.font_title = pygame.font.SysFont("arial", 60, bold=True)
-        self.font_btn = pygame.font.SysFont("arial", 40)
+        self.font_title = FONTS.get("arial", 60, bold=True)
+        self.font_btn = FONTS.get("arial", 40)
 
         self._next_event: Event | None = None
 
@@ -54,7 +56,7 @@ class TitleScene(IScene):
         pygame.draw.rect(surface, color, rect, border_radius=10)
         pygame.draw.rect(surface, (255, 255, 255), rect, 2, border_radius=10)
 
-        txt = self.font_btn.render(text, True, (255, 255, 255))
+        txt = TEXT_CACHE.render(self.font_btn, text, (255, 255, 255))
         surface.blit(txt, txt.get_rect(center=rect.center))
 
     def render(self, surface: Any) -> None:
@@ -67,7 +69,7 @@ class TitleScene(IScene):
 
         surface.fill(Settings.BG_COLOR)
 
-        title = self.font_title.render("Ant Simulator", True, Settings.SELECTION_COLOR)
+        title = TEXT_CACHE.render(self.font_title, "Ant Simulator", Settings.SELECTION_COLOR)
         surface.blit(
             title, title.get_rect(center=(Settings.WIDTH // 2, int(Settings.HEIGHT * 0.15)))
         )
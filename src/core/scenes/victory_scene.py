@@ -9,7 +9,9 @@ from src.core.engine import IScene
 from src.core.events import Event, MouseButtonDown
 from src.core.events import LevelResult
 from src.config.settings import Settings
-from src.utils.asset_loader import load_image
+from src.utils.asset_cache import ASSETS
+from src.rendering.font_manager import FONTS
+from src.rendering.text_cache import TEXT_CACHE
 from typing import List, Tuple
 
 
@@ -21,21 +23,20 @@ class VictoryScene(IScene):
         self.running = True
         self._next_event: Optional[Event] = None
 
-        self.img_star_yellow: Optional[pygame.Surface] = load_image(Settings.IMG_STAR_YELLOW)
-        self.img_star_black: Optional[pygame.Surface] = load_image(Settings.IMG_STAR_BLACK)
-
-        # Redimensiona as imagens das estrelas
+        # Estrelas já redimensionadas, do cache compartilhado
         star_size = (64, 64)
-        if self.img_star_yellow:
-            self.img_star_yellow = pygame.transform.smoothscale(self.img_star_yellow, star_size)
-        if self.img_star_black:
-            self.img_star_black = pygame.transform.smoothscale(self.img_star_black, star_size)
+        self.img_star_yellow: Optional[pygame.Surface] = ASSETS.get(
+            Settings.IMG_STAR_YELLOW, star_size, "smoothscale"
+        )
+        self.img_star_black: Optional[pygame.Surface] = ASSETS.get(
+            Settings.IMG_STAR_BLACK, star_size, "smoothscale"
+        )
 
         # Fonts
-        self.font_title = pygame.font.SysFont("arial", 60, bold=True)
-        self.font_subtitle = pygame.font.SysFont("arial", 36, bold=True)
-        self.font_text = pygame.font.SysFont("arial", 28)
-        self.font_button = pygame.font.SysFont("arial", 24)
+        self.font_title = FONTS.get("arial", 60, bold=True)
+        self.font_subtitle = FONTS.get("arial", 36, bold=True)
+        self.font_text = FONTS.get("arial", 28)
+        self.font_button = FONTS.get("arial", 24)
 
         # Botões
         self.btn_next = pygame.Rect(0, 0, 200, 60)
@@ -116,7 +117,7 @@ class VictoryScene(IScene):
         pygame.draw.rect(surface, color, rect, border_radius=10)
         pygame.draw.rect(surface, (255, 255, 255), rect, 2, border_radius=10)
 
-        txt = self.font_button.render(text, True, (255, 255, 255))
+        txt = TEXT_CACHE.render(self.font_button, text, (255, 255, 255))
         surface.blit(txt, txt.get_rect(center=rect.center))
 
     def render(self, surface: Any) -> None:
@@ -128,27 +129,27 @@ class VictoryScene(IScene):
         h = Settings.HEIGHT
 
         # Título
-        title = self.font_title.render("VITÓRIA!", True, (0, 255, 0))
+        title = TEXT_CACHE.render(self.font_title, "VITÓRIA!", (0, 255, 0))
         surface.blit(title, title.get_rect(center=(cx, int(h * 0.15))))
 
         # Estrelas
         self._draw_stars(surface, center_x=cx, base_y=int(h * 0.30))
 
         # Score
-        score_text = self.font_subtitle.render(
-            f"Score: {self.result.score}", True, (255, 255, 255)
+        score_text = TEXT_CACHE.render(
+            self.font_subtitle, f"Score: {self.result.score}", (255, 255, 255)
         )
         surface.blit(score_text, score_text.get_rect(center=(cx, int(h * 0.50))))
 
         # Tempo
-        time_text = self.font_text.render(
-            f"Tempo: {self.result.time_spent:.1f}s", True, (200, 200, 200)
+        time_text = TEXT_CACHE.render(
+            self.font_text, f"Tempo: {self.result.time_spent:.1f}s", (200, 200, 200)
         )
         surface.blit(time_text, time_text.get_rect(center=(cx, int(h * 0.60))))
 
         # Estrelas obtidas
-        stars_info = self.font_text.render(
-            f"({self.result.stars}/3)", True, (100, 100, 100)
+        stars_info = TEXT_CACHE.render(
+            self.font_text, f"({self.result.stars}/3)", (100, 100, 100)
         )
         surface.blit(stars_info, stars_info.get_rect(center=(cx, int(h * 0.68))))
 
@@ -0,0 +1,114 @@
+"""
+Fila de transferências pendentes com índice por ninho de origem.
+
+LevelScene.pending_transfers continua se comportando como uma lista de
+dicionários {origin, dest, remaining}, escrita pela cena, pela IA e por
+testes. A TransferQueue guarda essa lista mais uma contagem de transferências
+por origem, mantida a cada inserção/remoção, para que "este ninho já está
+enviando?" custe O(1) em vez de varrer a fila.
+
+É uma MutableSequence sobre uma lista interna: append, extend, remove, pop
+e += da classe base passam todos por insert/__delitem__, então não há
+caminho de mutação que pule a contagem.
+"""
+
+from typing import Dict, Iterable, Iterator, List, MutableSequence, Union, overload
+
+Transfer = Dict[str, int]
+
+
+class TransferQueue(MutableSequence[Transfer]):
+    """Lista de transferências que sabe quantas saem de cada ninho."""
+
+    def __init__(self, transfers: Iterable[Transfer] = ()) -> None:
+        self._items: List[Transfer] = []
+        self._by_origin: Dict[int, int] = {}
+        self.extend(transfers)
+
+    def has_origin(self, origin: int) -> bool:
+        return origin in self._by_origin
+
+    def count_from(self, origin: int) -> int:
+        return self._by_origin.get(origin, 0)
+
+    # -- leitura --
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Transfer]:
+        return iter(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> Transfer: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Transfer]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Transfer, List[Transfer]]:
+        return self._items[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TransferQueue):
+            return self._items == other._items
+        if isinstance(other, list):
+            return self._items == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TransferQueue({self._items!r})"
+
+    # -- mutações: mantêm a contagem por origem --
+    def insert(self, index: int, transfer: Transfer) -> None:
+        self._items.insert(index, transfer)
+        self._added(transfer)
+
+    def append(self, transfer: Transfer) -> None:
+        self._items.append(transfer)
+        self._added(transfer)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._by_origin.clear()
+
+    @overload
+    def __setitem__(self, index: int, value: Transfer) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[Transfer]) -> None: ...
+
+    def __setitem__(
+        self, index: Union[int, slice], value: Union[Transfer, Iterable[Transfer]]
+    ) -> None:
+        if isinstance(index, slice):
+            if isinstance(value, dict):
+                raise TypeError("atribuição por fatia exige um iterável de transferências")
+            self._items[index] = list(value)
+        else:
+            if not isinstance(value, dict):
+                raise TypeError("uma transferência é um dicionário")
+            self._items[index] = value
+        self._recount()
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if isinstance(index, slice):
+            del self._items[index]
+            self._recount()
+        else:
+            self._removed(self._items.pop(index))
+
+    def _added(self, transfer: Transfer) -> None:
+        origin = int(transfer["origin"])
+        self._by_origin[origin] = self._by_origin.get(origin, 0) + 1
+
+    def _removed(self, transfer: Transfer) -> None:
+        origin = int(transfer["origin"])
+        remaining = self._by_origin[origin] - 1
+        if remaining:
+            self._by_origin[origin] = remaining
+        else:
+            del self._by_origin[origin]
+
+    def _recount(self) -> None:
+        self._by_origin.clear()
+        for transfer in self._items:
+            self._added(transfer)
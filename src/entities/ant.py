@@ -1,9 +1,16 @@
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class AntType:
+    """
+    Atributos compartilhados (flyweight) de uma espécie de formiga.
+
+    Imutável; eq=False mantém igualdade/hash por identidade, já que cada tipo
+    é uma instância única (ver ant_types.py).
+    """
+
     name: str
     armor: float = 0.0
     poison_resistance: float = 0.0
@@ -17,29 +24,74 @@ class AntType:
     crit_multiplier: float = 1.5
 
 
+# Tipo usado quando nenhum AntType é informado
+GENERIC_ANT_TYPE = AntType(name="generic")
+
+
 class Ant:
+    """
+    Unidade individual. Guarda apenas o estado mutável por formiga (posição,
+    direção e um eventual ajuste de velocidade); os atributos de combate são
+    lidos do AntType compartilhado.
+    """
+
+    __slots__ = ("x", "y", "dir", "type", "_speed")
+
     def __init__(
         self, pos: Tuple[int, int], ant_type: Optional[AntType] = None
     ) -> None:
         self.x: float = float(pos[0])
         self.y: float = float(pos[1])
         self.dir: Tuple[float, float] = (1.0, 0.0)
+        self.type: AntType = ant_type or GENERIC_ANT_TYPE
+        # Velocidade própria (efeitos); None usa a do tipo
+        self._speed: Optional[float] = None
+
+    @property
+    def speed(self) -> float:
+        if self._speed is not None:
+            return self._speed
+        return float(self.type.speed)
+
+    @speed.setter
+    def speed(self, value: float) -> None:
+        self._speed = float(value)
+
+    @property
+    def armor(self) -> float:
+        return float(self.type.armor)
+
+    @property
+    def poison_resistance(self) -> float:
+        return float(self.type.poison_resistance)
+
+    @property
+    def attack_range(self) -> float:
+        return float(self.type.range)
+
+    @property
+    def dps(self) -> float:
+        return float(self.type.dps)
+
+    @property
+    def special_effect(self) -> Dict[str, Any]:
+        return self.type.special_effect or {}
 
-        # If provided, initialize stats from AntType, otherwise use defaults
-        if ant_type is None:
-            ant_type = AntType(name="generic")
+    @property
+    def aggressiveness(self) -> float:
+        return float(self.type.aggressiveness)
 
-        self.type = ant_type
-        self.speed = float(ant_type.speed)
-        self.armor = float(ant_type.armor)
-        self.poison_resistance = float(ant_type.poison_resistance)
-        self.attack_range = float(ant_type.range)
-        self.dps = float(ant_type.dps)
-        self.special_effect = ant_type.special_effect or {}
-        self.aggressiveness = float(ant_type.aggressiveness)
-        self.production_time = float(ant_type.production_time)
-        self.crit_chance = float(ant_type.crit_chance)
-        self.crit_multiplier = float(ant_type.crit_multiplier)
+    @property
+    def production_time(self) -> float:
+        return float(self.type.production_time)
+
+    @property
+    def crit_chance(self) -> float:
+        return float(self.type.crit_chance)
+
+    @property
+    def crit_multiplier(self) -> float:
+        return float(self.type.crit_multiplier)
 
     @property
     def pos(self) -> Tuple[float, float]:
@@ -47,3 +99,45 @@ class Ant:
 
     def __repr__(self) -> str:
         return f"Ant(type={self.type.name}, pos=({self.x:.1f},{self.y:.1f}))"
+
+
+class AntPool:
+    """
+    Pool de reciclagem de instâncias de Ant.
+
+    Formigas mortas (consumidas em combate) voltam para o pool e são
+    reaproveitadas por produção e despacho, reduzindo alocações e pausas do GC.
+    """
+
+    def __init__(self, max_size: int = 4096) -> None:
+        self.max_size = max_size
+        self._free: List[Ant] = []
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(
+        self, pos: Tuple[int, int], ant_type: Optional[AntType] = None
+    ) -> Ant:
+        """Retorna uma formiga reiniciada (reciclada se houver) na posição dada."""
+        if not self._free:
+            return Ant(pos, ant_type)
+        ant = self._free.pop()
+        ant.x = float(pos[0])
+        ant.y = float(pos[1])
+        ant.dir = (1.0, 0.0)
+        ant.type = ant_type or GENERIC_ANT_TYPE
+        ant._speed = None
+        return ant
+
+    def release(self, ant: Ant) -> None:
+        """Devolve uma formiga que não é mais referenciada por ninguém."""
+        if len(self._free) < self.max_size:
+            self._free.append(ant)
+
+    def clear(self) -> None:
+        self._free.clear()
+
+
+# Pool compartilhado pelo processo
+ANT_POOL = AntPool()
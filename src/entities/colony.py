@@ -1,6 +1,6 @@
-from .ant import Ant, AntType
+from .ant import ANT_POOL, GENERIC_ANT_TYPE, Ant, AntType
 from .nest import Nest
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 
 
 class Colony:
@@ -8,11 +8,20 @@ class Colony:
         self, nest_pos: Tuple[int, int], ant_type: Optional[AntType] = None
     ) -> None:
         self.nest = Nest(nest_pos)
-        self.ants: List[Ant] = []
         # Optional default type for newly produced ants
         self.default_ant_type: Optional[AntType] = ant_type
         # production tracking (seconds)
         self.production_progress: float = 0.0
+        self._init_units()
+
+    def _init_units(self) -> None:
+        """Cria o armazenamento vazio das unidades (uma lista de Ant)."""
+        self.ants: List[Ant] = []
+
+    @property
+    def ant_count(self) -> int:
+        """Número de formigas no ninho."""
+        return len(self.ants)
 
     def spawn_ant(
         self, pos: Optional[Tuple[int, int]] = None, ant_type: Optional[AntType] = None
@@ -20,7 +29,7 @@ class Colony:
         if pos is None:
             pos = self.nest.pos
         chosen_type = ant_type or self.default_ant_type
-        ant = Ant(pos, chosen_type)
+        ant = ANT_POOL.acquire(pos, chosen_type)
         self.ants.append(ant)
         return ant
 
@@ -36,12 +45,53 @@ class Colony:
             created.append(self.spawn_ant(pos, ant_type))
         return created
 
+    def add_units(self, count: int, ant_type: Optional[AntType] = None) -> None:
+        """
+        Acrescenta `count` unidades sem devolver objetos: produção e contagens
+        iniciais, em qualquer representação de colônia.
+        """
+        self.spawn_ants(count, self.nest.pos, ant_type)
+
+    def unit_counts(self) -> Dict[AntType, int]:
+        """Unidades no ninho por tipo."""
+        counts: Dict[AntType, int] = {}
+        for ant in self.ants:
+            counts[ant.type] = counts.get(ant.type, 0) + 1
+        return counts
+
+    def add_ant(self, ant: Ant) -> None:
+        """Recebe uma formiga que chegou ao ninho."""
+        self.ants.append(ant)
+
     def remove_ant(self) -> Optional[Ant]:
         """Remove e retorna uma formiga do ninho (se houver), ou None caso contrário."""
         if not self.ants:
             return None
         return self.ants.pop()
 
+    def remove_ants(self, count: int) -> List[Ant]:
+        """Remove até `count` formigas do ninho e retorna as removidas."""
+        removed: List[Ant] = []
+        for _ in range(count):
+            ant = self.remove_ant()
+            if ant is None:
+                break
+            removed.append(ant)
+        return removed
+
+    def kill_ant(self) -> bool:
+        """Elimina um defensor em combate. Retorna False se o ninho estava vazio."""
+        if not self.ants:
+            return False
+        ANT_POOL.release(self.ants.pop())
+        return True
+
+    def _fallback_ant_type(self) -> Optional[AntType]:
+        # usa o tipo da primeira formiga, se disponível
+        if self.ants:
+            return getattr(self.ants[0], "type", None)
+        return None
+
     def update(self, dt: float) -> int:
         """Atualiza produção no ninho.
 
@@ -50,10 +100,7 @@ class Colony:
         """
         produced = 0
         # Determina tempo de produção baseado no tipo de formiga padrão
-        ant_type = self.default_ant_type
-        if not ant_type and self.ants:
-            # usa o tipo da primeira formiga, se disponível
-            ant_type = getattr(self.ants[0], "type", None)
+        ant_type = self.default_ant_type or self._fallback_ant_type()
 
         if ant_type is None:
             return produced
@@ -63,13 +110,112 @@ class Colony:
             return produced
 
         # Se houver ao menos uma formiga, acumula progresso
-        if len(self.ants) > 0:
+        if self.ant_count > 0:
             self.production_progress += dt
 
         while self.production_progress >= production_time:
             self.production_progress -= production_time
-            # produz nova formiga do mesmo tipo
-            self.spawn_ant(self.nest.pos, ant_type)
             produced += 1
 
+        if produced:
+            # produz novas formigas do mesmo tipo
+            self.add_units(produced, ant_type)
+
         return produced
+
+
+class CountedColony(Colony):
+    """
+    Colônia que guarda apenas contagens por AntType em vez de um Ant por unidade.
+
+    As unidades ficam em "corridas" (tipo, quantidade) na ordem de chegada, de
+    modo que remoções seguem a mesma ordem LIFO da lista de Colony. Um Ant real
+    só é criado quando uma unidade sai do ninho (remove_ant/remove_ants).
+
+    Não há objetos Ant guardados: `ants`, spawn_ant e spawn_ants levantam erro;
+    use ant_count, unit_counts e add_units.
+    """
+
+    def _init_units(self) -> None:
+        self._run_types: List[AntType] = []
+        self._run_counts: List[int] = []
+        self._count: int = 0
+
+    @property
+    def ants(self) -> List[Ant]:
+        raise AttributeError(
+            "CountedColony não guarda objetos Ant; use ant_count ou unit_counts()."
+        )
+
+    @ants.setter
+    def ants(self, value: List[Ant]) -> None:
+        raise AttributeError("CountedColony não guarda objetos Ant; use add_units().")
+
+    @property
+    def ant_count(self) -> int:
+        return self._count
+
+    def _resolve_type(self, ant_type: Optional[AntType]) -> AntType:
+        # Mesmo comportamento de Ant(pos, None): tipo genérico
+        return ant_type or self.default_ant_type or GENERIC_ANT_TYPE
+
+    def _push(self, ant_type: AntType, amount: int) -> None:
+        if amount <= 0:
+            return
+        if self._run_types and self._run_types[-1] is ant_type:
+            self._run_counts[-1] += amount
+        else:
+            self._run_types.append(ant_type)
+            self._run_counts.append(amount)
+        self._count += amount
+
+    def _pop(self) -> AntType:
+        ant_type = self._run_types[-1]
+        self._run_counts[-1] -= 1
+        if self._run_counts[-1] == 0:
+            self._run_types.pop()
+            self._run_counts.pop()
+        self._count -= 1
+        return ant_type
+
+    def spawn_ant(
+        self, pos: Optional[Tuple[int, int]] = None, ant_type: Optional[AntType] = None
+    ) -> Ant:
+        raise TypeError("CountedColony não devolve formigas criadas; use add_units().")
+
+    def spawn_ants(
+        self,
+        count: int,
+        pos: Optional[Tuple[int, int]] = None,
+        ant_type: Optional[AntType] = None,
+    ) -> List[Ant]:
+        raise TypeError("CountedColony não devolve formigas criadas; use add_units().")
+
+    def add_units(self, count: int, ant_type: Optional[AntType] = None) -> None:
+        """Incrementa a contagem em lote, sem criar objetos Ant."""
+        self._push(self._resolve_type(ant_type), count)
+
+    def unit_counts(self) -> Dict[AntType, int]:
+        counts: Dict[AntType, int] = {}
+        for ant_type, amount in zip(self._run_types, self._run_counts):
+            counts[ant_type] = counts.get(ant_type, 0) + amount
+        return counts
+
+    def add_ant(self, ant: Ant) -> None:
+        # A unidade vira contagem; a instância volta para o pool
+        self._push(ant.type, 1)
+        ANT_POOL.release(ant)
+
+    def remove_ant(self) -> Optional[Ant]:
+        if self._count == 0:
+            return None
+        return ANT_POOL.acquire(self.nest.pos, self._pop())
+
+    def kill_ant(self) -> bool:
+        if self._count == 0:
+            return False
+        self._pop()
+        return True
+
+    def _fallback_ant_type(self) -> Optional[AntType]:
+        return self._run_types[0] if self._run_types else None
@@ -22,6 +22,8 @@ from src.core.levels_campaign import create_level_1_config
 from src.core.level_scene import LevelScene
 from src.core.level_config import LevelConfig
 from src.core.scenes.title_scene import TitleScene
+from src.rendering.sprite_renderer import SpriteRenderer
+from src.utils.asset_cache import ASSETS
 from src.utils.logging_config import configure_logging
 
 from src.adapters.headless_adapter import HeadlessClock, HeadlessInput, HeadlessRenderer
@@ -53,7 +55,12 @@ def create_adapters(config: AppConfig) -> Tuple[IClock, IInputHandler, IRenderer
         )
     else:
         logger.info("Inicializando Headless Adapters...")
-        return (HeadlessClock(fixed_dt=0.016), HeadlessInput(), HeadlessRenderer())
+        # Um quadro headless equivale a exatamente um tick fixo da simulação
+        return (
+            HeadlessClock(fixed_dt=1.0 / config.fps),
+            HeadlessInput(),
+            HeadlessRenderer(),
+        )
 
 
 def get_initial_scene(config: AppConfig, renderer: IRenderer) -> IScene:
@@ -133,6 +140,15 @@ def main() -> int:
     game_settings = Settings()
     campaign = CampaignManager(game_settings)
 
+    # Decodifica sprites e estrelas uma vez; trocas de cena não leem o disco
+    ASSETS.preload(
+        SpriteRenderer.asset_requests(game_settings)
+        + [
+            (game_settings.IMG_STAR_YELLOW, (64, 64), "smoothscale"),
+            (game_settings.IMG_STAR_BLACK, (64, 64), "smoothscale"),
+        ]
+    )
+
     # Cena Inicial
     current_scene = get_initial_scene(config, renderer)
     engine.set_scene(current_scene)
@@ -0,0 +1,102 @@
+"""
+Câmera 2D (pan e zoom) sobre o mundo da fase.
+
+O mundo pode ser maior que a tela. A câmera guarda o canto superior esquerdo
+da região visível (em coordenadas do mundo) e o zoom, converte pontos entre
+tela e mundo e informa o retângulo visível usado para o culling. O zoom anda
+em passos fixos, o que permite cachear sprites escalados por passo.
+"""
+
+from typing import Optional, Tuple
+
+# (esquerda, topo, direita, base) em coordenadas do mundo
+Bounds = Tuple[float, float, float, float]
+
+
+class Camera:
+    """Viewport sobre o mundo; com mundo do tamanho da tela é a identidade."""
+
+    ZOOM_STEPS: Tuple[float, ...] = (0.5, 0.75, 1.0, 1.5, 2.0)
+
+    def __init__(
+        self,
+        viewport_size: Tuple[int, int],
+        world_size: Optional[Tuple[int, int]] = None,
+        zoom: float = 1.0,
+    ) -> None:
+        self.viewport_w, self.viewport_h = (int(v) for v in viewport_size)
+        world = world_size or viewport_size
+        self.world_w, self.world_h = (int(v) for v in world)
+        if zoom not in self.ZOOM_STEPS:
+            raise ValueError(f"zoom deve ser um de {self.ZOOM_STEPS} (recebido {zoom}).")
+        self.zoom = zoom
+        self.x = 0.0
+        self.y = 0.0
+        # Incrementada a cada mudança de enquadramento (invalida camadas cacheadas)
+        self.version = 0
+        self._clamp()
+
+    @property
+    def is_identity(self) -> bool:
+        return self.zoom == 1.0 and self.x == 0.0 and self.y == 0.0
+
+    def world_to_screen(self, x: float, y: float) -> Tuple[float, float]:
+        return ((x - self.x) * self.zoom, (y - self.y) * self.zoom)
+
+    def screen_to_world(self, sx: float, sy: float) -> Tuple[float, float]:
+        return (sx / self.zoom + self.x, sy / self.zoom + self.y)
+
+    def visible_bounds(self) -> Bounds:
+        """Região do mundo coberta pela tela."""
+        return (
+            self.x,
+            self.y,
+            self.x + self.viewport_w / self.zoom,
+            self.y + self.viewport_h / self.zoom,
+        )
+
+    def pan(self, dx: float, dy: float) -> None:
+        """Desloca a vista em pixels de tela."""
+        self._move_to(self.x + dx / self.zoom, self.y + dy / self.zoom)
+
+    def center_on(self, x: float, y: float) -> None:
+        self._move_to(
+            x - self.viewport_w / (2 * self.zoom), y - self.viewport_h / (2 * self.zoom)
+        )
+
+    def zoom_by(self, steps: int, anchor: Optional[Tuple[float, float]] = None) -> None:
+        """
+        Avança `steps` passos de zoom (negativo afasta), mantendo fixo o ponto
+        do mundo sob `anchor` (posição na tela; padrão: centro da tela).
+        """
+        index = self.ZOOM_STEPS.index(self.zoom) + steps
+        zoom = self.ZOOM_STEPS[max(0, min(len(self.ZOOM_STEPS) - 1, index))]
+        if zoom == self.zoom:
+            return
+        sx, sy = anchor if anchor is not None else (self.viewport_w / 2, self.viewport_h / 2)
+        wx, wy = self.screen_to_world(sx, sy)
+        self.zoom = zoom
+        self.x = wx - sx / zoom
+        self.y = wy - sy / zoom
+        self._clamp()
+        self.version += 1
+
+    def _move_to(self, x: float, y: float) -> None:
+        old = (self.x, self.y)
+        self.x, self.y = x, y
+        self._clamp()
+        if (self.x, self.y) != old:
+            self.version += 1
+
+    def _clamp(self) -> None:
+        # Mantém a vista dentro do mundo; se o mundo for menor que a vista, centraliza
+        view_w = self.viewport_w / self.zoom
+        view_h = self.viewport_h / self.zoom
+        if self.world_w >= view_w:
+            self.x = min(max(self.x, 0.0), self.world_w - view_w)
+        else:
+            self.x = (self.world_w - view_w) / 2
+        if self.world_h >= view_h:
+            self.y = min(max(self.y, 0.0), self.world_h - view_h)
+        else:
+            self.y = (self.world_h - view_h) / 2
@@ -0,0 +1,57 @@
+"""
+Apresentação por retângulos sujos.
+
+Quando a DrawList tem um fundo estático (set_background) com a mesma chave
+do quadro anterior, só as regiões ocupadas pelos comandos dinâmicos do
+quadro anterior e do atual mudam: o fundo é restaurado sob as antigas, os
+comandos são desenhados e apenas esses retângulos vão para
+pygame.display.update.
+"""
+
+from typing import Hashable, List, Optional
+
+import pygame
+
+from src.rendering.draw_list import DrawList
+
+_NO_BACKGROUND = object()
+
+
+class DirtyRectTracker:
+    """Guarda os retângulos desenhados no quadro anterior sobre o mesmo fundo."""
+
+    def __init__(self) -> None:
+        self._background_key: Hashable = _NO_BACKGROUND
+        self._previous: List[pygame.Rect] = []
+
+    def reset(self) -> None:
+        """Força um redesenho completo no próximo quadro (ex.: troca de cena)."""
+        self._background_key = _NO_BACKGROUND
+        self._previous = []
+
+    def submit(
+        self, draw_list: DrawList, target: pygame.Surface
+    ) -> Optional[List[pygame.Rect]]:
+        """
+        Desenha a lista no destino. Retorna os retângulos a atualizar, ou None
+        quando a tela inteira mudou (use display.flip).
+        """
+        background = draw_list.background
+        if (
+            background is None
+            or draw_list.background_key != self._background_key
+            # callbacks desenham regiões desconhecidas
+            or draw_list.has_callbacks()
+        ):
+            self._previous = draw_list.submit(target, collect=True)
+            self._background_key = (
+                draw_list.background_key if background is not None else _NO_BACKGROUND
+            )
+            return None
+
+        previous = self._previous
+        for rect in previous:
+            target.blit(background, rect, rect)
+        drawn = draw_list.submit(target, draw_background=False, collect=True)
+        self._previous = drawn
+        return previous + drawn
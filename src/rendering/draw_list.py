@@ -0,0 +1,173 @@
+"""
+Buffer de comandos de desenho por quadro.
+
+As cenas registram blits e primitivas em uma DrawList em vez de desenhar
+direto na tela. O renderer submete tudo de uma vez: camada por camada, com
+os blits agrupados por textura e enviados em lote via Surface.blits. Sem
+tela, a mesma lista pode ser apenas contada ou resumida em um checksum.
+"""
+
+import zlib
+from enum import IntEnum
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import pygame
+
+Color = Sequence[int]
+BlitItem = Tuple[pygame.Surface, Tuple[int, int]]
+# (cor, centro, raio, espessura)
+CircleCommand = Tuple[Color, Tuple[int, int], int, int]
+DrawCallback = Callable[[pygame.Surface], None]
+
+
+class DrawLayer(IntEnum):
+    """Ordem de composição: camadas menores são desenhadas primeiro."""
+
+    BACKGROUND = 0
+    NESTS = 10
+    DECALS = 20
+    LABELS = 30
+    ANTS = 40
+    # Glifos de comboio (LOD) e suas contagens, acima das formigas individuais
+    CONVOYS = 50
+    CONVOY_LABELS = 60
+    OVERLAY = 100
+
+
+class DrawList:
+    """
+    Lista de comandos de um quadro, agrupada por camada.
+
+    Dentro de uma camada, os blits são desenhados primeiro (ordenados por
+    textura), depois os círculos e por fim os callbacks, na ordem de registro.
+    """
+
+    def __init__(self) -> None:
+        self.fill_color: Optional[Color] = None
+        # Camada estática pré-composta (substitui o fill) e sua versão
+        self.background: Optional[pygame.Surface] = None
+        self.background_key: Hashable = None
+        self._blits: Dict[int, List[BlitItem]] = {}
+        self._circles: Dict[int, List[CircleCommand]] = {}
+        self._callbacks: Dict[int, List[DrawCallback]] = {}
+
+    def __len__(self) -> int:
+        return (
+            sum(len(items) for items in self._blits.values())
+            + sum(len(items) for items in self._circles.values())
+            + sum(len(items) for items in self._callbacks.values())
+        )
+
+    def clear(self) -> None:
+        """Esvazia a lista para o próximo quadro (reaproveita os dicionários)."""
+        self.fill_color = None
+        self.background = None
+        self.background_key = None
+        for items in self._blits.values():
+            items.clear()
+        for circles in self._circles.values():
+            circles.clear()
+        for callbacks in self._callbacks.values():
+            callbacks.clear()
+
+    def fill(self, color: Color) -> None:
+        self.fill_color = color
+
+    def set_background(self, surface: pygame.Surface, key: Hashable) -> None:
+        """
+        Usa uma superfície de tela cheia como fundo. `key` muda sempre que o
+        conteúdo do fundo muda (permite redesenho parcial por dirty rects).
+        """
+        self.background = surface
+        self.background_key = key
+
+    def has_callbacks(self) -> bool:
+        return any(self._callbacks.values())
+
+    def blit(self, surface: pygame.Surface, dest: Tuple[int, int], layer: int) -> None:
+        items = self._blits.get(layer)
+        if items is None:
+            items = self._blits[layer] = []
+        items.append((surface, dest))
+
+    def circle(
+        self,
+        color: Color,
+        center: Tuple[int, int],
+        radius: int,
+        width: int = 0,
+        layer: int = DrawLayer.DECALS,
+    ) -> None:
+        circles = self._circles.get(layer)
+        if circles is None:
+            circles = self._circles[layer] = []
+        circles.append((color, center, radius, width))
+
+    def custom(self, callback: DrawCallback, layer: int = DrawLayer.OVERLAY) -> None:
+        """Desenho arbitrário (ex.: overlays de texto rico) executado na sua camada."""
+        callbacks = self._callbacks.get(layer)
+        if callbacks is None:
+            callbacks = self._callbacks[layer] = []
+        callbacks.append(callback)
+
+    def _layers(self) -> List[int]:
+        return sorted(set(self._blits) | set(self._circles) | set(self._callbacks))
+
+    def submit(
+        self,
+        target: pygame.Surface,
+        draw_background: bool = True,
+        collect: bool = False,
+    ) -> List[pygame.Rect]:
+        """
+        Desenha todos os comandos no destino.
+
+        Com collect=True, retorna os retângulos afetados pelos blits e círculos
+        (sem fundo nem callbacks).
+        """
+        if draw_background:
+            if self.background is not None:
+                target.blit(self.background, (0, 0))
+            elif self.fill_color is not None:
+                target.fill(self.fill_color)
+        drawn: List[pygame.Rect] = []
+        draw_circle = pygame.draw.circle
+        for layer in self._layers():
+            items = self._blits.get(layer)
+            if items:
+                # Agrupa por textura; a ordenação é estável dentro de cada uma
+                items.sort(key=_texture_key)
+                if collect:
+                    drawn.extend(target.blits(items) or ())
+                else:
+                    target.blits(items, doreturn=False)
+            for color, center, radius, width in self._circles.get(layer, ()):
+                rect = draw_circle(target, color, center, radius, width)
+                if collect:
+                    drawn.append(rect)
+            for callback in self._callbacks.get(layer, ()):
+                callback(target)
+        return drawn
+
+    def checksum(self) -> int:
+        """Resumo (CRC32) dos comandos, sem desenhar: útil em modo headless."""
+        crc = 0
+        if self.background is not None:
+            crc = zlib.crc32(repr(("background", self.background_key)).encode(), crc)
+        if self.fill_color is not None:
+            crc = zlib.crc32(repr(tuple(self.fill_color)).encode(), crc)
+        for layer in self._layers():
+            for surface, dest in self._blits.get(layer, ()):
+                blit_entry = (layer, surface.get_size(), tuple(dest))
+                crc = zlib.crc32(repr(blit_entry).encode(), crc)
+            for color, center, radius, width in self._circles.get(layer, ()):
+                circle_entry = (layer, tuple(color), tuple(center), radius, width)
+                crc = zlib.crc32(repr(circle_entry).encode(), crc)
+            crc = zlib.crc32(
+                repr((layer, len(self._callbacks.get(layer, ())))).encode(), crc
+            )
+        return crc
+
+
+def _texture_key(item: BlitItem) -> int:
+    return id(item[0])
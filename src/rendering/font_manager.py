@@ -0,0 +1,162 @@
+"""
+Registro de fontes do processo.
+
+pygame.font.SysFont varre a lista de fontes do sistema a cada chamada. O
+FontManager resolve cada (família, negrito, itálico) uma única vez, guarda o
+caminho do arquivo em um JSON no diretório de cache do usuário (reaproveitado
+entre execuções) e mantém um Font carregado por (família, tamanho, negrito,
+itálico). Famílias não encontradas só ficam em memória: uma fonte instalada
+depois é encontrada na próxima execução.
+"""
+
+import json
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+# (caminho do arquivo ou None = fonte padrão, negrito sintético, itálico sintético)
+ResolvedFont = Tuple[Optional[str], bool, bool]
+FontKey = Tuple[Optional[str], int, bool, bool]
+
+APP_NAME = "bug-wars"
+
+
+def user_cache_dir(app_name: str = APP_NAME) -> Path:
+    """Diretório de cache por usuário (mesmas convenções do platformdirs)."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+        return Path(base) / app_name / "Cache"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / app_name
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / app_name
+
+
+DEFAULT_CACHE_FILE = user_cache_dir() / "font_paths.json"
+
+
+class FontManager:
+    """Carrega cada fonte uma vez por processo com a mesma escolha de SysFont."""
+
+    def __init__(self, cache_file: Optional[Path] = DEFAULT_CACHE_FILE) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.cache_file = Path(cache_file) if cache_file is not None else None
+        self._fonts: Dict[FontKey, pygame.font.Font] = {}
+        self._resolved: Dict[str, ResolvedFont] = self._load_cache()
+        self._quit_hook_registered = False
+
+    def get(
+        self,
+        family: Optional[str],
+        size: int,
+        bold: bool = False,
+        italic: bool = False,
+    ) -> pygame.font.Font:
+        """Equivalente a pygame.font.SysFont(family, size, bold, italic), com cache."""
+        key = (family, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is not None:
+            return font
+
+        if not pygame.font.get_init():
+            pygame.font.init()
+        self._register_quit_hook()
+
+        path, fake_bold, fake_italic = self._resolve(family, bold, italic)
+        font = pygame.font.Font(path, size)
+        if fake_bold:
+            font.set_bold(True)
+        if fake_italic:
+            font.set_italic(True)
+        self._fonts[key] = font
+        return font
+
+    def clear(self) -> None:
+        """Descarta os Fonts carregados (os caminhos resolvidos continuam)."""
+        self._fonts.clear()
+
+    def _resolve(self, family: Optional[str], bold: bool, italic: bool) -> ResolvedFont:
+        if not family:
+            # SysFont(None, ...) usa a fonte padrão do pygame
+            return (None, bold, italic)
+        cache_key = f"{family.lower()}|{int(bold)}|{int(italic)}"
+        resolved = self._resolved.get(cache_key)
+        if resolved is not None and (resolved[0] is None or Path(resolved[0]).exists()):
+            return resolved
+
+        # Varredura lenta, feita uma vez: reaproveita a escolha do próprio SysFont
+        choice: Dict[str, ResolvedFont] = {}
+
+        def capture(
+            path: Optional[str], size: int, set_bold: bool, set_italic: bool
+        ) -> pygame.font.Font:
+            choice["font"] = (path, set_bold, set_italic)
+            return pygame.font.Font(path, size)
+
+        pygame.font.SysFont(family, 1, bold, italic, constructor=capture)
+        resolved = choice["font"]
+        self._resolved[cache_key] = resolved
+        # Caminho None = família não encontrada (fonte padrão): não persiste
+        if resolved[0] is not None:
+            self._save_cache()
+        return resolved
+
+    def _register_quit_hook(self) -> None:
+        # Fonts ficam inválidos após pygame.quit(); limpa para recarregar
+        if self._quit_hook_registered:
+            return
+        self._quit_hook_registered = True
+        pygame.register_quit(self._on_pygame_quit)
+
+    def _on_pygame_quit(self) -> None:
+        self._fonts.clear()
+        self._quit_hook_registered = False
+
+    def _load_cache(self) -> Dict[str, ResolvedFont]:
+        if self.cache_file is None or not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return {
+                key: (entry[0], bool(entry[1]), bool(entry[2]))
+                for key, entry in data.items()
+                if entry[0] is not None
+            }
+        except (json.JSONDecodeError, IOError, TypeError, IndexError, AttributeError) as e:
+            self.logger.warning("Cache de fontes inválido (%s); ignorando.", e)
+            return {}
+
+    def _save_cache(self) -> None:
+        if self.cache_file is None:
+            return
+        found = {key: list(entry) for key, entry in self._resolved.items() if entry[0]}
+        tmp_path: Optional[str] = None
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Escreve em um temporário e troca atomicamente: processos em
+            # paralelo (batch de partidas) nunca leem um JSON pela metade
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=self.cache_file.name, suffix=".tmp", dir=self.cache_file.parent
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(found, f, indent=2)
+            os.replace(tmp_path, self.cache_file)
+            tmp_path = None
+        except OSError as e:
+            self.logger.warning("Não foi possível salvar o cache de fontes: %s", e)
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+
+# Registro compartilhado pelo processo
+FONTS = FontManager()
@@ -0,0 +1,107 @@
+"""
+Nível de detalhe (LOD) para exércitos grandes.
+
+Com milhares de formigas em trânsito, desenhar um sprite por formiga fica
+ilegível e caro. Acima de uma densidade de formigas na tela, as formigas de
+um mesmo fluxo (origem, destino, dono) são agrupadas em trechos ao longo da
+direção do fluxo e cada trecho vira um único glifo de comboio com a contagem.
+O número de glifos depende do comprimento dos fluxos na tela, não do número
+de formigas.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.core.nest_geometry import NestGeometry
+from src.systems.moving_ants import MovingAntStore
+
+# (ninho de origem, ninho de destino, código do dono)
+StreamKey = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class Convoy:
+    """Trecho agregado de um fluxo: posição média, contagem e um slot de amostra."""
+
+    x: float
+    y: float
+    count: int
+    sample_slot: int
+
+
+def lod_active(
+    visible_ants: int,
+    screen_size: Tuple[int, int],
+    zoom: float,
+    density_threshold: float,
+    max_zoom: float,
+) -> bool:
+    """
+    Indica se o render deve agregar comboios: densidade (formigas visíveis por
+    bloco de 100x100 px de tela) acima do limite e zoom até max_zoom.
+    """
+    if zoom > max_zoom:
+        return False
+    blocks = max(1.0, screen_size[0] * screen_size[1] / 10000.0)
+    return visible_ants / blocks > density_threshold
+
+
+def build_convoys(
+    store: MovingAntStore,
+    slots: Iterable[int],
+    spacing: float,
+    min_stream: int,
+    geometry: Optional[NestGeometry] = None,
+) -> Tuple[List[Convoy], List[int]]:
+    """
+    Agrupa os slots dados por fluxo. Fluxos com ao menos `min_stream` formigas
+    viram comboios (um por trecho de `spacing` px ao longo do fluxo); os demais
+    slots são devolvidos, em ordem crescente, para desenho individual. Com a
+    tabela de geometria da fase, a direção do fluxo vem dela.
+    """
+    origins, dests, owners = store.origin_index, store.dest_index, store.owner
+    streams: Dict[StreamKey, List[int]] = {}
+    for slot in slots:
+        key = (origins[slot], dests[slot], owners[slot])
+        members = streams.get(key)
+        if members is None:
+            streams[key] = [slot]
+        else:
+            members.append(slot)
+
+    xs, ys = store.x, store.y
+    convoys: List[Convoy] = []
+    singles: List[int] = []
+    for key in sorted(streams):
+        members = streams[key]
+        if len(members) < min_stream:
+            singles.extend(members)
+            continue
+        # Todas as formigas do fluxo têm a mesma direção: projeta nela
+        if geometry is not None:
+            ux, uy = geometry.direction(key[0], key[1])
+        else:
+            first = members[0]
+            vx, vy = store.vx[first], store.vy[first]
+            norm = math.hypot(vx, vy) or 1.0
+            ux, uy = vx / norm, vy / norm
+        # trecho -> [soma x, soma y, contagem, slot de amostra]
+        bins: Dict[int, List[float]] = {}
+        for slot in members:
+            x, y = xs[slot], ys[slot]
+            index = math.floor((x * ux + y * uy) / spacing)
+            acc = bins.get(index)
+            if acc is None:
+                bins[index] = [x, y, 1, slot]
+            else:
+                acc[0] += x
+                acc[1] += y
+                acc[2] += 1
+        for index in sorted(bins):
+            sum_x, sum_y, count, sample = bins[index]
+            convoys.append(
+                Convoy(sum_x / count, sum_y / count, int(count), int(sample))
+            )
+    singles.sort()
+    return convoys, singles
@@ -0,0 +1,68 @@
+"""
+Cache de sprites pré-rotacionados.
+
+O ângulo de uma formiga não muda durante o voo, então rotacionar o frame a
+cada quadro só gera Surfaces descartáveis. Aqui os ângulos são quantizados em
+um número fixo de "buckets" e cada (tipo, frame, bucket) é rotacionado uma
+única vez, com limite de memória e descarte LRU.
+"""
+
+from collections import OrderedDict
+from typing import Hashable, Tuple
+
+import pygame
+
+RotationKey = Tuple[Hashable, int, int]
+
+
+class RotatedSpriteCache:
+    """LRU de Surfaces rotacionadas, limitado por bytes de pixels."""
+
+    def __init__(self, buckets: int = 72, max_bytes: int = 16 * 1024 * 1024) -> None:
+        if buckets <= 0:
+            raise ValueError("buckets deve ser positivo")
+        self.buckets = buckets
+        self.step = 360.0 / buckets
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[RotationKey, pygame.Surface]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def bucket_of(self, angle: float) -> int:
+        return int(round(angle / self.step)) % self.buckets
+
+    def get(
+        self, sprite_key: Hashable, frame_index: int, frame: pygame.Surface, angle: float
+    ) -> pygame.Surface:
+        """Frame rotacionado por -angle (quantizado), criado na primeira vez."""
+        bucket = self.bucket_of(angle)
+        key = (sprite_key, frame_index, bucket)
+        entries = self._entries
+        rotated = entries.get(key)
+        if rotated is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return rotated
+
+        self.misses += 1
+        rotated = pygame.transform.rotate(frame, -bucket * self.step)
+        entries[key] = rotated
+        self.bytes_used += self._size_of(rotated)
+        # Mantém sempre ao menos a entrada recém-criada
+        while self.bytes_used > self.max_bytes and len(entries) > 1:
+            _, evicted = entries.popitem(last=False)
+            self.bytes_used -= self._size_of(evicted)
+        return rotated
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes_used = 0
+
+    @staticmethod
+    def _size_of(surface: pygame.Surface) -> int:
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
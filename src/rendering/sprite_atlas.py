@@ -0,0 +1,152 @@
+"""
+Atlas de sprites.
+
+Os sprites de formigas e ninhos, já escalados para ANT_SIZE/NEST_SIZE, ficam
+empacotados em uma única imagem (gerada por src/scripts/build_atlas.py) com um
+índice JSON de retângulos. O SpriteRenderer decodifica a imagem uma vez e
+entrega subsurfaces, em vez de ler e escalar dezenas de arquivos.
+"""
+
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import pygame
+
+from src.utils.asset_cache import ASSETS
+
+ATLAS_FORMAT_VERSION = 1
+
+# x, y, largura, altura dentro da imagem do atlas
+AtlasRect = Tuple[int, int, int, int]
+
+
+def pack_shelves(
+    sizes: Mapping[str, Tuple[int, int]], max_width: int = 512, padding: int = 1
+) -> Tuple[Dict[str, AtlasRect], Tuple[int, int]]:
+    """
+    Empacota retângulos em prateleiras (mais altos primeiro, ordem estável por
+    nome). Retorna a posição de cada nome e o tamanho final do atlas.
+    """
+    order = sorted(sizes, key=lambda name: (-sizes[name][1], name))
+    rects: Dict[str, AtlasRect] = {}
+    x = y = shelf_height = width = 0
+    for name in order:
+        w, h = sizes[name]
+        if x > 0 and x + w > max_width:
+            y += shelf_height + padding
+            x = shelf_height = 0
+        rects[name] = (x, y, w, h)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+        width = max(width, x - padding)
+    return rects, (max(1, width), max(1, y + shelf_height))
+
+
+def build_atlas(
+    images: Mapping[str, pygame.Surface], max_width: int = 512, padding: int = 1
+) -> Tuple[pygame.Surface, Dict[str, AtlasRect]]:
+    """Copia as imagens (pixels exatos, com alpha) para uma única superfície."""
+    rects, size = pack_shelves(
+        {name: image.get_size() for name, image in images.items()}, max_width, padding
+    )
+    atlas = pygame.Surface(size, pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    for name, (x, y, _, _) in rects.items():
+        # ADD sobre fundo zerado copia RGBA sem misturar com o alpha
+        atlas.blit(images[name], (x, y), special_flags=pygame.BLEND_RGBA_ADD)
+    return atlas, rects
+
+
+class SpriteAtlas:
+    """Imagem do atlas decodificada uma vez, com subsurfaces por nome."""
+
+    def __init__(self, image: pygame.Surface, rects: Mapping[str, AtlasRect]) -> None:
+        self.image = image
+        self.rects = dict(rects)
+        self._frames: Dict[str, pygame.Surface] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.rects
+
+    def names(self) -> List[str]:
+        return sorted(self.rects)
+
+    def get(self, name: str) -> Optional[pygame.Surface]:
+        frame = self._frames.get(name)
+        if frame is None:
+            rect = self.rects.get(name)
+            if rect is None:
+                return None
+            frame = self.image.subsurface(pygame.Rect(rect))
+            self._frames[name] = frame
+        return frame
+
+    @classmethod
+    def load(
+        cls,
+        index_path: Path,
+        ant_size: Tuple[int, int],
+        nest_size: Tuple[int, int],
+    ) -> Optional["SpriteAtlas"]:
+        """
+        Carrega o atlas descrito pelo índice. Retorna None se não existir, for
+        de outra versão ou tiver sido gerado para outros tamanhos de sprite.
+        """
+        index = _read_index(str(index_path))
+        if index is None:
+            return None
+        if (
+            index.get("version") != ATLAS_FORMAT_VERSION
+            or tuple(index.get("ant_size", ())) != tuple(ant_size)
+            or tuple(index.get("nest_size", ())) != tuple(nest_size)
+        ):
+            logging.getLogger(__name__).warning(
+                "Atlas %s desatualizado; usando os arquivos individuais.", index_path
+            )
+            return None
+        image = ASSETS.get(Path(index_path).parent / index["image"])
+        if image is None:
+            return None
+        return cls(image, {name: tuple(rect) for name, rect in index["frames"].items()})
+
+
+def write_index(
+    index_path: Path,
+    image_name: str,
+    rects: Mapping[str, AtlasRect],
+    ant_size: Tuple[int, int],
+    nest_size: Tuple[int, int],
+) -> None:
+    header = {
+        "version": ATLAS_FORMAT_VERSION,
+        "image": image_name,
+        "ant_size": list(ant_size),
+        "nest_size": list(nest_size),
+    }
+    # Um retângulo por linha: o índice continua legível em diffs
+    lines = [f"  {json.dumps(key)}: {json.dumps(value)}," for key, value in header.items()]
+    frames = [f"    {json.dumps(name)}: {json.dumps(list(rects[name]))}" for name in sorted(rects)]
+    with open(index_path, "w", encoding="utf-8") as f:
+        f.write("{\n" + "\n".join(lines) + '\n  "frames": {\n')
+        f.write(",\n".join(frames) + "\n  }\n}\n")
+
+
+@lru_cache(maxsize=8)
+def _read_index(index_path: str) -> Optional[Dict[str, Any]]:
+    # Lido uma vez por processo; trocas de cena não voltam ao disco
+    path = Path(index_path)
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        logging.getLogger(__name__).warning("Índice do atlas inválido (%s).", e)
+        return None
+    if not isinstance(data, dict):
+        logging.getLogger(__name__).warning("Índice do atlas inválido (não é um objeto).")
+        return None
+    return data
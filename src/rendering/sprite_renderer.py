@@ -1,45 +1,98 @@
 import logging
-from typing import Optional, Tuple, Dict
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Tuple
 import pygame
 from src.config.settings import Settings
-from src.utils.asset_loader import load_image
+from src.utils.asset_cache import ASSETS, AssetRequest
+from src.rendering.rotation_cache import RotatedSpriteCache
+from src.rendering.sprite_atlas import SpriteAtlas
+from src.rendering.draw_list import DrawLayer, DrawList
+from src.rendering.text_cache import TEXT_CACHE
 from src.entities.ant_types import ALL_ANT_TYPES
 
+NEST_FILES = ("formigueiro_aliado.png", "formigueiro_vazio.png", "formigueiro_inimigo.png")
+ANT_ANIMATION_FRAMES = 2
+
+# Cor do selo de contagem dos comboios, por dono
+CONVOY_COLORS: Dict[str, Tuple[int, int, int]] = {
+    "ally": (50, 160, 100),
+    "enemy": (180, 50, 50),
+    "empty": (110, 110, 110),
+}
+
+# (arquivo de origem, tamanho em que é desenhado)
+SpriteSource = Tuple[Path, Tuple[int, int]]
+
 
 class SpriteRenderer:
+    """Registra sprites de formigas e ninhos em uma DrawList."""
+
     def __init__(self, settings: Settings):
         self.settings = settings
         self.logger = logging.getLogger(__name__)
 
         self.ant_sprites: Dict[Tuple[str, int], pygame.Surface] = {}
+        # (id da imagem, zoom) -> imagem escalada; as imagens vivem tanto quanto o renderer
+        self._zoom_cache: Dict[Tuple[int, float], pygame.Surface] = {}
+        # Frames já rotacionados, reaproveitados entre quadros
+        self.rotation_cache = RotatedSpriteCache(
+            buckets=settings.ROTATION_BUCKETS,
+            max_bytes=settings.ROTATION_CACHE_MAX_BYTES,
+        )
+
+        # Um único atlas pré-escalado (build_atlas.py); arquivos soltos como reserva
+        self.atlas: Optional[SpriteAtlas] = SpriteAtlas.load(
+            settings.ATLAS_INDEX, settings.ANT_SIZE, settings.NEST_SIZE
+        )
 
-        self.nest_img_ally: Optional[pygame.Surface] = load_image(
-            settings.STRUCTURES_DIR / "formigueiro_aliado.png"
+        self.nest_img_ally: Optional[pygame.Surface] = self._sprite(
+            settings.STRUCTURES_DIR / "formigueiro_aliado.png", settings.NEST_SIZE
         )
-        self.nest_img_empty: Optional[pygame.Surface] = load_image(
-            settings.STRUCTURES_DIR / "formigueiro_vazio.png"
+        self.nest_img_empty: Optional[pygame.Surface] = self._sprite(
+            settings.STRUCTURES_DIR / "formigueiro_vazio.png", settings.NEST_SIZE
         )
-        self.nest_img_enemy: Optional[pygame.Surface] = load_image(
-            settings.STRUCTURES_DIR / "formigueiro_inimigo.png"
+        self.nest_img_enemy: Optional[pygame.Surface] = self._sprite(
+            settings.STRUCTURES_DIR / "formigueiro_inimigo.png", settings.NEST_SIZE
         )
 
-        self._scale_structures()
         self._load_dynamic_ant_sprites()
 
-    def _scale_structures(self) -> None:
-        """Redimensiona estruturas estáticas."""
-        if self.nest_img_ally:
-            self.nest_img_ally = pygame.transform.scale(
-                self.nest_img_ally, self.settings.NEST_SIZE
-            )
-        if self.nest_img_empty:
-            self.nest_img_empty = pygame.transform.scale(
-                self.nest_img_empty, self.settings.NEST_SIZE
-            )
-        if self.nest_img_enemy:
-            self.nest_img_enemy = pygame.transform.scale(
-                self.nest_img_enemy, self.settings.NEST_SIZE
-            )
+    @staticmethod
+    def sprite_sources(settings: Settings) -> List[SpriteSource]:
+        """Arquivos de sprite usados pelo renderer e o tamanho em que são desenhados."""
+        sources: List[SpriteSource] = [
+            (settings.STRUCTURES_DIR / name, settings.NEST_SIZE) for name in NEST_FILES
+        ]
+        for ant_type in ALL_ANT_TYPES:
+            name_lower = ant_type.name.lower()
+            for frame in range(1, ANT_ANIMATION_FRAMES + 1):
+                sources.append(
+                    (settings.ANTS_DIR / f"{name_lower}_{frame}.png", settings.ANT_SIZE)
+                )
+        return sources
+
+    @staticmethod
+    def atlas_name(settings: Settings, path: Path) -> str:
+        """Nome do sprite no atlas: caminho relativo a SPRITES_DIR, sem extensão."""
+        return path.relative_to(settings.SPRITES_DIR).with_suffix("").as_posix()
+
+    @classmethod
+    def asset_requests(cls, settings: Settings) -> List[AssetRequest]:
+        """Imagens (já escaladas) usadas pelo renderer, para ASSETS.preload."""
+        atlas = SpriteAtlas.load(settings.ATLAS_INDEX, settings.ANT_SIZE, settings.NEST_SIZE)
+        # Com o atlas carregado, só os sprites ausentes dele vêm de arquivos soltos
+        return [
+            (path, size, "scale")
+            for path, size in cls.sprite_sources(settings)
+            if atlas is None or cls.atlas_name(settings, path) not in atlas
+        ]
+
+    def _sprite(self, path: Path, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        if self.atlas is not None:
+            frame = self.atlas.get(self.atlas_name(self.settings, path))
+            if frame is not None:
+                return frame
+        return ASSETS.get(path, size)
 
     def _load_dynamic_ant_sprites(self) -> None:
         """
@@ -52,18 +105,16 @@ class SpriteRenderer:
 
             # Carrega Frame 1
             path1 = self.settings.ANTS_DIR / f"{name_lower}_1.png"
-            img1 = load_image(path1)
+            img1 = self._sprite(path1, self.settings.ANT_SIZE)
             if img1:
-                img1 = pygame.transform.scale(img1, self.settings.ANT_SIZE)
                 self.ant_sprites[(ant_type.name, 0)] = img1
             else:
                 self.logger.warning(f"Sprite não encontrado: {path1}. Usando fallback.")
 
             # Carrega Frame 2
             path2 = self.settings.ANTS_DIR / f"{name_lower}_2.png"
-            img2 = load_image(path2)
+            img2 = self._sprite(path2, self.settings.ANT_SIZE)
             if img2:
-                img2 = pygame.transform.scale(img2, self.settings.ANT_SIZE)
                 self.ant_sprites[(ant_type.name, 1)] = img2
             else:
                 # Se não tiver frame 2, usa o 1 se existir
@@ -72,28 +123,80 @@ class SpriteRenderer:
 
     def draw_ant(
         self,
-        surface: pygame.Surface,
-        pos: pygame.Vector2,
+        draw_list: DrawList,
+        pos: Tuple[float, float],
         angle: float,
         frame_index: int,
         ant_type_name: str,
+        zoom: float = 1.0,
+        layer: int = DrawLayer.ANTS,
     ) -> None:
+        sprite_name = ant_type_name
         frame = self.ant_sprites.get((ant_type_name, frame_index), None)
 
         if not frame:
+            sprite_name = "Farao"
             frame = self.ant_sprites.get(("Farao", frame_index))
 
         # Fallback se a imagem não existir (desenha um círculo)
         if frame is None:
-            pygame.draw.circle(surface, (200, 200, 50), (int(pos.x), int(pos.y)), 6)
+            draw_list.circle(
+                (200, 200, 50),
+                (int(pos[0]), int(pos[1])),
+                max(1, int(6 * zoom)),
+                layer=layer,
+            )
             return
 
-        rotated = pygame.transform.rotate(frame, -angle)
-        rect = rotated.get_rect(center=(int(pos.x), int(pos.y)))
-        surface.blit(rotated, rect)
+        if zoom != 1.0:
+            frame = self._zoomed(frame, zoom)
+            sprite_key: Hashable = (sprite_name, zoom)
+        else:
+            sprite_key = sprite_name
+        rotated = self.rotation_cache.get(sprite_key, frame_index, frame, angle)
+        # Mesmo canto de get_rect(center=pos), sem alocar um Rect
+        width, height = rotated.get_size()
+        draw_list.blit(
+            rotated,
+            (int(pos[0]) - width // 2, int(pos[1]) - height // 2),
+            layer,
+        )
+
+    def draw_convoy(
+        self,
+        draw_list: DrawList,
+        pos: Tuple[float, float],
+        angle: float,
+        frame_index: int,
+        ant_type_name: str,
+        count: int,
+        owner: str,
+        font: pygame.font.Font,
+        zoom: float = 1.0,
+    ) -> None:
+        """Glifo de comboio (LOD): um sprite do fluxo com um selo de contagem."""
+        self.draw_ant(
+            draw_list, pos, angle, frame_index, ant_type_name, zoom, DrawLayer.CONVOYS
+        )
+        color = CONVOY_COLORS.get(owner, CONVOY_COLORS["empty"])
+        badge_x = int(pos[0] + self.settings.ANT_SIZE[0] * zoom / 2)
+        badge_y = int(pos[1] - self.settings.ANT_SIZE[1] * zoom / 2)
+        width = TEXT_CACHE.number_width(font, count, self.settings.TEXT_COLOR)
+        radius = max(font.get_height(), width + 4) // 2 + 1
+        draw_list.circle(color, (badge_x, badge_y), radius, layer=DrawLayer.CONVOYS)
+        x = badge_x - width // 2
+        y = badge_y - font.get_height() // 2
+        for glyph, offset in TEXT_CACHE.number_glyphs(
+            font, count, self.settings.TEXT_COLOR
+        ):
+            draw_list.blit(glyph, (x + offset, y), DrawLayer.CONVOY_LABELS)
 
     def draw_nest(
-        self, surface: pygame.Surface, center: Tuple[float, float], state: str = "ally"
+        self,
+        draw_list: DrawList,
+        center: Tuple[float, float],
+        state: str = "ally",
+        zoom: float = 1.0,
     ) -> None:
         img = None
         if state == "ally":
@@ -104,8 +207,10 @@ class SpriteRenderer:
             img = self.nest_img_enemy
 
         if img:
+            if zoom != 1.0:
+                img = self._zoomed(img, zoom)
             rect = img.get_rect(center=(int(center[0]), int(center[1])))
-            surface.blit(img, rect)
+            draw_list.blit(img, rect.topleft, DrawLayer.NESTS)
         else:
             # Fallback visual se imagem falhar
             color = (
@@ -113,29 +218,41 @@ class SpriteRenderer:
                 if state == "ally"
                 else ((200, 60, 60) if state == "enemy" else (120, 120, 120))
             )
-            pygame.draw.circle(
-                surface,
+            draw_list.circle(
                 color,
                 (int(center[0]), int(center[1])),
-                self.settings.NEST_SIZE[0] // 2,
+                int(self.settings.NEST_SIZE[0] // 2 * zoom),
+                layer=DrawLayer.NESTS,
             )
 
     def draw_selection_ring(
-        self, surface: pygame.Surface, center: Tuple[int, int]
+        self, draw_list: DrawList, center: Tuple[float, float], zoom: float = 1.0
     ) -> None:
-        pygame.draw.circle(
-            surface,
+        draw_list.circle(
             self.settings.SELECTION_COLOR,
             (int(center[0]), int(center[1])),
-            self.settings.NEST_SIZE[0] // 2 + 5,
+            int((self.settings.NEST_SIZE[0] // 2 + 5) * zoom),
             3,
         )
 
-    def draw_enemy_ring(self, surface: pygame.Surface, center: Tuple[int, int]) -> None:
-        pygame.draw.circle(
-            surface,
+    def draw_enemy_ring(
+        self, draw_list: DrawList, center: Tuple[float, float], zoom: float = 1.0
+    ) -> None:
+        draw_list.circle(
             (200, 60, 60),
             (int(center[0]), int(center[1])),
-            self.settings.NEST_SIZE[0] // 2 + 2,
+            int((self.settings.NEST_SIZE[0] // 2 + 2) * zoom),
             2,
         )
+
+    def _zoomed(self, image: pygame.Surface, zoom: float) -> pygame.Surface:
+        """Sprite escalado para um passo de zoom da câmera (um por imagem/passo)."""
+        key = (id(image), zoom)
+        scaled = self._zoom_cache.get(key)
+        if scaled is None:
+            width, height = image.get_size()
+            scaled = pygame.transform.scale(
+                image, (max(1, round(width * zoom)), max(1, round(height * zoom)))
+            )
+            self._zoom_cache[key] = scaled
+        return scaled
@@ -0,0 +1,109 @@
+"""
+Cache de texto renderizado.
+
+font.render rasteriza o texto a cada chamada; títulos, botões e rótulos
+quase nunca mudam. TextCache guarda as superfícies em um LRU chaveado por
+(fonte, texto, cor, antialias). Números que mudam o tempo todo (contagens dos
+ninhos) são montados a partir de glifos de dígitos pré-renderizados, sem
+rasterizar a fonte.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterator, List, Sequence, Tuple
+
+import pygame
+
+Color = Sequence[int]
+TextKey = Tuple[Hashable, ...]
+
+_NUMBER_CHARS = "-0123456789"
+
+
+class TextCache:
+    """LRU de superfícies de texto, compartilhado entre cenas."""
+
+    def __init__(self, max_entries: int = 512) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[TextKey, pygame.Surface]" = OrderedDict()
+        # (fonte, cor, antialias) -> glifo por caractere numérico
+        self._glyphs: Dict[TextKey, Dict[str, pygame.Surface]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def render(
+        self, font: pygame.font.Font, text: str, color: Color, antialias: bool = True
+    ) -> pygame.Surface:
+        """Equivalente a font.render(text, antialias, color), com cache."""
+        key = (font, text, tuple(color), antialias)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._store(key, surface)
+        return surface
+
+    def number_glyphs(
+        self, font: pygame.font.Font, value: int, color: Color, antialias: bool = True
+    ) -> Iterator[Tuple[pygame.Surface, int]]:
+        """Glifos (superfície, deslocamento x) que formam o número, da esquerda à direita."""
+        glyphs = self._glyph_set(font, color, antialias)
+        x = 0
+        for char in str(value):
+            glyph = glyphs[char]
+            yield glyph, x
+            x += glyph.get_width()
+
+    def number_width(
+        self, font: pygame.font.Font, value: int, color: Color, antialias: bool = True
+    ) -> int:
+        glyphs = self._glyph_set(font, color, antialias)
+        return sum(glyphs[char].get_width() for char in str(value))
+
+    def render_number(
+        self, font: pygame.font.Font, value: int, color: Color, antialias: bool = True
+    ) -> pygame.Surface:
+        """Superfície do número composta a partir dos glifos (cacheada no LRU)."""
+        key = ("#", font, int(value), tuple(color), antialias)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return surface
+        self.misses += 1
+        parts: List[Tuple[pygame.Surface, int]] = list(
+            self.number_glyphs(font, value, color, antialias)
+        )
+        width = sum(glyph.get_width() for glyph, _ in parts)
+        surface = pygame.Surface((max(1, width), font.get_height()), pygame.SRCALPHA)
+        surface.blits([(glyph, (x, 0)) for glyph, x in parts], doreturn=False)
+        self._store(key, surface)
+        return surface
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._glyphs.clear()
+
+    def _glyph_set(
+        self, font: pygame.font.Font, color: Color, antialias: bool
+    ) -> Dict[str, pygame.Surface]:
+        key = (font, tuple(color), antialias)
+        glyphs = self._glyphs.get(key)
+        if glyphs is None:
+            glyphs = {char: font.render(char, antialias, color) for char in _NUMBER_CHARS}
+            self._glyphs[key] = glyphs
+        return glyphs
+
+    def _store(self, key: TextKey, surface: pygame.Surface) -> None:
+        self._entries[key] = surface
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# Cache compartilhado pelo processo
+TEXT_CACHE = TextCache()
@@ -1,39 +1,65 @@
 import pygame
-from typing import List, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, List, Optional, Sequence, Tuple
 from pathlib import Path
-from src.utils.asset_loader import load_image
+from src.utils.asset_cache import ASSETS
 from src.config.settings import Settings
+from src.rendering.text_cache import TEXT_CACHE
 from src.core.level_config import InstructionElement
 
 
-def render_rich_text_line(
-    surface: pygame.Surface,
-    elements: List[InstructionElement],
-    start_pos: Tuple[int, int],
-    font: pygame.font.Font,
-) -> int:
+@dataclass(frozen=True)
+class RichTextLayout:
+    """Linha de texto rico já diagramada: superfícies e deslocamento x de cada uma."""
+
+    parts: Tuple[Tuple[pygame.Surface, int], ...]
+    width: int
+    height: int
+
+
+# Layouts por (fonte, conteúdo da linha); linhas de tutorial são poucas e fixas
+_LAYOUT_CACHE_SIZE = 256
+_layouts: "OrderedDict[Tuple[Hashable, ...], RichTextLayout]" = OrderedDict()
+
+
+def _load_icon(path: Path, target_h: int) -> Optional[pygame.Surface]:
+    """Ícone escalado para a altura dada, via cache de imagens do processo."""
+    img = ASSETS.get(path)
+    if not img:
+        return None
+    aspect = img.get_width() / img.get_height()
+    target_w = int(target_h * aspect)
+    return ASSETS.get(path, (target_w, target_h), "smoothscale")
+
+
+def layout_rich_text_line(
+    elements: Sequence[InstructionElement], font: pygame.font.Font
+) -> RichTextLayout:
     """
-    Renderiza uma linha contendo texto (com cores variadas) e imagens (ícones).
-    Retorna a altura máxima desenhada na linha para calcular o próximo espaçamento.
+    Diagrama uma linha contendo texto (com cores variadas) e imagens (ícones).
+    O resultado é cacheado pelo conteúdo da linha e pela fonte.
     """
-    x, y = start_pos
+    key = (font, tuple(elements))
+    layout = _layouts.get(key)
+    if layout is not None:
+        _layouts.move_to_end(key)
+        return layout
+
+    x = 0
     max_height = 0
+    parts: List[Tuple[pygame.Surface, int]] = []
 
     for elem in elements:
         # Caso 1: Caminho para Imagem (Ícone)
         if isinstance(elem, Path):
-            img = load_image(elem)
-            if img:
-                # Escala ícone para caber na altura da fonte (aprox)
-                target_h = int(font.get_height() * Settings.UI_ICON_SCALE)
-                aspect = img.get_width() / img.get_height()
-                target_w = int(target_h * aspect)
-                scaled = pygame.transform.smoothscale(img, (target_w, target_h))
-
-                rect = scaled.get_rect(topleft=(x, y))
-                surface.blit(scaled, rect)
-                x += rect.width + 5
-                max_height = max(max_height, rect.height)
+            # Escala ícone para caber na altura da fonte (aprox)
+            target_h = int(font.get_height() * Settings.UI_ICON_SCALE)
+            scaled = _load_icon(elem, target_h)
+            if scaled:
+                parts.append((scaled, x))
+                x += scaled.get_width() + 5
+                max_height = max(max_height, scaled.get_height())
             continue
 
         # Caso 2: Texto
@@ -45,10 +71,31 @@ def render_rich_text_line(
         elif isinstance(elem, str):
             text = elem
 
-        # Renderiza texto
-        txt_surf = font.render(text, True, color)
-        surface.blit(txt_surf, (x, y))
+        txt_surf = TEXT_CACHE.render(font, text, color)
+        parts.append((txt_surf, x))
         x += txt_surf.get_width() + 5  # espaçamento pequeno
         max_height = max(max_height, txt_surf.get_height())
 
-    return max_height
+    layout = RichTextLayout(parts=tuple(parts), width=x, height=max_height)
+    _layouts[key] = layout
+    while len(_layouts) > _LAYOUT_CACHE_SIZE:
+        _layouts.popitem(last=False)
+    return layout
+
+
+def render_rich_text_line(
+    surface: pygame.Surface,
+    elements: List[InstructionElement],
+    start_pos: Tuple[int, int],
+    font: pygame.font.Font,
+) -> int:
+    """
+    Renderiza uma linha contendo texto (com cores variadas) e imagens (ícones).
+    Retorna a altura máxima desenhada na linha para calcular o próximo espaçamento.
+    """
+    x, y = start_pos
+    layout = layout_rich_text_line(elements, font)
+    surface.blits(
+        [(part, (x + offset, y)) for part, offset in layout.parts], doreturn=False
+    )
+    return layout.height
@@ -1,15 +1,17 @@
 import pygame
 from src.config.settings import Settings
+from src.rendering.font_manager import FONTS
+from src.rendering.text_cache import TEXT_CACHE
 
 
 class UIRenderer:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self.font = pygame.font.SysFont("consolas", 18)
+        self.font = FONTS.get("consolas", 18)
 
     def draw_hud(
         self, surface: pygame.Surface, ant_count: int, nest_count: int
     ) -> None:
         text = f"Ants: {ant_count} | Nests: {nest_count}"
-        img = self.font.render(text, True, self.settings.UI_COLOR)
+        img = TEXT_CACHE.render(self.font, text, self.settings.UI_COLOR)
         surface.blit(img, (10, 10))
@@ -0,0 +1,114 @@
+"""
+Mede o custo por tick do movimento e do render com muitas formigas em voo.
+
+Enche a fase com N formigas espalhadas pelas rotas entre ninhos e cronometra
+o passo de movimento (modo por quadro e modo por eventos) e um render
+completo na resolução da Settings:
+
+    python -m src.scripts.bench_movement --ants 10000 --ticks 20
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from typing import Dict, Optional, Sequence
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+from src.config.settings import Settings  # noqa: E402
+from src.core.level_scene import LevelScene  # noqa: E402
+from src.core.levels_campaign import create_level_1_config  # noqa: E402
+from src.entities.ant import ANT_POOL  # noqa: E402
+from src.systems.moving_ants import Owner  # noqa: E402
+
+
+def _populate(scene: LevelScene, ants: int, rng: random.Random) -> None:
+    """Despacha `ants` formigas já a caminho, entre pares aleatórios de ninhos."""
+    n = len(scene.nest_positions)
+    geometry = scene.geometry
+    speed = float(scene.settings.SPEED)
+    for _ in range(ants):
+        origin = rng.randrange(n)
+        dest = (origin + 1 + rng.randrange(n - 1)) % n
+        ox, oy = scene.nest_positions[origin]
+        dir_x, dir_y = geometry.direction(origin, dest)
+        # Perto da origem: a maioria continua em voo durante a medição
+        along = rng.uniform(0.0, 0.1) * geometry.distance(origin, dest)
+        owner: Owner = "ally" if origin % 2 else "enemy"
+        slot = scene.moving_ants.append(
+            pos=(ox + dir_x * along, oy + dir_y * along),
+            dest=scene.nest_positions[dest],
+            velocity=(dir_x * speed, dir_y * speed),
+            angle=geometry.angle(origin, dest),
+            owner=owner,
+            origin_index=origin,
+            dest_index=dest,
+            ant=ANT_POOL.acquire((ox, oy), None),
+            tick=scene._movement_tick,
+        )
+        if scene.event_driven_arrivals:
+            scene._schedule_arrival(slot)
+
+
+def measure(ants: int, ticks: int, event_driven: bool, seed: int = 0) -> Dict[str, float]:
+    """Milissegundos médios por tick de movimento e por render."""
+    settings = Settings()
+    settings.EVENT_DRIVEN_ARRIVALS = event_driven
+    scene = LevelScene(settings, create_level_1_config(settings))
+    scene.state = "playing"
+    _populate(scene, ants, random.Random(seed))
+    surface = pygame.display.get_surface()
+
+    in_flight = 0
+    started = time.perf_counter()
+    for _ in range(ticks):
+        in_flight += len(scene.moving_ants)
+        scene._update_ant_movement()
+    movement_ms = (time.perf_counter() - started) * 1000.0 / ticks
+    # Render com as formigas que sobraram em voo
+    _populate(scene, ants - len(scene.moving_ants), random.Random(seed + 1))
+
+    renders = max(1, ticks // 4)
+    started = time.perf_counter()
+    for _ in range(renders):
+        scene.render(surface)
+    render_ms = (time.perf_counter() - started) * 1000.0 / renders
+
+    return {
+        "mean_ants_in_flight": round(in_flight / ticks, 1),
+        "movement_ms": round(movement_ms, 2),
+        "render_ms": round(render_ms, 2),
+        "frame_ms": round(movement_ms + render_ms, 2),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    settings = Settings()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ants", type=int, default=10000)
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
+    try:
+        budget_ms = 1000.0 / settings.FPS
+        report = {
+            "budget_ms": round(budget_ms, 2),
+            "polling": measure(args.ants, args.ticks, False, args.seed),
+            "event_driven": measure(args.ants, args.ticks, True, args.seed),
+        }
+        print(json.dumps(report, indent=2))
+    finally:
+        pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
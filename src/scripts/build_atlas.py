@@ -0,0 +1,65 @@
+"""
+Gera o atlas de sprites (assets/sprites/atlas.png + atlas.json).
+
+Empacota todos os frames de todos os tipos de ALL_ANT_TYPES e as imagens dos
+ninhos, já escalados para Settings.ANT_SIZE/NEST_SIZE. Rode de novo sempre que
+um sprite ou um desses tamanhos mudar:
+
+    python -m src.scripts.build_atlas
+"""
+
+import argparse
+import os
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+from src.config.settings import Settings  # noqa: E402
+from src.rendering.sprite_atlas import build_atlas, write_index  # noqa: E402
+from src.rendering.sprite_renderer import SpriteRenderer  # noqa: E402
+from src.utils.asset_loader import load_image  # noqa: E402
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    settings = Settings()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--image", type=Path, default=settings.ATLAS_IMAGE)
+    parser.add_argument("--index", type=Path, default=settings.ATLAS_INDEX)
+    parser.add_argument("--max-width", type=int, default=512)
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    # load_image usa convert_alpha, que exige um modo de vídeo
+    pygame.display.set_mode((1, 1))
+    try:
+        images: Dict[str, pygame.Surface] = {}
+        for path, size in SpriteRenderer.sprite_sources(settings):
+            image = load_image(path)
+            if image is None:
+                continue
+            # Mesma escala que o renderer aplicaria em tempo de execução
+            images[SpriteRenderer.atlas_name(settings, path)] = pygame.transform.scale(
+                image, size
+            )
+
+        atlas, rects = build_atlas(images, max_width=args.max_width)
+        pygame.image.save(atlas, str(args.image))
+        write_index(
+            args.index,
+            os.path.relpath(args.image, args.index.parent),
+            rects,
+            settings.ANT_SIZE,
+            settings.NEST_SIZE,
+        )
+        print(f"{len(rects)} sprites em {args.image} ({atlas.get_width()}x{atlas.get_height()})")
+    finally:
+        pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,15 @@
+"""Simulação headless de partidas (runner rápido, sem Engine)."""
+
+from src.sim.runner import DEFAULT_MAX_TICKS, LEVEL_CREATORS, MatchSummary, run_match
+from src.sim.batch import BatchAggregator, BatchStats, iter_matches, run_batch
+
+__all__ = [
+    "DEFAULT_MAX_TICKS",
+    "LEVEL_CREATORS",
+    "MatchSummary",
+    "run_match",
+    "BatchAggregator",
+    "BatchStats",
+    "iter_matches",
+    "run_batch",
+]
@@ -0,0 +1,116 @@
+"""
+CLI do runner headless.
+
+Uso:
+    python -m src.sim run --level level_1_invasion --seed 7 --max-ticks 36000
+    python -m src.sim batch --level level_1_invasion --seeds 1000 --workers 32
+    python -m src.sim batch --level level_1_invasion --seeds 1000 \
+        --set EVENT_DRIVEN_ARRIVALS=true --set COUNTED_COLONIES=true
+"""
+
+import argparse
+import json
+import logging
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.config.settings import Settings
+from src.sim.batch import BatchAggregator, iter_matches
+from src.sim.runner import DEFAULT_MAX_TICKS, LEVEL_CREATORS, apply_overrides, run_match
+from src.utils.logging_config import configure_logging
+
+
+def parse_override(text: str) -> Tuple[str, Any]:
+    """
+    Converte "NOME=VALOR" em (nome, valor) para --set.
+
+    O valor é lido como JSON (true, 3, 1.5, null, [64, 64]); se não for JSON
+    válido, fica como texto.
+    """
+    name, sep, raw = text.partition("=")
+    name = name.strip()
+    if not sep or not name:
+        raise argparse.ArgumentTypeError(f"esperado NOME=VALOR, recebido {text!r}")
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        value = raw
+    if isinstance(value, list):
+        # Settings usa tuplas para tamanhos e cores
+        value = tuple(value)
+    return name, value
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.sim")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Simula uma partida e imprime um resumo JSON")
+    run.add_argument("--seed", type=int, default=0)
+
+    batch = commands.add_parser(
+        "batch", help="Simula várias seeds em paralelo e imprime estatísticas JSON"
+    )
+    batch.add_argument("--seeds", type=int, required=True, help="Número de partidas")
+    batch.add_argument("--seed-start", type=int, default=0)
+    batch.add_argument("--workers", type=int, default=None)
+    batch.add_argument("--chunk-size", type=int, default=None)
+    batch.add_argument(
+        "--stream",
+        action="store_true",
+        help="Imprime cada resumo (uma linha JSON) assim que a partida termina",
+    )
+
+    for command in (run, batch):
+        command.add_argument("--level", required=True, choices=sorted(LEVEL_CREATORS))
+        command.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+        command.add_argument(
+            "--log-level",
+            type=str,
+            default="WARNING",
+            choices=("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"),
+        )
+        command.add_argument(
+            "--set",
+            dest="overrides",
+            type=parse_override,
+            action="append",
+            default=[],
+            metavar="NOME=VALOR",
+            help="Sobrescreve uma configuração da Settings (repetível)",
+        )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    configure_logging(level=getattr(logging, args.log_level))
+    overrides: Dict[str, Any] = dict(args.overrides)
+    try:
+        # Valida os nomes antes de subir o pool de processos
+        apply_overrides(Settings(), overrides)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if args.command == "run":
+        summary = run_match(
+            args.level, args.seed, max_ticks=args.max_ticks, overrides=overrides
+        )
+        print(json.dumps(summary.to_dict()))
+        return 0
+
+    seeds = range(args.seed_start, args.seed_start + args.seeds)
+    aggregator = BatchAggregator(args.level)
+    for summary in iter_matches(
+        args.level, seeds, args.workers, args.chunk_size, args.max_ticks, overrides
+    ):
+        aggregator.add(summary)
+        if args.stream:
+            print(json.dumps(summary.to_dict()), flush=True)
+    print(json.dumps(aggregator.result().to_dict()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+Fazenda de partidas em lote.
+
+Distribui partidas headless (uma por seed) entre processos de um
+ProcessPoolExecutor, em blocos de seeds por tarefa para diluir o custo de
+IPC, e devolve cada resumo assim que o bloco termina. BatchAggregator
+consolida taxa de vitória, distribuição de estrelas e scores e throughput.
+"""
+
+import math
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+from src.sim.runner import DEFAULT_MAX_TICKS, MatchSummary, run_match
+
+# Blocos por worker: equilibra a carga sem multiplicar o overhead de IPC
+CHUNKS_PER_WORKER = 4
+
+
+def _run_chunk(
+    level: str,
+    seeds: Sequence[int],
+    max_ticks: int,
+    overrides: Optional[Mapping[str, Any]] = None,
+) -> List[MatchSummary]:
+    # Executado no processo filho; precisa ser função de módulo (picklable)
+    return [
+        run_match(level, seed, max_ticks=max_ticks, overrides=overrides)
+        for seed in seeds
+    ]
+
+
+def _chunks(seeds: Sequence[int], size: int) -> Iterator[Sequence[int]]:
+    for start in range(0, len(seeds), size):
+        yield seeds[start:start + size]
+
+
+def iter_matches(
+    level: str,
+    seeds: Sequence[int],
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+    overrides: Optional[Mapping[str, Any]] = None,
+) -> Iterator[MatchSummary]:
+    """
+    Executa uma partida por seed e devolve os resumos conforme terminam
+    (ordem de conclusão, não a de `seeds`).
+
+    workers=None usa todos os núcleos; workers=1 roda no próprio processo.
+    `overrides` (nome -> valor da Settings) vale para todas as partidas.
+    """
+    seeds = list(seeds)
+    if not seeds:
+        return
+    workers = max(1, workers or os.cpu_count() or 1)
+    if chunk_size is None:
+        chunk_size = math.ceil(len(seeds) / (workers * CHUNKS_PER_WORKER))
+    chunk_size = max(1, chunk_size)
+
+    if workers == 1:
+        for seed in seeds:
+            yield run_match(level, seed, max_ticks=max_ticks, overrides=overrides)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_run_chunk, level, chunk, max_ticks, overrides)
+            for chunk in _chunks(seeds, chunk_size)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+@dataclass(frozen=True)
+class BatchStats:
+    """Estatísticas agregadas de um lote de partidas."""
+
+    level: str
+    matches: int
+    finished: int
+    wins: int
+    win_rate: float
+    stars: Dict[int, int]
+    score_min: int
+    score_mean: float
+    score_median: float
+    score_max: int
+    mean_sim_time: float
+    total_ticks: int
+    wall_time: float
+    ticks_per_second: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class BatchAggregator:
+    """Acumula resumos de partidas (em qualquer ordem) e gera BatchStats."""
+
+    level: str
+    summaries: List[MatchSummary] = field(default_factory=list)
+    started: float = field(default_factory=time.perf_counter)
+
+    def add(self, summary: MatchSummary) -> None:
+        self.summaries.append(summary)
+
+    def extend(self, summaries: Iterable[MatchSummary]) -> None:
+        for summary in summaries:
+            self.add(summary)
+
+    def result(self) -> BatchStats:
+        wall_time = time.perf_counter() - self.started
+        matches = len(self.summaries)
+        scores = [s.score for s in self.summaries] or [0]
+        stars: Dict[int, int] = {count: 0 for count in range(4)}
+        for s in self.summaries:
+            stars[s.stars] = stars.get(s.stars, 0) + 1
+        wins = sum(1 for s in self.summaries if s.victory)
+        total_ticks = sum(s.ticks for s in self.summaries)
+        return BatchStats(
+            level=self.level,
+            matches=matches,
+            finished=sum(1 for s in self.summaries if s.finished),
+            wins=wins,
+            win_rate=wins / matches if matches else 0.0,
+            stars=stars,
+            score_min=min(scores),
+            score_mean=statistics.fmean(scores),
+            score_median=statistics.median(scores),
+            score_max=max(scores),
+            mean_sim_time=(
+                statistics.fmean(s.sim_time for s in self.summaries) if matches else 0.0
+            ),
+            total_ticks=total_ticks,
+            wall_time=wall_time,
+            ticks_per_second=total_ticks / wall_time if wall_time > 0 else 0.0,
+        )
+
+
+def run_batch(
+    level: str,
+    seeds: Sequence[int],
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+    overrides: Optional[Mapping[str, Any]] = None,
+) -> BatchStats:
+    """Roda o lote inteiro e retorna apenas as estatísticas agregadas."""
+    aggregator = BatchAggregator(level)
+    aggregator.extend(
+        iter_matches(level, seeds, workers, chunk_size, max_ticks, overrides)
+    )
+    return aggregator.result()
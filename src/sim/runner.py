@@ -0,0 +1,132 @@
+"""
+Runner headless de partidas em ritmo acelerado.
+
+Executa uma LevelScene em um laço fechado de ticks fixos, sem Engine, relógio,
+polling de input ou render, e para assim que a partida é decidida.
+"""
+
+import os
+import random
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Mapping, Optional
+
+# Sem janela e sem banner no stdout (a saída do CLI é JSON)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+from src.config.settings import Settings  # noqa: E402
+from src.core.level_config import LevelConfig  # noqa: E402
+from src.core.level_scene import LevelScene  # noqa: E402
+from src.core.levels_campaign import create_level_1_config  # noqa: E402
+from src.core.levels_intro import (  # noqa: E402
+    create_intro_config,
+    create_intro2_config,
+    create_intro3_config,
+)
+
+# Fases disponíveis para o runner, pelo nome do LevelConfig
+LEVEL_CREATORS: Dict[str, Callable[[Settings], LevelConfig]] = {
+    "intro": create_intro_config,
+    "intro2": create_intro2_config,
+    "intro3": create_intro3_config,
+    "level_1_invasion": create_level_1_config,
+}
+
+# Limite padrão: 10 minutos de jogo a 60 ticks/s
+DEFAULT_MAX_TICKS = 60 * 60 * 10
+
+
+@dataclass(frozen=True)
+class MatchSummary:
+    """Resumo de uma partida simulada."""
+
+    level: str
+    seed: int
+    finished: bool
+    victory: bool
+    ticks: int
+    sim_time: float
+    score: int
+    stars: int
+    ally_nests: int
+    enemy_nests: int
+    wall_time: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def apply_overrides(settings: Settings, overrides: Mapping[str, Any]) -> Settings:
+    """
+    Sobrescreve atributos da Settings (ex.: {"EVENT_DRIVEN_ARRIVALS": True}).
+
+    Só aceita nomes já declarados em Settings, para que um erro de digitação
+    não vire um atributo novo ignorado em silêncio.
+    """
+    for name, value in overrides.items():
+        if not name.isupper() or not hasattr(Settings, name):
+            raise ValueError(f"Configuração desconhecida: {name!r}")
+        setattr(settings, name, value)
+    return settings
+
+
+def run_match(
+    level: str,
+    seed: int,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+    settings: Optional[Settings] = None,
+    overrides: Optional[Mapping[str, Any]] = None,
+) -> MatchSummary:
+    """
+    Simula uma partida até ela ser decidida ou atingir max_ticks.
+
+    O tutorial é pulado e o delay de encerramento da cena não é simulado.
+    Mesmo nível + mesma seed produzem o mesmo resumo (exceto wall_time).
+    `overrides` é aplicado sobre `settings` (ou sobre uma Settings nova);
+    por ser um dicionário simples, atravessa o ProcessPool do batch.
+    """
+    creator = LEVEL_CREATORS.get(level)
+    if creator is None:
+        raise ValueError(f"Fase desconhecida: {level!r}")
+    if not pygame.get_init():
+        pygame.init()
+    if pygame.display.get_surface() is None:
+        # convert_alpha exige um modo de vídeo; sem os sprites reais os
+        # retângulos dos ninhos (e portanto as colisões) seriam outros
+        pygame.display.set_mode((1, 1))
+
+    settings = settings or Settings()
+    if overrides:
+        apply_overrides(settings, overrides)
+    random.seed(seed)
+    scene = LevelScene(settings, creator(settings))
+    scene.state = "playing"
+
+    dt = 1.0 / float(settings.FPS)
+    update = scene.update
+    ticks = 0
+    started = time.perf_counter()
+    while ticks < max_ticks:
+        update(dt)
+        ticks += 1
+        if scene.outcome is not None:
+            break
+    wall_time = time.perf_counter() - started
+
+    result = scene.outcome
+    return MatchSummary(
+        level=level,
+        seed=seed,
+        finished=result is not None,
+        victory=bool(result and result.victory),
+        ticks=ticks,
+        sim_time=ticks * dt,
+        score=result.score if result else 0,
+        stars=result.stars if result else 0,
+        ally_nests=len(scene.ownership.nests("ally")),
+        enemy_nests=len(scene.ownership.nests("enemy")),
+        wall_time=wall_time,
+    )
@@ -0,0 +1,39 @@
+"""
+Agendador de chegadas por eventos.
+
+Como as formigas voam em linha reta com velocidade constante, o tick de
+chegada é conhecido no despacho. O agendador mantém uma fila de prioridade
+(heap) de (tick, sequência, uid) e devolve apenas as chegadas vencidas.
+"""
+
+import heapq
+from typing import List, Optional, Tuple
+
+
+class ArrivalScheduler:
+    """Fila de prioridade de chegadas ordenada por tick e ordem de despacho."""
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[int, int, int]] = []
+        self._seq: int = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, tick: int, uid: int) -> None:
+        heapq.heappush(self._heap, (tick, self._seq, uid))
+        self._seq += 1
+
+    def next_tick(self) -> Optional[int]:
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, tick: int) -> List[int]:
+        """Remove e retorna os uids com chegada até o tick dado (inclusive)."""
+        due: List[int] = []
+        heap = self._heap
+        while heap and heap[0][0] <= tick:
+            due.append(heapq.heappop(heap)[2])
+        return due
+
+    def clear(self) -> None:
+        self._heap.clear()
@@ -1,6 +1,14 @@
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
 from src.entities.ant import Ant
+from src.systems.moving_ants import MovingAntStore
 from src.utils.math_utils import clamp
 
+# Intervalo aberto (min_left, max_left, min_top, max_top) que o canto superior
+# esquerdo do retângulo da formiga precisa ocupar para tocar o ninho.
+ArrivalBounds = Tuple[int, int, int, int]
+
 
 class MovementSystem:
     def update_ant(self, ant: Ant, dt: float) -> None:
@@ -10,3 +18,163 @@ class MovementSystem:
         ant.y += dy
         ant.x = clamp(ant.x, 0.0, 2000.0)  # world bounds placeholder
         ant.y = clamp(ant.y, 0.0, 2000.0)
+
+
+def build_arrival_bounds(
+    nest_rects: Sequence[Tuple[int, int, int, int]], ant_size: Tuple[int, int]
+) -> List[ArrivalBounds]:
+    """
+    Pré-calcula, para cada ninho (x, y, w, h), a faixa de posições em que o
+    retângulo de uma formiga colide com ele (mesma regra de Rect.colliderect).
+    """
+    ant_w, ant_h = ant_size
+    bounds: List[ArrivalBounds] = []
+    for x, y, w, h in nest_rects:
+        bounds.append((x - ant_w, x + w, y - ant_h, y + h))
+    return bounds
+
+
+def step_moving_ants(
+    store: MovingAntStore,
+    arrival_bounds: Sequence[ArrivalBounds],
+    ant_size: Tuple[int, int],
+    tick: int,
+) -> Dict[int, List[int]]:
+    """
+    Executa o passo de movimento `tick` de todas as formigas em trânsito.
+
+    Formigas cujo retângulo atual já toca o ninho de destino não se movem e são
+    devolvidas como chegadas, agrupadas por índice de destino (slots em ordem
+    crescente). As demais vão para a posição do tick seguinte, calculada em
+    forma fechada a partir do despacho (start + velocidade * passos, a mesma
+    conta de MovingAntStore.position_at e de ticks_until_arrival, para que o
+    modo por eventos chegue nos mesmos ticks) e, quando trocam de célula, são
+    realocadas no hash espacial do store.
+    """
+    arrivals: Dict[int, List[int]] = {}
+    count = len(store)
+    if count == 0:
+        return arrivals
+
+    half_w = ant_size[0] // 2
+    half_h = ant_size[1] // 2
+    xs, ys, vxs, vys = store.x, store.y, store.vx, store.vy
+    start_xs, start_ys, dispatch_ticks = store.start_x, store.start_y, store.dispatch_tick
+    dest_indices = store.dest_index
+    cell_xs, cell_ys = store.cell_x, store.cell_y
+    grid = store.grid
+    cell_size = grid.cell_size
+    nest_count = len(arrival_bounds)
+
+    for slot in range(count):
+        x = xs[slot]
+        y = ys[slot]
+        dest = dest_indices[slot]
+        if 0 <= dest < nest_count:
+            min_left, max_left, min_top, max_top = arrival_bounds[dest]
+            left = int(x - half_w)
+            top = int(y - half_h)
+            if min_left < left < max_left and min_top < top < max_top:
+                group = arrivals.get(dest)
+                if group is None:
+                    arrivals[dest] = [slot]
+                else:
+                    group.append(slot)
+                continue
+        steps = tick + 1 - dispatch_ticks[slot]
+        x = start_xs[slot] + vxs[slot] * steps
+        y = start_ys[slot] + vys[slot] * steps
+        xs[slot] = x
+        ys[slot] = y
+        cx = int(x // cell_size)
+        cy = int(y // cell_size)
+        old_cx = cell_xs[slot]
+        old_cy = cell_ys[slot]
+        if cx != old_cx or cy != old_cy:
+            grid.move(slot, (old_cx, old_cy), (cx, cy))
+            cell_xs[slot] = cx
+            cell_ys[slot] = cy
+
+    return arrivals
+
+
+def group_arrivals(slots: Sequence[int], dest_index: Sequence[int]) -> Dict[int, List[int]]:
+    """
+    Agrupa slots (em ordem crescente) por destino, na mesma ordem que
+    step_moving_ants produz: destinos pela ordem do primeiro slot.
+    """
+    arrivals: Dict[int, List[int]] = {}
+    for slot in slots:
+        dest = dest_index[slot]
+        group = arrivals.get(dest)
+        if group is None:
+            arrivals[dest] = [slot]
+        else:
+            group.append(slot)
+    return arrivals
+
+
+def _collides_at(
+    x: float, y: float, bounds: ArrivalBounds, half_w: int, half_h: int
+) -> bool:
+    min_left, max_left, min_top, max_top = bounds
+    return min_left < int(x - half_w) < max_left and min_top < int(y - half_h) < max_top
+
+
+def _axis_entry(
+    start: float, velocity: float, low: float, high: float, half: int
+) -> Optional[float]:
+    """Menor passo (real) em que a coordenada entra na faixa aberta (low, high)."""
+    if velocity > 0.0:
+        return (low + half - start) / velocity
+    if velocity < 0.0:
+        return (high + half - start) / velocity
+    return 0.0 if low < int(start - half) < high else None
+
+
+def ticks_until_arrival(
+    start: Tuple[float, float],
+    velocity: Tuple[float, float],
+    bounds: ArrivalBounds,
+    ant_size: Tuple[int, int],
+) -> Optional[int]:
+    """
+    Número de passos de movimento até a formiga tocar o ninho de destino,
+    considerando a posição start + velocidade * passos (mesmo teste AABB de
+    step_moving_ants). Retorna None se a trajetória nunca tocar o ninho.
+    """
+    half_w = ant_size[0] // 2
+    half_h = ant_size[1] // 2
+    x0, y0 = start
+    vx, vy = velocity
+    if _collides_at(x0, y0, bounds, half_w, half_h):
+        return 0
+
+    entry_x = _axis_entry(x0, vx, bounds[0], bounds[1], half_w)
+    entry_y = _axis_entry(y0, vy, bounds[2], bounds[3], half_h)
+    if entry_x is None or entry_y is None:
+        return None
+
+    # Estimativa contínua; o truncamento para int desloca a resposta em no
+    # máximo 1px, então uma varredura curta em torno dela acha o passo exato.
+    estimate = max(0.0, entry_x, entry_y)
+    slack = 2 + math.ceil(1.0 / max(abs(vx), abs(vy)))
+    first = max(0, math.floor(estimate) - slack)
+    for steps in range(first, math.ceil(estimate) + slack + 1):
+        if _collides_at(x0 + vx * steps, y0 + vy * steps, bounds, half_w, half_h):
+            return steps
+    return None
+
+
+def ticks_to_nearest_approach(
+    start: Tuple[float, float],
+    velocity: Tuple[float, float],
+    target: Tuple[float, float],
+) -> int:
+    """Passo (>= 0) em que start + velocidade * passos fica mais perto do alvo."""
+    vx, vy = velocity
+    speed_sq = vx * vx + vy * vy
+    if speed_sq == 0.0:
+        return 0
+    along = (target[0] - start[0]) * vx + (target[1] - start[1]) * vy
+    return max(0, round(along / speed_sq))
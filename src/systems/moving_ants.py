@@ -0,0 +1,245 @@
+"""
+Armazenamento em colunas (struct-of-arrays) das formigas em trânsito.
+
+Cada formiga em voo ocupa um "slot" e seus dados ficam em arrays contíguos
+(posição, destino, velocidade, ângulo, dono, ninhos de origem/destino), o que
+evita dicionários e objetos Vector2 por formiga no loop de movimento.
+Remoções usam swap-remove: o último slot ocupa o lugar do removido.
+
+O store também mantém um hash espacial (grade uniforme) com a célula atual de
+cada slot, atualizado de forma incremental conforme as formigas se movem,
+para que as checagens de colisão no despacho consultem só a vizinhança.
+
+Cada formiga guarda ainda o ponto e o tick de despacho, o que permite calcular
+posições sob demanda (materialize) quando o movimento é agendado por eventos
+em vez de integrado quadro a quadro. Um identificador estável (uid) localiza o
+slot atual de uma formiga mesmo após swap-removes.
+"""
+
+from array import array
+from typing import Dict, List, Literal, Optional, Tuple
+
+from src.entities.ant import Ant
+from src.systems.spatial_hash import SpatialHash
+
+Owner = Literal["ally", "enemy", "empty"]
+
+# Códigos compactos de dono (armazenados em array 'b')
+OWNER_CODES: Tuple[Owner, ...] = ("empty", "ally", "enemy")
+OWNER_TO_CODE: Dict[str, int] = {name: code for code, name in enumerate(OWNER_CODES)}
+
+
+class MovingAntStore:
+    """Colunas contíguas com o estado de todas as formigas em movimento."""
+
+    def __init__(self, cell_size: float = 48.0) -> None:
+        self.x: array[float] = array("d")
+        self.y: array[float] = array("d")
+        self.dest_x: array[float] = array("d")
+        self.dest_y: array[float] = array("d")
+        self.vx: array[float] = array("d")
+        self.vy: array[float] = array("d")
+        self.angle: array[float] = array("d")
+        self.owner: array[int] = array("b")
+        self.origin_index: array[int] = array("i")
+        self.dest_index: array[int] = array("i")
+        # Ponto e tick de despacho (base para posições calculadas sob demanda)
+        self.start_x: array[float] = array("d")
+        self.start_y: array[float] = array("d")
+        self.dispatch_tick: array[int] = array("q")
+        self.uid: array[int] = array("q")
+        # Célula do hash espacial ocupada por cada slot
+        self.cell_x: array[int] = array("i")
+        self.cell_y: array[int] = array("i")
+        # Coluna de objetos: a entidade Ant que viaja (volta para a colônia ao chegar)
+        self.ants: List[Ant] = []
+        self.grid: SpatialHash[int] = SpatialHash(cell_size)
+        self._slot_of_uid: Dict[int, int] = {}
+        self._next_uid: int = 0
+        self._materialized_tick: int = -1
+
+    def __len__(self) -> int:
+        return len(self.ants)
+
+    def append(
+        self,
+        pos: Tuple[float, float],
+        dest: Tuple[float, float],
+        velocity: Tuple[float, float],
+        angle: float,
+        owner: Owner,
+        origin_index: int,
+        dest_index: int,
+        ant: Ant,
+        tick: int = 0,
+    ) -> int:
+        """Adiciona uma formiga em trânsito (despachada no tick dado) e retorna o slot."""
+        self.x.append(float(pos[0]))
+        self.y.append(float(pos[1]))
+        self.dest_x.append(float(dest[0]))
+        self.dest_y.append(float(dest[1]))
+        self.vx.append(float(velocity[0]))
+        self.vy.append(float(velocity[1]))
+        self.angle.append(float(angle))
+        self.owner.append(OWNER_TO_CODE[owner])
+        self.origin_index.append(int(origin_index))
+        self.dest_index.append(int(dest_index))
+        self.start_x.append(float(pos[0]))
+        self.start_y.append(float(pos[1]))
+        self.dispatch_tick.append(int(tick))
+        self.uid.append(self._next_uid)
+        self.ants.append(ant)
+        slot = len(self.ants) - 1
+        self._slot_of_uid[self._next_uid] = slot
+        self._next_uid += 1
+        cell = self.grid.cell_of(pos[0], pos[1])
+        self.cell_x.append(cell[0])
+        self.cell_y.append(cell[1])
+        self.grid.insert(slot, cell)
+        return slot
+
+    def remove(self, slot: int) -> None:
+        """Remove o slot em O(1) movendo o último slot para o seu lugar."""
+        last = len(self.ants) - 1
+        if slot < 0 or slot > last:
+            raise IndexError(f"slot {slot} fora do intervalo (len={last + 1})")
+        self.grid.remove(slot, (self.cell_x[slot], self.cell_y[slot]))
+        del self._slot_of_uid[self.uid[slot]]
+        if slot != last:
+            last_cell = (self.cell_x[last], self.cell_y[last])
+            self.grid.remove(last, last_cell)
+            self.grid.insert(slot, last_cell)
+            self._slot_of_uid[self.uid[last]] = slot
+            for float_column in self._float_columns():
+                float_column[slot] = float_column[last]
+            for int_column in self._int_columns():
+                int_column[slot] = int_column[last]
+            self.ants[slot] = self.ants[last]
+        for column in self._columns():
+            column.pop()
+
+    def remove_many(self, slots: List[int]) -> None:
+        """Remove vários slots; processa do maior para o menor para manter os índices válidos."""
+        for slot in sorted(slots, reverse=True):
+            self.remove(slot)
+
+    def clear(self) -> None:
+        for column in self._columns():
+            del column[:]
+        self.grid.clear()
+        self._slot_of_uid.clear()
+
+    def slot_of(self, uid: int) -> int:
+        """Slot atual da formiga com o uid dado."""
+        return self._slot_of_uid[uid]
+
+    def find_slot(self, uid: int) -> Optional[int]:
+        """Como slot_of, mas retorna None se a formiga já saiu do store."""
+        return self._slot_of_uid.get(uid)
+
+    def position_at(self, slot: int, tick: int) -> Tuple[float, float]:
+        """Posição do slot no tick dado, calculada a partir do despacho."""
+        steps = tick - self.dispatch_tick[slot]
+        return (
+            self.start_x[slot] + self.vx[slot] * steps,
+            self.start_y[slot] + self.vy[slot] * steps,
+        )
+
+    def materialize(self, tick: int) -> None:
+        """
+        Recalcula as posições de todos os slots para o tick dado a partir do
+        ponto de despacho (start + velocidade * passos). Custa O(n): no modo de
+        chegadas agendadas fica reservado ao render (no máximo uma vez por tick).
+        """
+        if tick == self._materialized_tick:
+            return
+        self._materialized_tick = tick
+        start_xs, start_ys = self.start_x, self.start_y
+        vxs, vys = self.vx, self.vy
+        ticks = self.dispatch_tick
+        for slot in range(len(self.ants)):
+            steps = tick - ticks[slot]
+            self.relocate(
+                slot, start_xs[slot] + vxs[slot] * steps, start_ys[slot] + vys[slot] * steps
+            )
+
+    def relocate(self, slot: int, x: float, y: float) -> None:
+        """Atualiza a posição do slot e, se mudou de célula, o hash espacial."""
+        self.x[slot] = x
+        self.y[slot] = y
+        cell = self.grid.cell_of(x, y)
+        old_cell = (self.cell_x[slot], self.cell_y[slot])
+        if cell != old_cell:
+            self.grid.move(slot, old_cell, cell)
+            self.cell_x[slot] = cell[0]
+            self.cell_y[slot] = cell[1]
+
+    def overlaps_rect(
+        self, left: int, top: int, width: int, height: int, ant_size: Tuple[int, int]
+    ) -> bool:
+        """
+        Indica se algum retângulo de formiga (centrado na posição, com ant_size)
+        colide com o retângulo dado, usando a regra de Rect.colliderect.
+        """
+        ant_w, ant_h = ant_size
+        half_w, half_h = ant_w // 2, ant_h // 2
+        right = left + width
+        bottom = top + height
+        xs, ys = self.x, self.y
+        for slot in self.grid.query_rect(
+            left - ant_w, top - ant_h, right + ant_w, bottom + ant_h
+        ):
+            ant_left = int(xs[slot] - half_w)
+            ant_top = int(ys[slot] - half_h)
+            if (
+                left < ant_left + ant_w
+                and ant_left < right
+                and top < ant_top + ant_h
+                and ant_top < bottom
+            ):
+                return True
+        return False
+
+    def slots_in_rect(
+        self, left: float, top: float, right: float, bottom: float
+    ) -> List[int]:
+        """Slots cuja posição está no retângulo dado, em ordem crescente de slot."""
+        xs, ys = self.x, self.y
+        return sorted(
+            slot
+            for slot in self.grid.query_rect(left, top, right, bottom)
+            if left <= xs[slot] <= right and top <= ys[slot] <= bottom
+        )
+
+    def owner_of(self, slot: int) -> Owner:
+        return OWNER_CODES[self.owner[slot]]
+
+    def position(self, slot: int) -> Tuple[float, float]:
+        return (self.x[slot], self.y[slot])
+
+    def _float_columns(self) -> Tuple["array[float]", ...]:
+        return (
+            self.x,
+            self.y,
+            self.dest_x,
+            self.dest_y,
+            self.vx,
+            self.vy,
+            self.angle,
+            self.start_x,
+            self.start_y,
+        )
+
+    def _int_columns(self) -> Tuple["array[int]", ...]:
+        return (
+            self.owner,
+            self.origin_index,
+            self.dest_index,
+            self.dispatch_tick,
+            self.uid,
+            self.cell_x,
+            self.cell_y,
+        )
+
+    def _columns(self) -> Tuple["array[float] | array[int] | List[Ant]", ...]:
+        return (*self._float_columns(), *self._int_columns(), self.ants)
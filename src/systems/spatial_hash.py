@@ -0,0 +1,71 @@
+"""
+Hash espacial de grade uniforme (broadphase).
+
+Cada item é registrado em exatamente uma célula da grade (a célula do seu
+ponto de referência). Consultas por retângulo visitam apenas as células que o
+retângulo cobre, em vez de todos os itens.
+"""
+
+from typing import AbstractSet, Dict, Generic, Hashable, Iterator, Set, Tuple, TypeVar
+
+Cell = Tuple[int, int]
+
+K = TypeVar("K", bound=Hashable)
+
+
+class SpatialHash(Generic[K]):
+    """Grade uniforme esparsa: célula -> conjunto de chaves (do tipo K)."""
+
+    def __init__(self, cell_size: float) -> None:
+        if cell_size <= 0:
+            raise ValueError(f"cell_size deve ser positivo (recebido {cell_size}).")
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Cell, Set[K]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._cells.values())
+
+    def cell_of(self, x: float, y: float) -> Cell:
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, key: K, cell: Cell) -> None:
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            self._cells[cell] = {key}
+        else:
+            bucket.add(key)
+
+    def remove(self, key: K, cell: Cell) -> None:
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            return
+        bucket.discard(key)
+        if not bucket:
+            del self._cells[cell]
+
+    def move(self, key: K, old_cell: Cell, new_cell: Cell) -> None:
+        if old_cell == new_cell:
+            return
+        self.remove(key, old_cell)
+        self.insert(key, new_cell)
+
+    def clear(self) -> None:
+        self._cells.clear()
+
+    def cell_members(self, cell: Cell) -> AbstractSet[K]:
+        """Chaves registradas na célula (conjunto interno: não modifique)."""
+        bucket = self._cells.get(cell)
+        return bucket if bucket is not None else frozenset()
+
+    def query_rect(
+        self, left: float, top: float, right: float, bottom: float
+    ) -> Iterator[K]:
+        """Itera as chaves registradas nas células que cobrem o retângulo dado."""
+        min_cx, min_cy = self.cell_of(left, top)
+        max_cx, max_cy = self.cell_of(right, bottom)
+        cells = self._cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
@@ -0,0 +1,116 @@
+"""
+Cache de imagens do processo.
+
+load_image lê e decodifica o PNG do disco a cada chamada. O AssetCache
+guarda as superfícies já decodificadas e transformadas, chaveadas por
+(caminho, tamanho, transformação), com descarte LRU por bytes de pixels,
+contadores de acerto/erro e pré-carregamento explícito. As superfícies são
+compartilhadas: quem as recebe não deve desenhar sobre elas.
+"""
+
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Literal, Optional, Set, Tuple, Union
+
+import pygame
+
+from src.utils.asset_loader import load_image
+
+Transform = Literal["none", "scale", "smoothscale"]
+AssetKey = Tuple[str, Optional[Tuple[int, int]], Transform]
+# (caminho, tamanho alvo ou None, transformação)
+AssetRequest = Tuple[Union[str, Path], Optional[Tuple[int, int]], Transform]
+
+
+class AssetCache:
+    """LRU de superfícies decodificadas/escaladas, limitado por bytes."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[AssetKey, pygame.Surface]" = OrderedDict()
+        # Arquivos inexistentes: não voltam a consultar o disco
+        self._missing: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        path: Union[str, Path],
+        size: Optional[Tuple[int, int]] = None,
+        transform: Transform = "scale",
+    ) -> Optional[pygame.Surface]:
+        """Imagem (opcionalmente escalada para `size`), ou None se não carregar."""
+        if size is None:
+            transform = "none"
+        else:
+            size = (int(size[0]), int(size[1]))
+        key: AssetKey = (str(path), size, transform)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return surface
+        self.misses += 1
+
+        if size is None:
+            surface = self._decode(path)
+        else:
+            # A versão original também fica no cache: outro tamanho não relê o disco
+            base = self.get(path)
+            if base is None:
+                return None
+            if transform == "smoothscale":
+                surface = pygame.transform.smoothscale(base, size)
+            else:
+                surface = pygame.transform.scale(base, size)
+        if surface is None:
+            return None
+        self._store(key, surface)
+        return surface
+
+    def preload(self, requests: Iterable[AssetRequest]) -> int:
+        """Carrega antecipadamente; retorna quantas imagens ficaram disponíveis."""
+        loaded = 0
+        for path, size, transform in requests:
+            if self.get(path, size, transform) is not None:
+                loaded += 1
+        return loaded
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._missing.clear()
+        self.bytes_used = 0
+
+    def _decode(self, path: Union[str, Path]) -> Optional[pygame.Surface]:
+        name = str(path)
+        if name in self._missing:
+            return None
+        if not Path(path).exists():
+            self._missing.add(name)
+            logging.getLogger(__name__).error(
+                "IMAGEM NÃO ENCONTRADA: %s", Path(path).absolute()
+            )
+            return None
+        # Falhas de decodificação (ex.: sem modo de vídeo) não são memorizadas
+        return load_image(path)
+
+    def _store(self, key: AssetKey, surface: pygame.Surface) -> None:
+        self._entries[key] = surface
+        self.bytes_used += _size_of(surface)
+        while self.bytes_used > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes_used -= _size_of(evicted)
+
+
+def _size_of(surface: pygame.Surface) -> int:
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+# Cache compartilhado pelo processo
+ASSETS = AssetCache()
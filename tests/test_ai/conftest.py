@@ -0,0 +1,69 @@
+"""Cenas sintéticas e a escolha de alvo de referência, compartilhadas pelos testes de IA."""
+
+import math
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from ai.target_index import NestTargetIndex
+from core.nest_geometry import NestGeometry
+from core.ownership_index import OwnershipIndex
+
+
+
+def _reference_choice(scene, profile, origin_index):
+    """Escolha da versão original: varre tudo e ordena (sort estável)."""
+    candidates = []
+    ox, oy = scene.nest_positions[origin_index]
+    for i, (tx, ty) in enumerate(scene.nest_positions):
+        if i == origin_index or scene.owners[i] == "enemy":
+            continue
+        dist = math.hypot(float(tx) - ox, float(ty) - oy)
+        if profile.aggro_radius and dist > profile.aggro_radius:
+            continue
+        score = 0.0
+        if profile.target_priority == "closest":
+            score = 10000 / (dist + 1)
+        elif profile.target_priority == "weakest":
+            score = 1000 / (scene.colonies[i].ant_count + 1)
+        elif profile.target_priority == "player_focus":
+            score = 2000 if scene.owners[i] == "ally" else 100
+            score += 1000 / (dist + 1)
+        elif profile.target_priority == "random":
+            score = random.random() * 100
+        candidates.append((i, score))
+    if not candidates:
+        return None
+    candidates.sort(key=lambda x: x[1], reverse=True)
+    return candidates[0][0]
+
+
+def _scene(rng, n):
+    # Grade grosseira: muitas distâncias e contagens empatadas
+    positions = [(rng.randrange(0, 20) * 40, rng.randrange(0, 20) * 40) for _ in range(n)]
+    owners = [rng.choice(["ally", "enemy", "empty"]) for _ in range(n)]
+    colonies = [SimpleNamespace(ant_count=rng.randrange(0, 4)) for _ in range(n)]
+    geometry = NestGeometry(positions, speed=4)
+    scene = SimpleNamespace(
+        nest_positions=positions,
+        owners=owners,
+        colonies=colonies,
+        geometry=geometry,
+        target_index=NestTargetIndex(geometry, owners),
+    )
+    scene.ownership = OwnershipIndex(owners, colonies)
+    scene.ownership.subscribe(scene.target_index.on_ownership_change)
+    return scene
+
+
+@pytest.fixture
+def make_scene():
+    """Fábrica de cenas aleatórias: make_scene(rng, n)."""
+    return _scene
+
+
+@pytest.fixture
+def reference_choice():
+    """Escolha original (varredura completa): reference_choice(scene, profile, origin)."""
+    return _reference_choice
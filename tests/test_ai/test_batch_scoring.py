@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from ai.batch_scoring import best_targets
+from ai.enemy_controller import AIProfile, EnemyController
+from core.transfer_queue import TransferQueue
+
+
+@pytest.mark.parametrize("radius", [None, 150.0])
+def test_batch_choice_matches_full_scan(radius, make_scene, reference_choice):
+    rng = random.Random(13)
+    profile = AIProfile(name="t", target_priority="weakest", aggro_radius=radius)
+    for _ in range(10):
+        scene = make_scene(rng, 60)
+        origins = [i for i, owner in enumerate(scene.owners) if owner == "enemy"]
+        counts = [colony.ant_count for colony in scene.colonies]
+        chosen = best_targets("weakest", origins, scene.geometry, scene.owners, counts, radius)
+        assert chosen == {o: reference_choice(scene, profile, o) for o in origins}
+
+
+def test_logic_cycle_prefetches_targets_in_one_batch(monkeypatch, make_scene, reference_choice):
+    scene = make_scene(random.Random(2), 40)
+    scene.pending_transfers = TransferQueue()
+    for colony in scene.colonies:
+        colony.ant_count += 10
+        colony.default_ant_type = None
+    profile = AIProfile(name="t", target_priority="weakest", min_ants_to_attack=10)
+    controller = EnemyController(scene, profile)
+    monkeypatch.setattr(
+        controller, "_rank_targets", lambda o: pytest.fail("pontuação por origem")
+    )
+
+    decisions = controller._execute_logic_cycle()
+
+    assert decisions == len(scene.ownership.nests("enemy"))
+    sent = {t["origin"]: t["dest"] for t in scene.pending_transfers}
+    assert sent == {
+        o: reference_choice(scene, profile, o) for o in scene.ownership.nests("enemy")
+    }
+
+
+def test_other_priorities_are_not_batched(make_scene):
+    scene = make_scene(random.Random(4), 10)
+    with pytest.raises(ValueError):
+        best_targets("closest", [0], scene.geometry, scene.owners, [0] * 10)
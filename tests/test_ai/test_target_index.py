@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from ai.enemy_controller import AIProfile, EnemyController
+from ai.target_index import NestTargetIndex
+from core.nest_geometry import NestGeometry
+
+
+@pytest.mark.parametrize("priority", ["closest", "weakest", "player_focus", "random"])
+@pytest.mark.parametrize("radius", [None, 150.0])
+def test_indexed_choice_matches_full_scan(priority, radius, make_scene, reference_choice):
+    rng = random.Random(7)
+    for _ in range(10):
+        scene = make_scene(rng, 60)
+        profile = AIProfile(name="t", target_priority=priority, aggro_radius=radius)
+        controller = EnemyController(scene, profile)
+        for _ in range(3):
+            for origin in range(len(scene.owners)):
+                random.seed(origin)
+                expected = reference_choice(scene, profile, origin)
+                random.seed(origin)
+                assert controller._select_best_target(origin) == expected
+            # Capturas movem ninhos entre as grades por dono
+            for i in rng.sample(range(60), 10):
+                scene.ownership.set_owner(i, rng.choice(["ally", "enemy", "empty"]))
+
+
+def test_nearest_returns_every_tied_nest():
+    positions = [(100, 100), (140, 100), (60, 100), (100, 300)]
+    owners = ["enemy", "ally", "empty", "ally"]
+    index = NestTargetIndex(NestGeometry(positions, 4), owners, 64)
+    assert index.nearest(0, ("ally", "empty")) == [1, 2]
+    assert index.nearest(0, ("ally",), radius=30) == []
+    assert index.within_radius(0, 250, ("ally",)) == [1, 3]
+
+
+@pytest.mark.parametrize("priority", ["closest", "weakest", "player_focus"])
+def test_cached_choice_is_reused_until_relevant_state_changes(
+    priority, monkeypatch, make_scene, reference_choice
+):
+    rng = random.Random(5)
+    scene = make_scene(rng, 40)
+    profile = AIProfile(name="t", target_priority=priority)
+    controller = EnemyController(scene, profile)
+    calls = []
+    rank = controller._rank_targets
+    monkeypatch.setattr(controller, "_rank_targets", lambda o: calls.append(o) or rank(o))
+
+    origins = range(len(scene.owners))
+    first = [controller._select_best_target(o) for o in origins]
+    assert len(calls) == 40
+    # Estado estável: nenhuma nova pontuação
+    assert [controller._select_best_target(o) for o in origins] == first
+    assert len(calls) == 40
+
+    # Contagem de um candidato só invalida a prioridade "weakest"
+    candidate = next(i for i, owner in enumerate(scene.owners) if owner != "enemy")
+    scene.colonies[candidate].ant_count += 3
+    scene.ownership.units_changed(candidate, 3)
+    for o in origins:
+        assert controller._select_best_target(o) == reference_choice(scene, profile, o)
+    assert len(calls) == (80 if priority == "weakest" else 40)
+
+    # Capturas invalidam todas
+    scene.ownership.set_owner(candidate, "enemy")
+    for o in origins:
+        assert controller._select_best_target(o) == reference_choice(scene, profile, o)
+    assert len(calls) == (120 if priority == "weakest" else 80)
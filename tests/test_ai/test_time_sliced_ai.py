@@ -0,0 +1,73 @@
+import random
+
+import pygame
+
+from config.settings import Settings
+from core.level_config import LevelConfig
+from core.level_scene import LevelScene
+
+
+def _many_enemies_scene(time_sliced):
+    settings = Settings()
+    settings.AI_TIME_SLICING = time_sliced
+    settings.AI_DECISIONS_PER_FRAME = 4
+    n = 120
+    config = LevelConfig(
+        name="many",
+        nest_positions=[(20 + (i % 12) * 64, 20 + (i // 12) * 56) for i in range(n)],
+        initial_counts=[20] * n,
+        initial_owners=["ally" if i % 10 == 0 else "enemy" for i in range(n)],
+    )
+    scene = LevelScene(settings, config)
+    scene.state = "playing"
+    return scene
+
+
+def _run(scene, frames):
+    per_frame = []
+    for _ in range(frames):
+        scene.enemy_ai.update(1 / 60)
+        per_frame.append(scene.enemy_ai.metrics.last_frame_decisions)
+    return per_frame
+
+
+def test_decisions_are_spread_over_frames_with_fair_latency():
+    pygame.init()
+    try:
+        random.seed(3)
+        global_timer = _run(_many_enemies_scene(False), 600)
+        random.seed(3)
+        scene = _many_enemies_scene(True)
+        sliced = _run(scene, 600)
+
+        enemies = len(scene.ownership.nests("enemy"))
+        assert max(global_timer) >= enemies
+        assert max(sliced) <= 4
+        metrics = scene.enemy_ai.metrics
+        assert metrics.decisions == sum(sliced) > enemies
+        # Toda colônia decide e nenhuma espera mais que alguns quadros na fila
+        assert metrics.max_latency < 0.5
+        assert metrics.frames == 600
+    finally:
+        pygame.quit()
+
+
+def test_time_sliced_ai_is_deterministic_and_tracks_captures():
+    pygame.init()
+    try:
+        random.seed(11)
+        first = _many_enemies_scene(True)
+        a = _run(first, 300)
+        random.seed(11)
+        second = _many_enemies_scene(True)
+        assert _run(second, 300) == a
+        assert second.pending_transfers == first.pending_transfers
+
+        ai = second.enemy_ai
+        captured = min(second.ownership.nests("enemy"))
+        second.ownership.set_owner(captured, "ally")
+        assert captured not in ai._scheduled
+        second.ownership.set_owner(captured, "enemy")
+        assert captured in ai._scheduled
+    finally:
+        pygame.quit()
@@ -0,0 +1,92 @@
+from typing import Any, List
+
+from core.app_config import AppConfig
+from core.engine import Engine, MAX_TIME_SCALE, MIN_TIME_SCALE
+from adapters.headless_adapter import HeadlessClock, HeadlessInput
+
+
+class CountingRenderer:
+    def __init__(self) -> None:
+        self.frames = 0
+
+    def render(self, scene: Any) -> None:
+        self.frames += 1
+
+    def quit(self) -> None:
+        pass
+
+
+class StepScene:
+    def __init__(self, max_updates: int) -> None:
+        self.running = True
+        self.max_updates = max_updates
+        self.dts: List[float] = []
+        self.alphas: List[float] = []
+
+    def handle_event(self, event: Any) -> None:
+        pass
+
+    def update(self, dt: float) -> None:
+        self.dts.append(dt)
+        if len(self.dts) >= self.max_updates:
+            self.running = False
+
+    def set_interpolation(self, alpha: float) -> None:
+        self.alphas.append(alpha)
+
+    def render(self, surface: Any) -> None:
+        pass
+
+    @property
+    def result_event(self) -> Any:
+        return None
+
+
+def _run(frame_dt: float, time_scale: float = 1.0, updates: int = 120):
+    config = AppConfig(
+        mode="headless",
+        width=800,
+        height=600,
+        fps=60,
+        log_level="INFO",
+        headless_timeout=60.0,
+        time_scale=time_scale,
+    )
+    renderer = CountingRenderer()
+    engine = Engine(config, HeadlessClock(fixed_dt=frame_dt), HeadlessInput(), renderer)
+    scene = StepScene(updates)
+    engine.set_scene(scene)
+    engine.run()
+    return engine, scene, renderer
+
+
+def test_simulation_steps_are_fixed_regardless_of_frame_rate() -> None:
+    engine_30, slow, slow_renderer = _run(1.0 / 30.0)
+    engine_144, fast, fast_renderer = _run(1.0 / 144.0)
+
+    assert slow.dts == fast.dts == [engine_30.fixed_dt] * 120
+    assert slow_renderer.frames < fast_renderer.frames
+    assert all(0.0 <= a < 1.0 for a in fast.alphas)
+
+
+def test_time_scale_runs_substeps_without_extra_renders() -> None:
+    _, normal, normal_renderer = _run(1.0 / 60.0)
+    _, scaled, scaled_renderer = _run(1.0 / 60.0, time_scale=4.0)
+
+    assert len(normal.dts) == len(scaled.dts)
+    assert scaled_renderer.frames * 3 < normal_renderer.frames
+
+
+def test_time_scale_is_clamped() -> None:
+    engine, _, _ = _run(1.0 / 60.0, updates=1)
+    engine.set_time_scale(100.0)
+    assert engine.time_scale == MAX_TIME_SCALE
+    engine.set_time_scale(0.0)
+    assert engine.time_scale == MIN_TIME_SCALE
+
+
+def test_slow_frames_are_capped_per_frame() -> None:
+    engine, scene, renderer = _run(1.0, updates=40)
+    # um quadro de 1s pediria 60 ticks; o limite evita a espiral de atraso
+    assert len(scene.dts) == 40
+    assert renderer.frames == 8
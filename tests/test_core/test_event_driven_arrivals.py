@@ -0,0 +1,102 @@
+import random
+
+import pygame
+from ai.enemy_controller import AI_AGGRESSIVE
+from config.settings import Settings
+from core.level_config import LevelConfig
+from core.levels_intro import create_intro_config
+from core.level_scene import LevelScene
+
+
+def _event_scene() -> LevelScene:
+    settings = Settings()
+    settings.EVENT_DRIVEN_ARRIVALS = True
+    return LevelScene(settings, create_intro_config(settings))
+
+
+def test_scheduled_ant_arrives_and_captures_nest():
+    pygame.init()
+    try:
+        scene = _event_scene()
+        scene._start_ant_movement(0, 1, "ally")
+        assert len(scene.moving_ants) == 1
+
+        for _ in range(1000):
+            scene._update_ant_movement()
+            if not scene.moving_ants:
+                break
+
+        assert len(scene.moving_ants) == 0
+        assert scene.owners[1] == "ally"
+        assert len(scene.colonies[1].ants) == 1
+    finally:
+        pygame.quit()
+
+
+def test_ant_whose_path_misses_nest_is_resolved_at_closest_approach():
+    pygame.init()
+    try:
+        scene = _event_scene()
+        # faixa vazia: nenhuma posição toca o ninho 1
+        scene._arrival_bounds[1] = (0, 0, 0, 0)
+        scene._start_ant_movement(0, 1, "ally")
+
+        for _ in range(1000):
+            scene._update_ant_movement()
+            if not scene.moving_ants:
+                break
+
+        assert len(scene.moving_ants) == 0
+        assert scene.owners[1] == "ally"
+    finally:
+        pygame.quit()
+
+
+def _busy_match(event_driven, seed, ticks=1500):
+    """Partida 4x4 com IA agressiva e ordens aleatórias do jogador, registrando as chegadas."""
+    settings = Settings()
+    settings.EVENT_DRIVEN_ARRIVALS = event_driven
+    n = 16
+    config = LevelConfig(
+        name="parity",
+        nest_positions=[(90 + (i % 4) * 170, 80 + (i // 4) * 140) for i in range(n)],
+        initial_counts=[25 if i % 3 else 0 for i in range(n)],
+        initial_owners=[("empty", "ally", "enemy")[i % 3] for i in range(n)],
+        ai_profile=AI_AGGRESSIVE,
+    )
+    random.seed(seed)
+    orders = random.Random(seed + 1)
+    scene = LevelScene(settings, config)
+    scene.state = "playing"
+    arrivals = []
+    resolve = scene._resolve_arrival
+
+    def logged(slot):
+        store = scene.moving_ants
+        arrivals.append((scene._movement_tick, store.dest_index[slot], store.owner_of(slot)))
+        resolve(slot)
+
+    scene._resolve_arrival = logged
+    for _ in range(ticks):
+        if orders.random() < 0.05:
+            allies = sorted(scene.ownership.nests("ally"))
+            if allies:
+                scene.pending_transfers.append(
+                    {"origin": orders.choice(allies), "dest": orders.randrange(n), "remaining": 8}
+                )
+        scene.update(1 / 60)
+        if scene.outcome is not None:
+            break
+    outcome = scene.outcome
+    return arrivals, list(scene.owners), outcome and outcome.victory
+
+
+def test_event_driven_mode_matches_polling_on_seeded_matches():
+    pygame.init()
+    try:
+        for seed in range(3):
+            polling = _busy_match(False, seed)
+            assert len(polling[0]) > 100
+            assert _busy_match(True, seed) == polling
+    finally:
+        pygame.quit()
@@ -0,0 +1,29 @@
+import math
+
+from core.nest_geometry import NestGeometry, geometry_for
+
+
+def test_table_matches_direct_computation():
+    positions = [(200, 200), (600, 200), (400, 500), (200, 200)]
+    geometry = NestGeometry(positions, speed=4)
+
+    for i, (ox, oy) in enumerate(positions):
+        for j, (tx, ty) in enumerate(positions):
+            dx, dy = float(tx - ox), float(ty - oy)
+            length = math.hypot(dx, dy)
+            assert geometry.distance(i, j) == length
+            assert geometry.travel_time(i, j) == length / 4
+            if length:
+                assert geometry.direction(i, j) == (dx / length, dy / length)
+                assert geometry.angle(i, j) == math.degrees(math.atan2(dy, dx)) + 90.0
+
+    # Ninhos sobrepostos: direção padrão e sem rotação
+    assert geometry.direction(0, 3) == (1.0, 0.0)
+    assert geometry.angle(0, 3) == 0.0
+
+
+def test_same_layout_reuses_the_table():
+    first = geometry_for([(0, 0), (30, 40)], 4)
+    assert first.distance(0, 1) == 50.0
+    assert geometry_for([(0.0, 0.0), (30.0, 40.0)], 4.0) is first
+    assert geometry_for([(0, 0), (30, 40)], 2) is not first
@@ -0,0 +1,73 @@
+import pygame
+from config.settings import Settings
+from core.levels_intro import create_intro_config
+from core.level_scene import LevelScene
+from core.ownership_index import OwnershipIndex
+from entities.colony import Colony
+
+
+def _colonies(counts):
+    colonies = []
+    for i, count in enumerate(counts):
+        colony = Colony((i * 10, 0))
+        colony.spawn_ants(count)
+        colonies.append(colony)
+    return colonies
+
+
+def test_index_tracks_nests_units_and_version():
+    owners = ["ally", "enemy", "empty"]
+    colonies = _colonies([3, 2, 0])
+    index = OwnershipIndex(owners, colonies)
+    changes = []
+    index.subscribe(changes.append)
+
+    assert index.nests("ally") == {0}
+    assert index.units("ally") == 3
+    assert index.units("enemy") == 2
+
+    version = index.version
+    colonies[1].kill_ant()
+    colonies[1].kill_ant()
+    index.units_changed(1, -2)
+    index.set_owner(1, "empty")
+    index.set_owner(1, "ally")
+    colonies[1].spawn_ant()
+    index.units_changed(1, 1)
+
+    assert owners == ["ally", "ally", "empty"]
+    assert index.nests("ally") == {0, 1}
+    assert index.nests("enemy") == set()
+    assert index.units("ally") == 4
+    assert index.units("enemy") == 0
+    assert index.version > version
+    assert [c.kind for c in changes] == ["units", "owner", "owner", "units"]
+
+
+def test_unsubscribe_stops_notifications():
+    index = OwnershipIndex(["ally"], _colonies([1]))
+    changes = []
+    unsubscribe = index.subscribe(changes.append)
+    unsubscribe()
+    index.units_changed(0, 1)
+    assert changes == []
+
+
+def test_scene_index_matches_full_recount_after_play():
+    pygame.init()
+    try:
+        settings = Settings()
+        scene = LevelScene(settings, create_intro_config(settings))
+        scene.state = "playing"
+        scene._start_ant_movement(0, 1, "ally")
+        for _ in range(300):
+            scene.update(1 / 60)
+
+        for owner in ("ally", "enemy", "empty"):
+            expected = {i for i, o in enumerate(scene.owners) if o == owner}
+            assert scene.ownership.nests(owner) == expected
+            assert scene.ownership.units(owner) == sum(
+                scene.colonies[i].ant_count for i in expected
+            )
+    finally:
+        pygame.quit()
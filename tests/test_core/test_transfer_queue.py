@@ -0,0 +1,27 @@
+from core.transfer_queue import TransferQueue
+
+
+def test_origin_index_follows_every_mutation():
+    queue = TransferQueue([{"origin": 1, "dest": 2, "remaining": 5}])
+    queue.append({"origin": 1, "dest": 3, "remaining": 2})
+    queue.append({"origin": 4, "dest": 2, "remaining": 1})
+    assert queue.count_from(1) == 2
+    assert queue.has_origin(4)
+    assert not queue.has_origin(2)
+
+    # Mesmo padrão da cena: remove a transferência esvaziada
+    queue.remove(queue[0])
+    assert queue.count_from(1) == 1
+    queue.pop()
+    assert not queue.has_origin(4)
+
+    queue += [{"origin": 7, "dest": 1, "remaining": 3}]
+    queue[0] = {"origin": 5, "dest": 1, "remaining": 3}
+    assert not queue.has_origin(1)
+    assert queue.count_from(5) == 1
+    del queue[:]
+    assert not queue.has_origin(5) and not queue.has_origin(7)
+
+    queue.append({"origin": 2, "dest": 0, "remaining": 1})
+    queue.clear()
+    assert queue == [] and not queue.has_origin(2)
@@ -1,5 +1,5 @@
 from entities.ant_types import ALL_ANT_TYPES
-from entities.ant import Ant
+from entities.ant import Ant, AntPool
 
 
 def test_all_ant_types_instantiable():
@@ -15,3 +15,28 @@ def test_all_ant_types_instantiable():
         assert isinstance(a.crit_multiplier, float)
         # special_effect must be a dict or empty
         assert isinstance(a.special_effect, dict)
+
+
+def test_ant_is_slotted_and_reads_stats_from_type():
+    t = ALL_ANT_TYPES[0]
+    a = Ant((0, 0), t)
+    assert not hasattr(a, "__dict__")
+    assert a.speed == float(t.speed)
+    a.speed = 1.0  # ajuste por unidade não altera o tipo compartilhado
+    assert a.speed == 1.0
+    assert Ant((0, 0), t).speed == float(t.speed)
+
+
+def test_pool_recycles_released_instances():
+    pool = AntPool(max_size=1)
+    first = pool.acquire((1, 1), ALL_ANT_TYPES[0])
+    first.speed = 3.0
+    pool.release(first)
+    pool.release(Ant((0, 0)))  # acima do limite: descartada
+
+    again = pool.acquire((5, 6), ALL_ANT_TYPES[1])
+    assert again is first
+    assert again.pos == (5.0, 6.0)
+    assert again.type is ALL_ANT_TYPES[1]
+    assert again.speed == float(ALL_ANT_TYPES[1].speed)
+    assert len(pool) == 0
@@ -1,5 +1,8 @@
-from entities.colony import Colony
-from entities.ant_types import farao
+import pytest
+
+from entities.ant import Ant
+from entities.colony import Colony, CountedColony
+from entities.ant_types import farao, fogo
 
 
 def test_colony_produces_with_existing_ants():
@@ -19,3 +22,44 @@ def test_colony_produces_with_existing_ants():
 
     assert produced >= 1
     assert len(colony.ants) >= 11
+
+
+def test_counted_colony_produces_like_list_colony():
+    counted = CountedColony((0, 0), ant_type=farao)
+    listed = Colony((0, 0), ant_type=farao)
+    counted.add_units(10)
+    listed.add_units(10)
+
+    for _ in range(40):
+        assert counted.update(0.5) == listed.update(0.5)
+
+    assert counted.ant_count == listed.ant_count
+    assert counted.unit_counts() == listed.unit_counts() == {farao: listed.ant_count}
+
+
+def test_counted_colony_materializes_ants_only_when_leaving():
+    colony = CountedColony((3, 4), ant_type=farao)
+    colony.add_units(5)
+    colony.add_ant(Ant((0, 0), fogo))
+    assert colony.unit_counts() == {farao: 5, fogo: 1}
+
+    leaving = colony.remove_ant()
+    assert isinstance(leaving, Ant)
+    assert leaving.type is fogo  # LIFO, como na lista de Colony
+
+    assert [a.type for a in colony.remove_ants(10)] == [farao] * 5
+    assert colony.ant_count == 0
+    assert colony.remove_ant() is None
+    assert colony.kill_ant() is False
+
+
+def test_counted_colony_rejects_per_ant_api():
+    colony = CountedColony((0, 0), ant_type=farao)
+    colony.add_units(3)
+    with pytest.raises(AttributeError):
+        colony.ants
+    with pytest.raises(TypeError):
+        colony.spawn_ant()
+    with pytest.raises(TypeError):
+        colony.spawn_ants(2)
+    assert colony.ant_count == 3
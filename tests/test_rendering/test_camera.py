@@ -0,0 +1,82 @@
+import pygame
+
+from config.settings import Settings
+from core.events import MouseButtonDown
+from core.level_config import LevelConfig
+from core.level_scene import LevelScene
+from rendering.camera import Camera
+from rendering.draw_list import DrawList
+
+
+def test_transforms_round_trip_and_view_stays_in_world():
+    camera = Camera((800, 600), (2000, 2000))
+    assert camera.is_identity
+
+    camera.pan(5000, 5000)
+    assert camera.visible_bounds() == (1200.0, 1400.0, 2000.0, 2000.0)
+
+    camera.zoom_by(1, anchor=(400, 300))
+    assert camera.zoom == 1.5
+    assert camera.screen_to_world(*camera.world_to_screen(1500, 1600)) == (1500, 1600)
+    # O ponto sob o cursor continua sob o cursor
+    assert camera.screen_to_world(400, 300) == (1600.0, 1700.0)
+
+
+def test_world_smaller_than_view_is_centered():
+    camera = Camera((800, 600))
+    camera.zoom_by(-2)
+    assert camera.zoom == 0.5
+    left, top, right, bottom = camera.visible_bounds()
+    assert (left + right) / 2 == 400 and (top + bottom) / 2 == 300
+
+
+def _large_world_scene(settings):
+    config = LevelConfig(
+        name="large",
+        nest_positions=[(100, 100), (1900, 1900), (300, 200)],
+        initial_counts=[10, 10, 0],
+        initial_owners=["ally", "enemy", "empty"],
+        world_size=(2000, 2000),
+    )
+    scene = LevelScene(settings, config)
+    scene.state = "playing"
+    return scene
+
+
+def test_render_culls_what_the_camera_cannot_see():
+    pygame.init()
+    try:
+        settings = Settings()
+        scene = _large_world_scene(settings)
+        assert scene._visible_nests() == [0, 2]
+
+        scene._start_ant_movement(1, 0, "enemy")
+        scene._start_ant_movement(0, 2, "ally")
+        near = scene.moving_ants.slots_in_rect(0, 0, 800, 600)
+        assert list(scene._visible_ant_slots()) == near == [1]
+
+        scene.camera.center_on(1900, 1900)
+        assert scene._visible_nests() == [1]
+        assert list(scene._visible_ant_slots()) == [0]
+
+        draw_list = DrawList()
+        scene.draw(draw_list)
+        assert scene._static_camera_version == scene.camera.version
+    finally:
+        pygame.quit()
+
+
+def test_clicks_are_mapped_through_the_camera():
+    pygame.init()
+    try:
+        scene = _large_world_scene(Settings())
+        scene.camera.center_on(1900, 1900)
+        # Com a vista no canto oposto, o ponto (100, 100) da tela não é o ninho 0
+        scene._handle_mouse_click(MouseButtonDown(pos=(100, 100), button=1))
+        assert scene.selected_nest_indices == set()
+
+        scene.camera.center_on(100, 100)
+        scene._handle_mouse_click(MouseButtonDown(pos=(100, 100), button=1))
+        assert scene.selected_nest_indices == {0}
+    finally:
+        pygame.quit()
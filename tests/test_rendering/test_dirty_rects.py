@@ -0,0 +1,57 @@
+import pygame
+
+from rendering.dirty_rects import DirtyRectTracker
+from rendering.draw_list import DrawLayer, DrawList
+from config.settings import Settings
+from core.levels_intro import create_intro_config
+from core.level_scene import LevelScene
+
+
+def _frame(background, key, ant, pos):
+    draw_list = DrawList()
+    draw_list.set_background(background, key)
+    draw_list.blit(ant, pos, DrawLayer.ANTS)
+    return draw_list
+
+
+def test_unchanged_background_updates_only_old_and_new_regions():
+    background = pygame.Surface((32, 32))
+    background.fill((10, 10, 10))
+    ant = pygame.Surface((4, 4))
+    ant.fill((255, 0, 0))
+    target = pygame.Surface((32, 32))
+    tracker = DirtyRectTracker()
+
+    assert tracker.submit(_frame(background, 1, ant, (0, 0)), target) is None
+
+    rects = tracker.submit(_frame(background, 1, ant, (20, 20)), target)
+    assert rects == [pygame.Rect(0, 0, 4, 4), pygame.Rect(20, 20, 4, 4)]
+    assert target.get_at((1, 1))[:3] == (10, 10, 10)
+    assert target.get_at((21, 21))[:3] == (255, 0, 0)
+
+    # novo conteúdo de fundo: volta ao redesenho completo
+    assert tracker.submit(_frame(background, 2, ant, (20, 20)), target) is None
+
+
+def test_static_layer_is_rebuilt_only_on_ownership_change():
+    pygame.init()
+    try:
+        settings = Settings()
+        scene = LevelScene(settings, create_intro_config(settings))
+        scene.state = "playing"
+        draw_list = DrawList()
+        scene.draw(draw_list)
+        version = draw_list.background_key
+
+        scene.colonies[0].spawn_ant()
+        scene.ownership.units_changed(0, 1)
+        draw_list.clear()
+        scene.draw(draw_list)
+        assert draw_list.background_key == version
+
+        scene.ownership.set_owner(1, "enemy")
+        draw_list.clear()
+        scene.draw(draw_list)
+        assert draw_list.background_key != version
+    finally:
+        pygame.quit()
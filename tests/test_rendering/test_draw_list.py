@@ -0,0 +1,61 @@
+import pygame
+
+from rendering.draw_list import DrawLayer, DrawList
+from adapters.headless_adapter import HeadlessRenderer
+from config.settings import Settings
+from core.levels_intro import create_intro_config
+from core.level_scene import LevelScene
+
+
+def _solid(color):
+    surface = pygame.Surface((4, 4))
+    surface.fill(color)
+    return surface
+
+
+def test_layers_are_composited_in_order():
+    red, blue = _solid((255, 0, 0)), _solid((0, 0, 255))
+    draw_list = DrawList()
+    draw_list.fill((0, 0, 0))
+    draw_list.blit(red, (0, 0), DrawLayer.ANTS)
+    draw_list.blit(blue, (0, 0), DrawLayer.NESTS)
+    draw_list.circle((0, 255, 0), (10, 10), 2, layer=DrawLayer.DECALS)
+
+    target = pygame.Surface((16, 16))
+    draw_list.submit(target)
+
+    assert len(draw_list) == 3
+    assert target.get_at((1, 1))[:3] == (255, 0, 0)
+    assert target.get_at((10, 10))[:3] == (0, 255, 0)
+
+
+def test_checksum_tracks_commands_and_clear_empties_list():
+    sprite = _solid((1, 2, 3))
+    first, second = DrawList(), DrawList()
+    for draw_list in (first, second):
+        draw_list.blit(sprite, (5, 5), DrawLayer.ANTS)
+    assert first.checksum() == second.checksum()
+
+    second.blit(sprite, (6, 5), DrawLayer.ANTS)
+    assert first.checksum() != second.checksum()
+
+    second.clear()
+    assert len(second) == 0
+
+
+def test_headless_renderer_records_scene_draw_list():
+    pygame.init()
+    try:
+        settings = Settings()
+        scene = LevelScene(settings, create_intro_config(settings))
+        scene.state = "playing"
+        renderer = HeadlessRenderer(record=True)
+        renderer.render(scene)
+        # ninhos vão na camada estática; resta um rótulo de contagem por ninho
+        assert renderer.last_command_count >= len(scene.nest_positions)
+        checksum = renderer.last_checksum
+        renderer.render(scene)
+        assert renderer.last_checksum == checksum
+        assert renderer.frames == 2
+    finally:
+        pygame.quit()
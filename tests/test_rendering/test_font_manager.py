@@ -0,0 +1,94 @@
+import json
+import os
+import sys
+
+import pygame
+
+from rendering.font_manager import FontManager, user_cache_dir
+
+
+def test_same_font_is_loaded_once(tmp_path):
+    pygame.init()
+    try:
+        fonts = FontManager(cache_file=tmp_path / "fonts.json")
+        first = fonts.get("arial", 24, bold=True)
+        assert fonts.get("arial", 24, bold=True) is first
+        assert fonts.get("arial", 28) is not first
+        assert fonts.get(None, 32) is fonts.get(None, 32)
+    finally:
+        pygame.quit()
+
+
+# Fonte que acompanha o pygame: existe mesmo sem fontes de sistema
+BUNDLED_FONT = os.path.join(os.path.dirname(pygame.__file__), pygame.font.get_default_font())
+
+
+def _sysfont_with(installed):
+    """SysFont falso: só as famílias dadas existem, todas no arquivo do pygame."""
+
+    def sysfont(name, size, bold=False, italic=False, constructor=None):
+        path = BUNDLED_FONT if name in installed else None
+        return constructor(path, size, bold, italic)
+
+    return sysfont
+
+
+def test_resolved_paths_are_persisted_and_reused(tmp_path, monkeypatch):
+    cache_file = tmp_path / "fonts.json"
+    monkeypatch.setattr(pygame.font, "SysFont", _sysfont_with({"arial"}))
+    pygame.init()
+    try:
+        FontManager(cache_file=cache_file).get("arial", 24, bold=True)
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        assert "arial|1|0" in data
+
+        def no_scan(*args, **kwargs):
+            raise AssertionError("SysFont não deveria ser chamado")
+
+        monkeypatch.setattr(pygame.font, "SysFont", no_scan)
+        font = FontManager(cache_file=cache_file).get("arial", 30, bold=True)
+        assert font.get_bold() == data["arial|1|0"][1]
+    finally:
+        pygame.quit()
+
+
+def test_fonts_are_reloaded_after_pygame_quit(tmp_path):
+    fonts = FontManager(cache_file=tmp_path / "fonts.json")
+    pygame.init()
+    first = fonts.get("arial", 24)
+    pygame.quit()
+    pygame.init()
+    try:
+        second = fonts.get("arial", 24)
+        assert second is not first
+        assert second.render("ok", True, (255, 255, 255)).get_width() > 0
+    finally:
+        pygame.quit()
+
+
+def test_missing_family_is_not_persisted(tmp_path, monkeypatch):
+    cache_file = tmp_path / "fonts.json"
+    monkeypatch.setattr(pygame.font, "SysFont", _sysfont_with({"arial"}))
+    pygame.init()
+    try:
+        fonts = FontManager(cache_file=cache_file)
+        fonts.get("arial", 24)
+        fonts.get("nova", 24)
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        assert "nova|0|0" not in data
+        # Nenhum temporário fica para trás após a troca atômica
+        assert [p.name for p in tmp_path.iterdir()] == ["fonts.json"]
+
+        # Instalada depois: a próxima execução encontra a família
+        monkeypatch.setattr(pygame.font, "SysFont", _sysfont_with({"arial", "nova"}))
+        FontManager(cache_file=cache_file).get("nova", 24)
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        assert data["nova|0|0"][0] == BUNDLED_FONT
+    finally:
+        pygame.quit()
+
+
+def test_default_cache_lives_in_user_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert user_cache_dir() == tmp_path / "bug-wars"
@@ -0,0 +1,51 @@
+import pygame
+
+from config.settings import Settings
+from core.levels_intro import create_intro_config
+from core.level_scene import LevelScene
+from rendering.draw_list import DrawLayer, DrawList
+from rendering.lod import build_convoys, lod_active
+from systems.moving_ants import MovingAntStore
+
+
+def _stream(store, count, origin, dest, owner, start=(0.0, 0.0), step=4.0):
+    for i in range(count):
+        x = start[0] + i * step
+        store.append((x, start[1]), (1000.0, start[1]), (2.0, 0.0), 90.0, owner, origin, dest, None)
+
+
+def test_dense_streams_become_convoys_and_sparse_ones_stay_single():
+    store = MovingAntStore()
+    _stream(store, 40, 0, 1, "ally")  # x de 0 a 156
+    _stream(store, 3, 2, 1, "enemy", start=(0.0, 300.0))
+
+    convoys, singles = build_convoys(store, range(len(store)), spacing=48, min_stream=6)
+
+    assert singles == [40, 41, 42]
+    assert sum(c.count for c in convoys) == 40
+    assert len(convoys) == 4  # 160 px de fluxo em trechos de 48 px
+    assert all(store.origin_index[c.sample_slot] == 0 for c in convoys)
+
+
+def test_lod_depends_on_density_and_zoom():
+    assert not lod_active(100, (800, 600), 1.0, density_threshold=6.0, max_zoom=1.0)
+    assert lod_active(400, (800, 600), 1.0, density_threshold=6.0, max_zoom=1.0)
+    assert not lod_active(400, (800, 600), 1.5, density_threshold=6.0, max_zoom=1.0)
+
+
+def test_draw_cost_is_bounded_by_stream_length_not_unit_count():
+    pygame.init()
+    try:
+        settings = Settings()
+        scene = LevelScene(settings, create_intro_config(settings))
+        scene.state = "playing"
+        _stream(scene.moving_ants, 5000, 0, 1, "ally", start=(50.0, 300.0), step=0.1)
+
+        draw_list = DrawList()
+        scene.draw(draw_list)
+
+        assert len(draw_list) < 100
+        assert DrawLayer.CONVOYS in draw_list._layers()
+        assert DrawLayer.ANTS not in draw_list._layers()
+    finally:
+        pygame.quit()
@@ -0,0 +1,48 @@
+import pygame
+
+from rendering.rotation_cache import RotatedSpriteCache
+
+
+def _frame():
+    surface = pygame.Surface((10, 20), pygame.SRCALPHA, 32)
+    surface.fill((255, 0, 0, 255))
+    return surface
+
+
+def test_same_bucket_reuses_rotated_surface():
+    cache = RotatedSpriteCache(buckets=72)
+    frame = _frame()
+    first = cache.get("Farao", 0, frame, 90.0)
+    second = cache.get("Farao", 0, frame, 91.0)  # mesmo bucket de 5 graus
+    assert first is second
+    assert (cache.hits, cache.misses) == (1, 1)
+    # 90 graus troca largura e altura
+    assert first.get_size() == (20, 10)
+
+
+def test_frames_and_types_have_separate_entries():
+    cache = RotatedSpriteCache(buckets=8)
+    frame = _frame()
+    cache.get("Farao", 0, frame, 0.0)
+    cache.get("Farao", 1, frame, 0.0)
+    cache.get("Fogo", 0, frame, 0.0)
+    cache.get("Fogo", 0, frame, 360.0)
+    assert len(cache) == 3
+
+
+def test_memory_cap_evicts_least_recently_used():
+    frame = _frame()
+    entry_bytes = 10 * 20 * 4
+    cache = RotatedSpriteCache(buckets=4, max_bytes=entry_bytes * 2)
+    cache.get("a", 0, frame, 0.0)
+    cache.get("b", 0, frame, 0.0)
+    cache.get("a", 0, frame, 0.0)  # "a" passa a ser o mais recente
+    cache.get("c", 0, frame, 0.0)
+
+    assert len(cache) == 2
+    assert cache.bytes_used <= entry_bytes * 2
+    misses = cache.misses
+    cache.get("a", 0, frame, 0.0)
+    assert cache.misses == misses
+    cache.get("b", 0, frame, 0.0)
+    assert cache.misses == misses + 1
@@ -0,0 +1,53 @@
+import pygame
+
+from config.settings import Settings
+from rendering.sprite_atlas import SpriteAtlas, build_atlas, pack_shelves, write_index
+from rendering.sprite_renderer import SpriteRenderer
+
+
+def test_shelf_packing_has_no_overlaps():
+    sizes = {f"s{i}": (10 + i * 7, 5 + (i % 3) * 9) for i in range(12)}
+    rects, (width, height) = pack_shelves(sizes, max_width=64)
+    boxes = [pygame.Rect(rect) for rect in rects.values()]
+    for i, box in enumerate(boxes):
+        assert box.right <= max(width, 64) and box.bottom <= height
+        assert box.collidelist(boxes[i + 1:]) == -1
+
+
+def test_atlas_copies_pixels_exactly_and_round_trips(tmp_path):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    try:
+        a = pygame.Surface((4, 3), pygame.SRCALPHA)
+        a.fill((200, 100, 50, 128))
+        b = pygame.Surface((2, 5), pygame.SRCALPHA)
+        b.fill((1, 2, 3, 255))
+        atlas_img, rects = build_atlas({"ants/a": a, "ants/b": b})
+
+        pygame.image.save(atlas_img, str(tmp_path / "atlas.png"))
+        write_index(tmp_path / "atlas.json", "atlas.png", rects, (4, 3), (2, 5))
+        atlas = SpriteAtlas.load(tmp_path / "atlas.json", (4, 3), (2, 5))
+
+        assert atlas.get("ants/a").get_at((1, 1)) == pygame.Color(200, 100, 50, 128)
+        assert atlas.get("ants/b").get_size() == (2, 5)
+        assert atlas.get("ants/a") is atlas.get("ants/a")
+        assert atlas.get("missing") is None
+        # Atlas gerado para outros tamanhos é ignorado
+        assert SpriteAtlas.load(tmp_path / "atlas.json", (8, 8), (2, 5)) is None
+    finally:
+        pygame.quit()
+
+
+def test_renderer_hands_out_atlas_subsurfaces():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    try:
+        settings = Settings()
+        renderer = SpriteRenderer(settings)
+        assert renderer.atlas is not None
+        assert renderer.nest_img_ally.get_parent() is renderer.atlas.image
+        assert renderer.nest_img_ally.get_size() == settings.NEST_SIZE
+        assert renderer.ant_sprites[("Farao", 0)].get_size() == settings.ANT_SIZE
+        assert SpriteRenderer.asset_requests(settings) == []
+    finally:
+        pygame.quit()
@@ -0,0 +1,49 @@
+import pygame
+
+from rendering.text_cache import TextCache
+
+
+def test_render_reuses_surface_for_same_key():
+    pygame.font.init()
+    try:
+        font = pygame.font.Font(None, 24)
+        cache = TextCache()
+        first = cache.render(font, "JOGAR", (255, 255, 255))
+        assert cache.render(font, "JOGAR", (255, 255, 255)) is first
+        assert cache.render(font, "JOGAR", (255, 0, 0)) is not first
+        assert (cache.hits, cache.misses) == (1, 2)
+    finally:
+        pygame.font.quit()
+
+
+def test_lru_bound_evicts_oldest_entry():
+    pygame.font.init()
+    try:
+        font = pygame.font.Font(None, 24)
+        cache = TextCache(max_entries=2)
+        a = cache.render(font, "a", (255, 255, 255))
+        cache.render(font, "b", (255, 255, 255))
+        cache.render(font, "c", (255, 255, 255))
+        assert len(cache) == 2
+        assert cache.render(font, "a", (255, 255, 255)) is not a
+    finally:
+        pygame.font.quit()
+
+
+def test_numbers_are_composed_from_digit_glyphs():
+    pygame.font.init()
+    try:
+        font = pygame.font.Font(None, 24)
+        cache = TextCache()
+        parts = list(cache.number_glyphs(font, 1204, (255, 255, 255)))
+        assert len(parts) == 4
+        # o mesmo dígito reaproveita o mesmo glifo
+        again = list(cache.number_glyphs(font, 41, (255, 255, 255)))
+        assert again[1][0] is parts[0][0]
+        assert [x for _, x in parts] == sorted(x for _, x in parts)
+
+        surface = cache.render_number(font, 1204, (255, 255, 255))
+        assert surface.get_width() == cache.number_width(font, 1204, (255, 255, 255))
+        assert cache.render_number(font, 1204, (255, 255, 255)) is surface
+    finally:
+        pygame.font.quit()
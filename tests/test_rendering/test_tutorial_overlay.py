@@ -0,0 +1,39 @@
+import pygame
+
+from config.settings import Settings
+from core.levels_intro import create_intro2_config
+from core.level_scene import LevelScene
+from rendering.ui_helper import layout_rich_text_line
+
+
+def test_rich_text_layout_is_cached_by_content():
+    pygame.init()
+    try:
+        font = pygame.font.Font(None, 24)
+        line = ["Clique em ", ("um ninho", (0, 255, 0)), " aliado"]
+        layout = layout_rich_text_line(line, font)
+        assert layout_rich_text_line(list(line), font) is layout
+        assert len(layout.parts) == 3
+        assert [x for _, x in layout.parts] == sorted(x for _, x in layout.parts)
+    finally:
+        pygame.quit()
+
+
+def test_tutorial_overlay_is_composited_once_per_size():
+    pygame.init()
+    try:
+        settings = Settings()
+        scene = LevelScene(settings, create_intro2_config(settings))
+        assert scene.state == "tutorial"
+
+        screen = pygame.Surface((settings.WIDTH, settings.HEIGHT))
+        scene.render(screen)
+        overlay = scene._tutorial_overlay
+        scene.render(screen)
+        assert scene._tutorial_overlay is overlay
+
+        scene.render(pygame.Surface((640, 480)))
+        assert scene._tutorial_overlay is not overlay
+        assert scene._tutorial_overlay.get_size() == (640, 480)
+    finally:
+        pygame.quit()
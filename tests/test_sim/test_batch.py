@@ -0,0 +1,71 @@
+from sim.batch import BatchAggregator, iter_matches
+from sim.runner import MatchSummary
+
+
+def _summary(seed, victory, stars, score, ticks):
+    return MatchSummary(
+        level="intro",
+        seed=seed,
+        finished=True,
+        victory=victory,
+        ticks=ticks,
+        sim_time=ticks / 60.0,
+        score=score,
+        stars=stars,
+        ally_nests=0,
+        enemy_nests=0,
+        wall_time=0.0,
+    )
+
+
+def test_aggregator_computes_rates_and_distributions():
+    aggregator = BatchAggregator("intro")
+    aggregator.extend(
+        [
+            _summary(0, True, 3, 100, 600),
+            _summary(1, True, 1, 50, 1200),
+            _summary(2, False, 0, 0, 300),
+            _summary(3, True, 3, 70, 900),
+        ]
+    )
+    stats = aggregator.result()
+
+    assert stats.matches == 4
+    assert stats.wins == 3
+    assert stats.win_rate == 0.75
+    assert stats.stars == {0: 1, 1: 1, 2: 0, 3: 2}
+    assert (stats.score_min, stats.score_median, stats.score_max) == (0, 60.0, 100)
+    assert stats.total_ticks == 3000
+
+
+def _by_seed(summaries):
+    out = {}
+    for summary in summaries:
+        data = summary.to_dict()
+        data.pop("wall_time")
+        out[summary.seed] = data
+    return out
+
+
+def test_pool_results_match_in_process_results():
+    seeds = range(4)
+    local = _by_seed(iter_matches("intro3", seeds, workers=1, max_ticks=2000))
+    pooled = _by_seed(
+        iter_matches("intro3", seeds, workers=2, chunk_size=1, max_ticks=2000)
+    )
+    assert pooled == local
+
+
+def test_pool_workers_receive_overrides():
+    seeds = range(2)
+    overrides = {"EVENT_DRIVEN_ARRIVALS": True, "COUNTED_COLONIES": True}
+    local = _by_seed(
+        iter_matches("intro3", seeds, workers=1, max_ticks=2000, overrides=overrides)
+    )
+    pooled = _by_seed(
+        iter_matches(
+            "intro3", seeds, workers=2, chunk_size=1, max_ticks=2000,
+            overrides=overrides,
+        )
+    )
+    assert pooled == local
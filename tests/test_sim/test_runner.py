@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from config.settings import Settings
+from sim.runner import apply_overrides, run_match
+from sim.__main__ import main, parse_override
+
+
+def test_same_seed_gives_same_summary():
+    first = run_match("intro3", seed=3, max_ticks=3000).to_dict()
+    second = run_match("intro3", seed=3, max_ticks=3000).to_dict()
+    first.pop("wall_time")
+    second.pop("wall_time")
+    assert first == second
+
+
+def test_stops_at_max_ticks_when_undecided():
+    summary = run_match("level_1_invasion", seed=0, max_ticks=10)
+    assert summary.ticks == 10
+    assert not summary.finished
+    assert summary.stars == 0
+
+
+def test_unknown_level_is_rejected():
+    with pytest.raises(ValueError):
+        run_match("nope", seed=0)
+
+
+def test_cli_prints_json_summary(capsys):
+    assert main(["run", "--level", "intro", "--seed", "1", "--max-ticks", "5"]) == 0
+    data = json.loads(capsys.readouterr().out)
+    assert data["level"] == "intro"
+    assert data["ticks"] == 5
+
+
+def test_overrides_turn_on_optional_modes():
+    baseline = run_match("intro3", seed=3, max_ticks=3000).to_dict()
+    tuned = run_match(
+        "intro3",
+        seed=3,
+        max_ticks=3000,
+        overrides={"EVENT_DRIVEN_ARRIVALS": True, "COUNTED_COLONIES": True},
+    ).to_dict()
+    baseline.pop("wall_time")
+    tuned.pop("wall_time")
+    assert tuned == baseline
+
+
+def test_overrides_apply_to_the_given_settings():
+    settings = Settings()
+    apply_overrides(settings, {"EVENT_DRIVEN_ARRIVALS": True, "SPEED": 6})
+    assert settings.EVENT_DRIVEN_ARRIVALS is True
+    assert settings.SPEED == 6
+    assert Settings.SPEED == 4
+
+
+def test_unknown_override_is_rejected():
+    with pytest.raises(ValueError):
+        run_match("intro", seed=0, max_ticks=5, overrides={"EVENT_DRIVEN": True})
+
+
+def test_parse_override_reads_json_values():
+    assert parse_override("EVENT_DRIVEN_ARRIVALS=true") == ("EVENT_DRIVEN_ARRIVALS", True)
+    assert parse_override("AI_FRAME_BUDGET_MS=2.5") == ("AI_FRAME_BUDGET_MS", 2.5)
+    assert parse_override("ANT_SIZE=[32, 32]") == ("ANT_SIZE", (32, 32))
+    assert parse_override("WINDOW_TITLE=Bugs") == ("WINDOW_TITLE", "Bugs")
+
+
+def test_cli_rejects_unknown_setting(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["run", "--level", "intro", "--max-ticks", "5", "--set", "NOPE=1"])
+    assert excinfo.value.code == 2
+    assert "NOPE" in capsys.readouterr().err
+
+
+def test_cli_passes_overrides_to_the_match(capsys):
+    argv = ["run", "--level", "intro", "--seed", "1", "--max-ticks", "5"]
+    assert main(argv + ["--set", "COUNTED_COLONIES=true"]) == 0
+    data = json.loads(capsys.readouterr().out)
+    assert data["ticks"] == 5
@@ -0,0 +1,41 @@
+from entities.ant import Ant
+from systems.arrival_scheduler import ArrivalScheduler
+from systems.movement import build_arrival_bounds, step_moving_ants, ticks_until_arrival
+from systems.moving_ants import MovingAntStore
+
+
+def test_pop_due_returns_arrivals_in_tick_then_dispatch_order():
+    scheduler = ArrivalScheduler()
+    scheduler.schedule(5, uid=10)
+    scheduler.schedule(3, uid=11)
+    scheduler.schedule(3, uid=12)
+
+    assert scheduler.pop_due(2) == []
+    assert scheduler.pop_due(3) == [11, 12]
+    assert scheduler.next_tick() == 5
+    assert scheduler.pop_due(100) == [10]
+    assert len(scheduler) == 0
+
+
+def test_ticks_until_arrival_matches_per_frame_kernel():
+    ant_size = (48, 48)
+    bounds = build_arrival_bounds([(568, 268, 64, 64)], ant_size)
+    start = (200.0, 250.0)
+    # direção normalizada rumo ao centro do ninho (600, 300), velocidade 4
+    length = (400.0**2 + 50.0**2) ** 0.5
+    velocity = (400.0 / length * 4.0, 50.0 / length * 4.0)
+
+    predicted = ticks_until_arrival(start, velocity, bounds[0], ant_size)
+
+    store = MovingAntStore()
+    store.append(start, (600.0, 300.0), velocity, 0.0, "ally", 1, 0, Ant((0, 0)))
+    steps = 0
+    while not step_moving_ants(store, bounds, ant_size, steps) and steps < 1000:
+        steps += 1
+    assert predicted == steps
+
+
+def test_ticks_until_arrival_none_when_path_misses_nest():
+    ant_size = (10, 10)
+    bounds = build_arrival_bounds([(100, 100, 10, 10)], ant_size)
+    assert ticks_until_arrival((0.0, 0.0), (1.0, 0.0), bounds[0], ant_size) is None
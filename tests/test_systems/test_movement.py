@@ -1,4 +1,5 @@
-from systems.movement import MovementSystem
+from systems.movement import MovementSystem, build_arrival_bounds, step_moving_ants
+from systems.moving_ants import MovingAntStore
 from entities.ant import Ant
 
 
@@ -9,3 +10,20 @@ def test_ant_moves_forward():
     MovementSystem().update_ant(ant, 1.0)
     assert ant.pos[0] == 10
     assert ant.pos[1] == 0
+
+
+def test_step_moving_ants_advances_and_groups_arrivals():
+    ant_size = (10, 10)
+    bounds = build_arrival_bounds([(100, 0, 20, 20), (0, 100, 20, 20)], ant_size)
+    store = MovingAntStore()
+    # slot 0: longe do ninho 0; slot 1: já tocando o ninho 0; slot 2: tocando o ninho 1
+    store.append((0.0, 10.0), (110.0, 10.0), (4.0, 0.0), 90.0, "ally", 1, 0, Ant((0, 0)))
+    store.append((96.0, 10.0), (110.0, 10.0), (4.0, 0.0), 90.0, "ally", 1, 0, Ant((0, 0)))
+    store.append((10.0, 96.0), (10.0, 110.0), (0.0, 4.0), 180.0, "enemy", 0, 1, Ant((0, 0)))
+
+    arrivals = step_moving_ants(store, bounds, ant_size, 0)
+
+    assert arrivals == {0: [1], 1: [2]}
+    assert store.position(0) == (4.0, 10.0)
+    # formigas que chegaram não se movem
+    assert store.position(1) == (96.0, 10.0)
@@ -0,0 +1,65 @@
+from systems.moving_ants import MovingAntStore
+from entities.ant import Ant
+
+
+def _add(store: MovingAntStore, x: float, dest_index: int) -> int:
+    return store.append(
+        pos=(x, 0.0),
+        dest=(100.0, 0.0),
+        velocity=(4.0, 0.0),
+        angle=90.0,
+        owner="ally",
+        origin_index=0,
+        dest_index=dest_index,
+        ant=Ant((0, 0)),
+    )
+
+
+def test_append_fills_all_columns():
+    store = MovingAntStore()
+    slot = _add(store, 5.0, 2)
+    assert slot == 0
+    assert len(store) == 1
+    assert store.position(0) == (5.0, 0.0)
+    assert store.owner_of(0) == "ally"
+    assert store.dest_index[0] == 2
+
+
+def test_remove_swaps_last_slot_into_place():
+    store = MovingAntStore()
+    for i in range(3):
+        _add(store, float(i), i)
+    last_ant = store.ants[2]
+
+    store.remove(0)
+
+    assert len(store) == 2
+    assert store.x[0] == 2.0
+    assert store.dest_index[0] == 2
+    assert store.ants[0] is last_ant
+
+
+def test_remove_many_keeps_remaining_slots():
+    store = MovingAntStore()
+    for i in range(5):
+        _add(store, float(i), i)
+
+    store.remove_many([1, 3])
+
+    assert sorted(store.dest_index) == [0, 2, 4]
+    assert len(store.x) == len(store.ants) == 3
+
+
+def test_overlaps_rect_tracks_slots_after_swap_remove():
+    store = MovingAntStore(cell_size=10)
+    _add(store, 0.0, 0)
+    _add(store, 200.0, 1)
+
+    store.remove(0)  # slot 1 (x=200) passa a ocupar o slot 0
+
+    assert not store.overlaps_rect(-5, -5, 10, 10, (10, 10))
+    assert store.overlaps_rect(195, -5, 10, 10, (10, 10))
+
+    store.relocate(0, 50.0, 0.0)
+    assert store.overlaps_rect(45, -5, 10, 10, (10, 10))
+    assert not store.overlaps_rect(195, -5, 10, 10, (10, 10))
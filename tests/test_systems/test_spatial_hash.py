@@ -0,0 +1,22 @@
+from systems.spatial_hash import SpatialHash
+
+
+def test_query_rect_only_visits_covered_cells():
+    grid = SpatialHash(10)
+    grid.insert("a", grid.cell_of(5, 5))
+    grid.insert("b", grid.cell_of(95, 95))
+
+    assert set(grid.query_rect(0, 0, 20, 20)) == {"a"}
+    assert set(grid.query_rect(0, 0, 100, 100)) == {"a", "b"}
+
+
+def test_move_and_remove_keep_grid_consistent():
+    grid = SpatialHash(10)
+    grid.insert(1, (0, 0))
+    grid.move(1, (0, 0), (3, 3))
+
+    assert list(grid.query_rect(0, 0, 9, 9)) == []
+    assert list(grid.query_rect(30, 30, 39, 39)) == [1]
+
+    grid.remove(1, (3, 3))
+    assert len(grid) == 0
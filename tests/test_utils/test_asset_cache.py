@@ -0,0 +1,73 @@
+import pygame
+
+import utils.asset_cache as asset_cache
+from utils.asset_cache import AssetCache
+
+
+def _write_png(path, size=(8, 4)):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill((10, 20, 30, 255))
+    pygame.image.save(surface, str(path))
+    return path
+
+
+def _counting_loader(monkeypatch):
+    calls = []
+    original = asset_cache.load_image
+
+    def load(path):
+        calls.append(str(path))
+        return original(path)
+
+    monkeypatch.setattr(asset_cache, "load_image", load)
+    return calls
+
+
+def test_each_image_is_decoded_once(tmp_path, monkeypatch):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    try:
+        path = _write_png(tmp_path / "ant.png")
+        calls = _counting_loader(monkeypatch)
+        cache = AssetCache()
+
+        small = cache.get(path, (4, 2))
+        assert small.get_size() == (4, 2)
+        assert cache.get(path, (4, 2)) is small
+        assert cache.get(path, (4, 2), "smoothscale") is not small
+        assert cache.get(path).get_size() == (8, 4)
+        assert calls == [str(path)]
+        assert cache.hits == 3
+    finally:
+        pygame.quit()
+
+
+def test_missing_files_are_not_retried(tmp_path, monkeypatch):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    try:
+        calls = _counting_loader(monkeypatch)
+        cache = AssetCache()
+        missing = tmp_path / "nope.png"
+        assert cache.get(missing, (4, 4)) is None
+        assert cache.get(missing, (4, 4)) is None
+        # Arquivo inexistente: nem o loader é chamado
+        assert calls == []
+    finally:
+        pygame.quit()
+
+
+def test_eviction_respects_byte_budget(tmp_path):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    try:
+        path = _write_png(tmp_path / "nest.png", (16, 16))
+        cache = AssetCache(max_bytes=16 * 16 * 4 + 8 * 8 * 4)
+        assert cache.preload([(path, None, "none"), (path, (8, 8), "scale")]) == 2
+        assert len(cache) == 2
+
+        cache.get(path, (12, 12))
+        assert cache.bytes_used <= cache.max_bytes
+        assert (str(path), None, "none") not in cache._entries
+    finally:
+        pygame.quit()